@@ -6,7 +6,7 @@ from alembic import context
 import asyncio
 from app.config import settings
 from app.database import Base
-from app.models import User, Asset, Transaction
+from app.models import User, Asset, Transaction, Category, FamilyGroup, FamilyMember, MonthlyRollup, AssetSnapshot, DataVersion
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -0,0 +1,138 @@
+"""add categories and family tables
+
+Revision ID: 7c4e1a9d3f21
+Revises: 2b000e0f6379
+Create Date: 2026-10-18 10:00:00.000000
+
+sql/migration_add_categories.sql, sql/create_family_tables.sql와 같은 스키마를 만듭니다.
+SQL 스크립트로 이미 적용한 DB(setup_alembic_version.sql로 2b000e0f6379 등록)에서도
+실행할 수 있도록 이미 있는 테이블/컬럼은 건너뜁니다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '7c4e1a9d3f21'
+down_revision: Union[str, None] = '2b000e0f6379'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+transaction_type = postgresql.ENUM('INCOME', 'EXPENSE', name='transactiontype', create_type=False)
+family_role = postgresql.ENUM('ADMIN', 'MEMBER', name='familyrole', create_type=False)
+
+DEFAULT_CATEGORIES = [
+    ('INCOME', '월급', 1),
+    ('INCOME', '상여', 2),
+    ('INCOME', '배당금', 3),
+    ('EXPENSE', '외식', 1),
+    ('EXPENSE', '간식', 2),
+    ('EXPENSE', '장보기', 3),
+    ('EXPENSE', '쇼핑', 4),
+    ('EXPENSE', '여행', 5),
+    ('EXPENSE', '교육비', 6),
+    ('EXPENSE', '의료비', 7),
+    ('EXPENSE', '구독료', 8),
+]
+
+
+def _has_table(name: str) -> bool:
+    return sa.inspect(op.get_bind()).has_table(name)
+
+
+def _has_column(table: str, column: str) -> bool:
+    return any(c['name'] == column for c in sa.inspect(op.get_bind()).get_columns(table))
+
+
+def upgrade() -> None:
+    # categories 테이블 + 기본 카테고리
+    if not _has_table('categories'):
+        categories = op.create_table(
+            'categories',
+            sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('gen_random_uuid()'), nullable=False),
+            sa.Column('type', transaction_type, nullable=False),
+            sa.Column('name', sa.String(), nullable=False),
+            sa.Column('display_order', sa.Integer(), server_default=sa.text('0'), nullable=False),
+            sa.PrimaryKeyConstraint('id'),
+            sa.UniqueConstraint('type', 'name'),
+        )
+        op.create_index('ix_categories_type', 'categories', ['type'], unique=False)
+        op.create_index('ix_categories_display_order', 'categories', ['type', 'display_order'], unique=False)
+        op.bulk_insert(
+            categories,
+            [{'type': t, 'name': n, 'display_order': o} for t, n, o in DEFAULT_CATEGORIES],
+        )
+
+    # transactions.category (문자열) → category_id
+    if not _has_column('transactions', 'category_id'):
+        op.add_column('transactions', sa.Column('category_id', postgresql.UUID(as_uuid=True), nullable=True))
+        op.create_foreign_key(
+            'fk_transactions_category_id', 'transactions', 'categories', ['category_id'], ['id']
+        )
+        op.create_index('ix_transactions_category_id', 'transactions', ['category_id'], unique=False)
+        if _has_column('transactions', 'category'):
+            # 같은 이름의 기본 카테고리가 있는 기존 거래는 자동으로 매핑
+            op.execute(
+                """
+                UPDATE transactions t
+                SET category_id = c.id
+                FROM categories c
+                WHERE c.name = t.category AND c.type = t.type AND t.category_id IS NULL
+                """
+            )
+    if _has_column('transactions', 'category'):
+        op.alter_column('transactions', 'category', existing_type=sa.String(), nullable=True)
+
+    # 가족 그룹 테이블
+    family_role.create(op.get_bind(), checkfirst=True)
+
+    if not _has_table('family_groups'):
+        op.create_table(
+            'family_groups',
+            sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('gen_random_uuid()'), nullable=False),
+            sa.Column('name', sa.String(length=100), nullable=False),
+            sa.Column('admin_user_id', sa.String(length=255), nullable=False),
+            sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+            sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+            sa.ForeignKeyConstraint(
+                ['admin_user_id'], ['users.user_id'],
+                name='fk_family_groups_admin_user', ondelete='CASCADE',
+            ),
+            sa.PrimaryKeyConstraint('id'),
+        )
+
+    if not _has_table('family_members'):
+        op.create_table(
+            'family_members',
+            sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('gen_random_uuid()'), nullable=False),
+            sa.Column('family_group_id', postgresql.UUID(as_uuid=True), nullable=False),
+            sa.Column('user_id', sa.String(length=255), nullable=False),
+            sa.Column('role', family_role, server_default='MEMBER', nullable=False),
+            sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+            sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+            sa.ForeignKeyConstraint(
+                ['family_group_id'], ['family_groups.id'],
+                name='fk_family_members_group', ondelete='CASCADE',
+            ),
+            sa.ForeignKeyConstraint(
+                ['user_id'], ['users.user_id'],
+                name='fk_family_members_user', ondelete='CASCADE',
+            ),
+            sa.PrimaryKeyConstraint('id'),
+            sa.UniqueConstraint('family_group_id', 'user_id', name='unique_family_member'),
+        )
+    # family_groups / family_members 조회 인덱스는 c8d2f5b7e914에서 CONCURRENTLY로 생성
+
+
+def downgrade() -> None:
+    op.drop_table('family_members')
+    op.drop_table('family_groups')
+    family_role.drop(op.get_bind(), checkfirst=True)
+    op.drop_index('ix_transactions_category_id', table_name='transactions')
+    op.drop_constraint('fk_transactions_category_id', 'transactions', type_='foreignkey')
+    op.drop_column('transactions', 'category_id')
+    op.drop_index('ix_categories_display_order', table_name='categories')
+    op.drop_index('ix_categories_type', table_name='categories')
+    op.drop_table('categories')
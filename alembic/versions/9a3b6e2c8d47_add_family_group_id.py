@@ -0,0 +1,52 @@
+"""add family_group_id to assets and transactions
+
+Revision ID: 9a3b6e2c8d47
+Revises: 7c4e1a9d3f21
+Create Date: 2026-10-18 10:05:00.000000
+
+sql/migration_add_family_group_id.sql과 같은 변경입니다 (인덱스는 c8d2f5b7e914에서 생성).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '9a3b6e2c8d47'
+down_revision: Union[str, None] = '7c4e1a9d3f21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LEDGER_TABLES = ('assets', 'transactions')
+
+
+def _has_column(table: str, column: str) -> bool:
+    return any(c['name'] == column for c in sa.inspect(op.get_bind()).get_columns(table))
+
+
+def upgrade() -> None:
+    for table in LEDGER_TABLES:
+        if _has_column(table, 'family_group_id'):
+            continue
+        op.add_column(table, sa.Column('family_group_id', postgresql.UUID(as_uuid=True), nullable=True))
+        op.create_foreign_key(
+            f'fk_{table}_family_group_id', table, 'family_groups',
+            ['family_group_id'], ['id'], ondelete='SET NULL',
+        )
+        # 기존 데이터 채우기 (관리하는 그룹 우선, 없으면 구성원으로 속한 그룹)
+        op.execute(
+            f"""
+            UPDATE {table} t
+            SET family_group_id = COALESCE(
+                (SELECT g.id FROM family_groups g WHERE g.admin_user_id = t.user_id LIMIT 1),
+                (SELECT m.family_group_id FROM family_members m WHERE m.user_id = t.user_id LIMIT 1)
+            )
+            """
+        )
+
+
+def downgrade() -> None:
+    for table in reversed(LEDGER_TABLES):
+        op.drop_constraint(f'fk_{table}_family_group_id', table, type_='foreignkey')
+        op.drop_column(table, 'family_group_id')
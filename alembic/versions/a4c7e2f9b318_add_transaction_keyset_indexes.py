@@ -0,0 +1,70 @@
+"""add transaction keyset pagination indexes (CREATE INDEX CONCURRENTLY)
+
+Revision ID: a4c7e2f9b318
+Revises: f2a6d8e3c597
+Create Date: 2026-10-18 14:00:00.000000
+
+거래 목록 keyset 페이지네이션 정렬 (date DESC, created_at DESC, id DESC) 과 일치하는
+가족/개인 가계부 인덱스를 CONCURRENTLY로 만들고, 이를 대체하는
+ix_transactions_family_group_id_date 인덱스를 삭제합니다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4c7e2f9b318'
+down_revision: Union[str, None] = 'f2a6d8e3c597'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+KEYSET_COLUMNS = [sa.text('date DESC'), sa.text('created_at DESC'), sa.text('id DESC')]
+
+# (인덱스 이름, 테이블, 컬럼)
+INDEXES = [
+    ('ix_transactions_family_group_id_date_id', 'transactions', ['family_group_id', *KEYSET_COLUMNS]),
+    ('ix_transactions_user_id_date_id', 'transactions', ['user_id', *KEYSET_COLUMNS]),
+]
+REPLACED_INDEX = (
+    'ix_transactions_family_group_id_date', 'transactions',
+    ['family_group_id', sa.text('date DESC'), sa.text('created_at DESC')],
+)
+
+
+def _index_is_valid(name: str) -> Union[bool, None]:
+    """인덱스 상태: 없음(None), 정상(True), 중단된 CONCURRENTLY 빌드(False)"""
+    return op.get_bind().execute(
+        sa.text(
+            "SELECT i.indisvalid FROM pg_class c "
+            "JOIN pg_index i ON i.indexrelid = c.oid WHERE c.relname = :name"
+        ),
+        {'name': name},
+    ).scalar()
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            state = _index_is_valid(name)
+            if state is True:
+                continue
+            if state is False:
+                op.drop_index(name, table_name=table, postgresql_concurrently=True)
+            op.create_index(
+                name, table, columns,
+                unique=False, postgresql_concurrently=True, if_not_exists=True,
+            )
+        name, table, _ = REPLACED_INDEX
+        op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        name, table, columns = REPLACED_INDEX
+        op.create_index(
+            name, table, columns,
+            unique=False, postgresql_concurrently=True, if_not_exists=True,
+        )
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,68 @@
+"""add transactions.memo_search and its GIN index
+
+Revision ID: b3e8f4a7d912
+Revises: a4c7e2f9b318
+Create Date: 2026-10-18 15:00:00.000000
+
+거래 메모 검색용 생성 컬럼 memo_search (to_tsvector('simple', coalesce(memo, '')), STORED)를 추가하고
+GIN 인덱스를 CONCURRENTLY로 만듭니다.
+컬럼 추가는 테이블을 다시 쓰므로 그동안 transactions 읽기/쓰기가 대기합니다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3e8f4a7d912'
+down_revision: Union[str, None] = 'a4c7e2f9b318'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEX_NAME = 'ix_transactions_memo_search'
+
+
+def _has_column(table: str, column: str) -> bool:
+    return any(c['name'] == column for c in sa.inspect(op.get_bind()).get_columns(table))
+
+
+def _index_is_valid(name: str) -> Union[bool, None]:
+    """인덱스 상태: 없음(None), 정상(True), 중단된 CONCURRENTLY 빌드(False)"""
+    return op.get_bind().execute(
+        sa.text(
+            "SELECT i.indisvalid FROM pg_class c "
+            "JOIN pg_index i ON i.indexrelid = c.oid WHERE c.relname = :name"
+        ),
+        {'name': name},
+    ).scalar()
+
+
+def upgrade() -> None:
+    if not _has_column('transactions', 'memo_search'):
+        op.add_column(
+            'transactions',
+            sa.Column(
+                'memo_search',
+                postgresql.TSVECTOR(),
+                sa.Computed("to_tsvector('simple'::regconfig, coalesce(memo, ''))", persisted=True),
+            ),
+        )
+    with op.get_context().autocommit_block():
+        state = _index_is_valid(INDEX_NAME)
+        if state is True:
+            return
+        if state is False:
+            op.drop_index(INDEX_NAME, table_name='transactions', postgresql_concurrently=True)
+        op.create_index(
+            INDEX_NAME, 'transactions', ['memo_search'],
+            unique=False, postgresql_using='gin', postgresql_concurrently=True, if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            INDEX_NAME, table_name='transactions', postgresql_concurrently=True, if_exists=True
+        )
+    op.drop_column('transactions', 'memo_search')
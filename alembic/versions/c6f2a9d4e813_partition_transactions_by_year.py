@@ -0,0 +1,114 @@
+"""partition transactions by year (RANGE (date))
+
+Revision ID: c6f2a9d4e813
+Revises: b3e8f4a7d912
+Create Date: 2026-10-18 18:00:00.000000
+
+transactions를 date 기준 연 단위 범위 파티션 테이블로 바꿉니다.
+기존 테이블의 이름을 바꾼 뒤 같은 컬럼의 파티션 테이블을 만들고, 데이터가 있는 연도와
+올해/내년 파티션, 기본 파티션(transactions_default)을 만든 다음 행을 옮깁니다.
+기본 키는 (id, date)가 되고 인덱스/외래 키/트리거는 기존 정의 그대로 다시 만듭니다.
+행을 옮기는 동안 transactions 읽기/쓰기가 대기합니다 (사용량이 적은 시간에 실행).
+"""
+from datetime import date
+from typing import Optional, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'c6f2a9d4e813'
+down_revision: Union[str, None] = 'b3e8f4a7d912'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 이보다 오래된 연도의 거래는 연도 파티션 대신 기본 파티션에 둠 (잘못 입력된 날짜 등)
+MAX_PAST_YEARS = 30
+
+
+def _is_partitioned() -> bool:
+    return op.get_bind().execute(
+        sa.text(
+            "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table "
+            "WHERE partrelid = 'transactions'::regclass)"
+        )
+    ).scalar()
+
+
+def _rebuild(partition_years: Optional[list[int]]) -> None:
+    """
+    transactions를 같은 컬럼의 새 테이블로 옮겨 다시 만들기
+    partition_years가 있으면 연 단위 파티션 테이블(기본 키 (id, date)), 없으면 일반 테이블(기본 키 id)
+    """
+    bind = op.get_bind()
+    op.execute('LOCK TABLE transactions IN ACCESS EXCLUSIVE MODE')
+    # 다시 만들 인덱스/외래 키/트리거 정의 (기본 키 제외, 이름과 옵션 유지)
+    definitions = bind.execute(sa.text(
+        "SELECT replace(pg_get_indexdef(indexrelid), ' ON ONLY ', ' ON ') FROM pg_index "
+        "WHERE indrelid = 'transactions'::regclass AND NOT indisprimary "
+        "UNION ALL "
+        "SELECT format('ALTER TABLE transactions ADD CONSTRAINT %I %s', "
+        "conname, pg_get_constraintdef(oid)) FROM pg_constraint "
+        "WHERE conrelid = 'transactions'::regclass AND contype = 'f' "
+        "UNION ALL "
+        "SELECT pg_get_triggerdef(oid) FROM pg_trigger "
+        "WHERE tgrelid = 'transactions'::regclass AND NOT tgisinternal"
+    )).scalars().all()
+    columns = ', '.join(bind.execute(sa.text(
+        "SELECT quote_ident(column_name) FROM information_schema.columns "
+        "WHERE table_schema = current_schema() AND table_name = 'transactions' "
+        "AND is_generated = 'NEVER' ORDER BY ordinal_position"
+    )).scalars().all())
+
+    op.execute('ALTER TABLE transactions RENAME TO transactions_previous')
+    op.execute(
+        'CREATE TABLE transactions (LIKE transactions_previous '
+        'INCLUDING DEFAULTS INCLUDING GENERATED INCLUDING CONSTRAINTS '
+        'INCLUDING STORAGE INCLUDING COMMENTS)'
+        + (' PARTITION BY RANGE (date)' if partition_years is not None else '')
+    )
+    if partition_years is not None:
+        for year in partition_years:
+            op.execute(
+                f"CREATE TABLE transactions_y{year} PARTITION OF transactions "
+                f"FOR VALUES FROM ('{year}-01-01') TO ('{year + 1}-01-01')"
+            )
+        op.execute('CREATE TABLE transactions_default PARTITION OF transactions DEFAULT')
+
+    op.execute(f'INSERT INTO transactions ({columns}) SELECT {columns} FROM transactions_previous')
+    # 파티션 테이블이면 파티션도 함께 삭제됨 (이미 분리한 파티션은 남음)
+    op.execute('DROP TABLE transactions_previous')
+
+    op.execute(
+        'ALTER TABLE transactions ADD CONSTRAINT transactions_pkey PRIMARY KEY '
+        + ('(id, date)' if partition_years is not None else '(id)')
+    )
+    for definition in definitions:
+        op.execute(definition)
+    op.execute('ANALYZE transactions')
+
+
+def upgrade() -> None:
+    if _is_partitioned():
+        return
+    this_year = date.today().year
+    data_years = op.get_bind().execute(
+        sa.text(
+            "SELECT DISTINCT extract(year FROM date)::int FROM transactions "
+            "WHERE date >= make_date(:first, 1, 1) AND date < make_date(:last, 1, 1)"
+        ),
+        {'first': this_year - MAX_PAST_YEARS, 'last': this_year + 2},
+    ).scalars().all()
+    _rebuild(sorted(set(data_years) | {this_year, this_year + 1}))
+
+
+def downgrade() -> None:
+    if not _is_partitioned():
+        return
+    # 같은 id가 여러 날짜에 있으면 기본 키 (id)를 만들 수 없으므로 먼저 확인
+    duplicated = op.get_bind().execute(sa.text(
+        "SELECT id FROM transactions GROUP BY id HAVING count(*) > 1 LIMIT 1"
+    )).scalar()
+    if duplicated is not None:
+        raise RuntimeError(f'같은 id의 거래가 여러 건 있어 되돌릴 수 없습니다: {duplicated}')
+    _rebuild(None)
@@ -0,0 +1,81 @@
+"""add performance indexes (CREATE INDEX CONCURRENTLY)
+
+Revision ID: c8d2f5b7e914
+Revises: 9a3b6e2c8d47
+Create Date: 2026-10-18 10:10:00.000000
+
+실제 조회 경로에 맞춘 인덱스를 CONCURRENTLY로 생성합니다 (테이블 쓰기 잠금 없음).
+CONCURRENTLY는 트랜잭션 안에서 실행할 수 없으므로 autocommit 블록에서 하나씩 생성하며,
+이전 실행이 중단되어 INVALID 상태로 남은 인덱스는 삭제 후 다시 만듭니다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8d2f5b7e914'
+down_revision: Union[str, None] = '9a3b6e2c8d47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (인덱스 이름, 테이블, 컬럼, 추가 옵션)
+INDEXES = [
+    # 월별 수입/지출 합계: (user_id, type, date) 범위 스캔 + amount 포함 → index-only scan
+    ('ix_transactions_user_id_type_date', 'transactions', ['user_id', 'type', 'date'],
+     {'postgresql_include': ['amount']}),
+    # 유형별 자산/부채 합계
+    ('ix_assets_user_id_type', 'assets', ['user_id', 'type'], {}),
+    # 가족 가계부 목록 조회 (정렬 순서와 일치)
+    ('ix_transactions_family_group_id_date', 'transactions',
+     ['family_group_id', sa.text('date DESC'), sa.text('created_at DESC')], {}),
+    ('ix_assets_family_group_id_created_at', 'assets',
+     ['family_group_id', sa.text('created_at DESC')], {}),
+    # 가족 범위 조회 (구성원 → 그룹, 관리자 → 그룹)
+    ('ix_family_members_user_id', 'family_members', ['user_id'], {}),
+    ('ix_family_members_family_group_id', 'family_members', ['family_group_id'], {}),
+    ('ix_family_groups_admin_user_id', 'family_groups', ['admin_user_id'], {}),
+]
+
+
+def _index_is_valid(name: str) -> Union[bool, None]:
+    """인덱스 상태: 없음(None), 정상(True), 중단된 CONCURRENTLY 빌드(False)"""
+    return op.get_bind().execute(
+        sa.text(
+            "SELECT i.indisvalid FROM pg_class c "
+            "JOIN pg_index i ON i.indexrelid = c.oid WHERE c.relname = :name"
+        ),
+        {'name': name},
+    ).scalar()
+
+
+def _has_equivalent_index(table: str, columns: list) -> bool:
+    """같은 컬럼의 인덱스가 다른 이름으로 이미 있는지 확인 (SQL 스크립트의 idx_* 인덱스 등)"""
+    if not all(isinstance(c, str) for c in columns):
+        return False
+    return any(
+        ix['column_names'] == columns and not ix.get('include_columns')
+        for ix in sa.inspect(op.get_bind()).get_indexes(table)
+    )
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns, options in INDEXES:
+            state = _index_is_valid(name)
+            if state is True:
+                continue
+            if state is False:
+                op.drop_index(name, table_name=table, postgresql_concurrently=True)
+            elif _has_equivalent_index(table, columns):
+                continue
+            op.create_index(
+                name, table, columns,
+                unique=False, postgresql_concurrently=True, if_not_exists=True, **options,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,53 @@
+"""add monthly_rollups
+
+Revision ID: d5e8a1c4b673
+Revises: c8d2f5b7e914
+Create Date: 2026-10-18 11:00:00.000000
+
+월별 거래 집계 테이블을 만들고 기존 거래로 채웁니다.
+(이후 불일치 복구: python -m scripts.rebuild_monthly_rollups)
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5e8a1c4b673'
+down_revision: Union[str, None] = 'c8d2f5b7e914'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+transaction_type = postgresql.ENUM('INCOME', 'EXPENSE', name='transactiontype', create_type=False)
+
+
+def upgrade() -> None:
+    op.create_table(
+        'monthly_rollups',
+        sa.Column('user_id', sa.String(), nullable=False),
+        sa.Column('month', sa.Date(), nullable=False),
+        sa.Column('type', transaction_type, nullable=False),
+        sa.Column('category_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('total', sa.Numeric(precision=15, scale=2), server_default=sa.text('0'), nullable=False),
+        sa.Column('count', sa.Integer(), server_default=sa.text('0'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.user_id'], ),
+        sa.ForeignKeyConstraint(['category_id'], ['categories.id'], ),
+        sa.PrimaryKeyConstraint('user_id', 'month', 'type', 'category_id'),
+    )
+    # 기존 거래로 채우기 (category_id가 없는 과거 데이터 제외)
+    op.execute(
+        """
+        INSERT INTO monthly_rollups (user_id, month, type, category_id, total, count)
+        SELECT user_id, date_trunc('month', date::timestamp)::date, type, category_id,
+               SUM(amount), COUNT(*)
+        FROM transactions
+        WHERE category_id IS NOT NULL
+        GROUP BY 1, 2, 3, 4
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('monthly_rollups')
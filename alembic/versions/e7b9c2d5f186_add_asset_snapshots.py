@@ -0,0 +1,46 @@
+"""add asset_snapshots
+
+Revision ID: e7b9c2d5f186
+Revises: d5e8a1c4b673
+Create Date: 2026-10-18 12:00:00.000000
+
+순자산 추이용 일일 자산 스냅샷 테이블을 만들고, 현재 자산 합계를 첫 스냅샷으로 기록합니다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7b9c2d5f186'
+down_revision: Union[str, None] = 'd5e8a1c4b673'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'asset_snapshots',
+        sa.Column('user_id', sa.String(), nullable=False),
+        sa.Column('snapshot_date', sa.Date(), nullable=False),
+        sa.Column('total_assets', sa.Numeric(precision=15, scale=2), nullable=False),
+        sa.Column('total_liabilities', sa.Numeric(precision=15, scale=2), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.user_id'], ),
+        sa.PrimaryKeyConstraint('user_id', 'snapshot_date'),
+    )
+    # 현재 자산 합계를 첫 스냅샷으로 기록
+    op.execute(
+        """
+        INSERT INTO asset_snapshots (user_id, snapshot_date, total_assets, total_liabilities)
+        SELECT user_id, CURRENT_DATE,
+               COALESCE(SUM(amount) FILTER (WHERE type = 'CASH'), 0),
+               COALESCE(SUM(amount) FILTER (WHERE type = 'LOAN'), 0)
+        FROM assets
+        GROUP BY user_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('asset_snapshots')
@@ -0,0 +1,33 @@
+"""add data_versions
+
+Revision ID: f2a6d8e3c597
+Revises: e7b9c2d5f186
+Create Date: 2026-10-18 13:00:00.000000
+
+조건부 GET(ETag)용 가계부 데이터 버전 테이블을 만듭니다.
+행이 없는 범위는 버전 0으로 취급하므로 채울 데이터는 없습니다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2a6d8e3c597'
+down_revision: Union[str, None] = 'e7b9c2d5f186'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'data_versions',
+        sa.Column('scope_key', sa.String(), nullable=False),
+        sa.Column('version', sa.BigInteger(), server_default=sa.text('0'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('scope_key'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('data_versions')
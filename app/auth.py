@@ -0,0 +1,194 @@
+"""
+JWT 토큰 검증 및 클레임 캐시
+서명은 미리 파싱된 키로 프로세스 내에서 검증하며 (Supabase 호출 없음),
+같은 토큰은 만료 시각(exp)까지 한 번만 검증합니다.
+"""
+from collections import OrderedDict
+from typing import Any, Optional
+from jose import JWTError, jwk, jwt
+from jose.backends.base import Key
+from app.config import settings
+import asyncio
+import hashlib
+import httpx
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+# exp 클레임이 없는 토큰의 캐시 유지 시간 (초)
+DEFAULT_CLAIMS_TTL = 300
+# 만료 시간 검증 허용 오차 (초)
+JWT_LEEWAY = 10
+
+HMAC_ALGORITHM = "HS256"
+ASYMMETRIC_ALGORITHMS = ("RS256", "ES256")
+# JWK에 alg가 없을 때 kty로 추정
+DEFAULT_JWK_ALGORITHMS = {"RSA": "RS256", "EC": "ES256"}
+
+JWKS_FETCH_TIMEOUT = 2.0
+# kid 미스로 인한 JWKS 재요청 최소 간격 (초)
+JWKS_MIN_REFRESH_INTERVAL = 30.0
+
+
+class TokenClaimsCache:
+    """토큰 다이제스트 → 디코딩된 클레임 (TTL + LRU, 크기 제한)"""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: "OrderedDict[bytes, tuple[float, dict[str, Any]]]" = OrderedDict()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> Optional[dict[str, Any]]:
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, claims = entry
+        if expires_at <= time.time():
+            self._entries.pop(key, None)
+            return None
+        self._entries.move_to_end(key)
+        return claims
+
+    def put(self, token: str, claims: dict[str, Any]) -> None:
+        exp = claims.get("exp")
+        now = time.time()
+        expires_at = float(exp) if isinstance(exp, (int, float)) else now + DEFAULT_CLAIMS_TTL
+        if expires_at <= now:
+            # 이미 만료된 토큰은 캐시하지 않음
+            return
+        key = self._key(token)
+        self._entries[key] = (expires_at, claims)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class SigningKeyCache:
+    """
+    미리 파싱된 JWT 서명 키 캐시
+    - HS256: 프로젝트 JWT 시크릿 (SUPABASE_JWT_SECRET)
+    - RS256/ES256 등: 시작 시 JWKS에서 로드, kid가 없으면 백그라운드에서 다시 로드
+    """
+
+    def __init__(self):
+        self._secret_key: Optional[Key] = None
+        self._jwks_keys: dict[str, Key] = {}
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._last_refresh = 0.0
+
+    @property
+    def jwks_url(self) -> str:
+        return settings.supabase_jwks_url or (
+            f"{settings.supabase_url.rstrip('/')}/auth/v1/.well-known/jwks.json"
+        )
+
+    async def load(self) -> None:
+        """시작 시 호출: 시크릿 키 파싱 및 JWKS 로드"""
+        if settings.supabase_jwt_secret:
+            self._secret_key = jwk.construct(settings.supabase_jwt_secret, HMAC_ALGORITHM)
+        try:
+            await self.refresh()
+        except Exception as e:
+            logger.warning(f"JWKS 로드 실패 ({self.jwks_url}): {str(e)}")
+        if self._secret_key is None and not self._jwks_keys:
+            logger.error("JWT 서명 검증 키가 없습니다. SUPABASE_JWT_SECRET 또는 JWKS 설정을 확인하세요.")
+
+    async def refresh(self) -> None:
+        """JWKS를 받아서 kid별 키 객체로 파싱"""
+        self._last_refresh = time.monotonic()
+        async with httpx.AsyncClient(timeout=JWKS_FETCH_TIMEOUT) as client:
+            response = await client.get(self.jwks_url)
+            response.raise_for_status()
+            jwks = response.json()
+
+        keys: dict[str, Key] = {}
+        for key_data in jwks.get("keys", []):
+            kid = key_data.get("kid")
+            alg = key_data.get("alg") or DEFAULT_JWK_ALGORITHMS.get(key_data.get("kty"))
+            if not kid or alg not in ASYMMETRIC_ALGORITHMS:
+                continue
+            try:
+                keys[kid] = jwk.construct(key_data, alg)
+            except Exception as e:
+                logger.warning(f"JWK 파싱 실패 (kid: {kid}): {str(e)}")
+        self._jwks_keys = keys
+        logger.info(f"JWKS 로드 완료: {len(keys)}개 키")
+
+    def get(self, alg: str, kid: Optional[str]) -> Optional[Key]:
+        if alg == HMAC_ALGORITHM:
+            return self._secret_key
+        if kid is None:
+            return None
+        return self._jwks_keys.get(kid)
+
+    async def get_or_refresh(self, alg: str, kid: Optional[str]) -> Optional[Key]:
+        """
+        kid에 해당하는 키가 없으면 백그라운드에서 JWKS를 다시 로드합니다.
+        (키 교체 대응, 최소 간격 제한으로 알 수 없는 kid 남용 방지)
+        """
+        key = self.get(alg, kid)
+        if key is not None or alg == HMAC_ALGORITHM or kid is None:
+            return key
+
+        if self._refresh_task is None or self._refresh_task.done():
+            if time.monotonic() - self._last_refresh < JWKS_MIN_REFRESH_INTERVAL:
+                return None
+            self._refresh_task = asyncio.create_task(self.refresh())
+
+        try:
+            # 진행 중인 갱신을 잠시만 기다림 (갱신 자체는 취소되지 않음)
+            await asyncio.wait_for(asyncio.shield(self._refresh_task), JWKS_FETCH_TIMEOUT)
+        except Exception as e:
+            logger.warning(f"JWKS 갱신 실패: {str(e)}")
+            return None
+        return self.get(alg, kid)
+
+
+claims_cache = TokenClaimsCache(settings.token_cache_size)
+signing_keys = SigningKeyCache()
+
+
+def verify_token_signature(token: str, key: Key, alg: str) -> dict[str, Any]:
+    """미리 파싱된 키로 서명, 만료 시간, audience 검증 (네트워크 호출 없음)"""
+    return jwt.decode(
+        token,
+        key,
+        algorithms=[alg],
+        audience=settings.jwt_audience or None,
+        options={
+            "verify_aud": bool(settings.jwt_audience),
+            "leeway": JWT_LEEWAY,
+        },
+    )
+
+
+async def decode_token_claims(token: str) -> dict[str, Any]:
+    """
+    JWT 토큰을 검증하고 클레임을 반환합니다 (캐시 우선).
+    검증된 클레임만 캐시되며, 반환된 dict는 같은 토큰을 쓰는 모든 요청이 공유하므로 수정하지 마세요.
+    """
+    claims = claims_cache.get(token)
+    if claims is not None:
+        return claims
+
+    header = jwt.get_unverified_header(token)
+    alg = header.get("alg")
+    if alg != HMAC_ALGORITHM and alg not in ASYMMETRIC_ALGORITHMS:
+        raise JWTError(f"Unsupported token algorithm: {alg}")
+
+    key = await signing_keys.get_or_refresh(alg, header.get("kid"))
+    if key is None:
+        raise JWTError("Signing key not found for token")
+
+    claims = verify_token_signature(token, key, alg)
+    logger.debug(f"JWT payload verified: {list(claims.keys())}")
+    claims_cache.put(token, claims)
+    return claims
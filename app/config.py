@@ -7,7 +7,19 @@ class Settings(BaseSettings):
     supabase_url: str
     supabase_key: str
     supabase_service_key: Optional[str] = None  # Admin API용 서비스 키
+    supabase_jwt_secret: Optional[str] = None  # HS256 토큰 서명 검증용 JWT 시크릿
+    supabase_jwks_url: Optional[str] = None  # 기본값: {SUPABASE_URL}/auth/v1/.well-known/jwks.json
+    jwt_audience: str = "authenticated"  # 빈 문자열이면 audience 검증 생략
     environment: str = "development"
+    known_user_cache_size: int = 10000  # 확인된 user_id 캐시 최대 크기
+    token_cache_size: int = 1024  # 디코딩된 JWT 클레임 캐시 최대 크기
+    family_cache_ttl: int = 60  # 가족 구성원 캐시 유지 시간 (초, 다른 프로세스의 변경 반영 주기)
+    category_cache_ttl: int = 300  # 카테고리 레지스트리 유지 시간 (초, SQL 스크립트로 바꾼 카테고리 반영 주기)
+    transaction_partitions_ahead: int = 1  # 거래 연도 파티션을 미리 만들어 둘 햇수 (올해 이후)
+    # 요청 트레이스 설정 (샘플링 비율 0이면 비활성화)
+    trace_sample_rate: float = 0.0
+    trace_log_path: str = ".cursor/debug.log"
+    trace_buffer_size: int = 1000
     
     class Config:
         env_file = ".env"
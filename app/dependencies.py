@@ -1,20 +1,27 @@
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, Response, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
 from supabase import create_client, Client
-from jose import JWTError, jwt
+from jose import JWTError
+from app.auth import claims_cache, decode_token_claims
 from app.config import settings
 from app.database import get_db
-from app.models.user import User
+from app.services.user_service import UserService
+from app.services.data_version_service import DataVersionService
+from app.tracing import tracer
 
 security = HTTPBearer()
 
 
-async def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)) -> str:
+async def verify_token(
+    request: Request,
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+) -> str:
     """
     Supabase JWT 토큰을 검증하고 user_id를 추출합니다.
-    JWT 토큰을 직접 파싱하여 user_id를 추출합니다.
+    서명은 프로세스 내에서 검증하며 (네트워크 호출 없음),
+    검증된 클레임은 토큰 만료 시각까지 캐시되며,
+    요청 내에서는 request.state.token_claims로 공유됩니다.
     """
     import logging
     logger = logging.getLogger(__name__)
@@ -22,20 +29,9 @@ async def verify_token(credentials: HTTPAuthorizationCredentials = Depends(secur
     token = credentials.credentials
 
     try:
-        # JWT 토큰에서 payload 추출 (서명 검증 없이, Supabase가 이미 검증함)
-        # Supabase JWT의 payload에서 sub (user_id) 추출
-        # 모든 검증 옵션을 비활성화하여 payload만 추출
-        payload = jwt.decode(
-            token,
-            key="",  # 서명 검증을 하지 않으므로 빈 문자열
-            options={
-                "verify_signature": False,  # 서명 검증 비활성화
-                "verify_aud": False,  # audience 검증 비활성화
-                "verify_exp": False,  # 만료 시간 검증 비활성화 (선택사항)
-            }
-        )
-        
-        logger.info(f"JWT payload decoded: {list(payload.keys())}")
+        # 미리 로드된 키로 서명/만료/audience 검증 (검증된 클레임은 만료 시각까지 캐시)
+        payload = await decode_token_claims(token)
+        request.state.token_claims = payload
         
         user_id = payload.get("sub")
         
@@ -46,9 +42,10 @@ async def verify_token(credentials: HTTPAuthorizationCredentials = Depends(secur
                 detail="Invalid authentication credentials: user_id not found in token",
             )
 
-        logger.info(f"User authenticated: {user_id}")
         return user_id
 
+    except HTTPException:
+        raise
     except JWTError as e:
         logger.error(f"JWT decode error: {str(e)}")
         raise HTTPException(
@@ -63,192 +60,98 @@ async def verify_token(credentials: HTTPAuthorizationCredentials = Depends(secur
         )
 
 
+def get_token_claims(request: Request) -> dict:
+    """
+    현재 요청의 JWT 클레임 반환 (verify_token에서 디코딩한 객체를 공유).
+    verify_token을 거치지 않은 요청이면 빈 dict를 반환합니다.
+    """
+    claims = getattr(request.state, "token_claims", None)
+    if claims is not None:
+        return claims
+
+    # 이미 검증되어 캐시된 토큰만 사용 (검증되지 않은 토큰은 디코딩하지 않음)
+    auth_header = request.headers.get("Authorization", "")
+    if not auth_header.startswith("Bearer "):
+        return {}
+    return claims_cache.get(auth_header[len("Bearer "):]) or {}
+
+
 async def get_current_user_id(
     user_id: str = Depends(verify_token),
     db: AsyncSession = Depends(get_db),
 ) -> str:
     """
     현재 사용자의 user_id를 반환하고, User 레코드가 없으면 생성합니다.
+    이미 확인된 사용자는 DB 조회 없이 바로 반환합니다 (프로세스 내 캐시).
     데이터베이스 연결 실패 시에도 user_id는 반환합니다 (MVP 수준).
     """
     import logging
-    import json
-    import os
     logger = logging.getLogger(__name__)
     
-    # #region agent log
-    try:
-        log_data = {
-            "sessionId": "debug-session",
-            "runId": "run1",
-            "hypothesisId": "A",
-            "location": "dependencies.py:77",
-            "message": "get_current_user_id entry",
-            "data": {"user_id": user_id},
-            "timestamp": int(__import__("time").time() * 1000)
-        }
-        with open("/home/meunji/work/cursor/household/.cursor/debug.log", "a") as f:
-            f.write(json.dumps(log_data) + "\n")
-    except: pass
-    # #endregion
+    tracer.event(
+        "A", "dependencies.py:get_current_user_id", "get_current_user_id entry",
+        {"user_id": user_id},
+    )
     
     try:
-        # #region agent log
-        try:
-            log_data = {
-                "sessionId": "debug-session",
-                "runId": "run1",
-                "hypothesisId": "A",
-                "location": "dependencies.py:85",
-                "message": "Before DB query",
-                "data": {"user_id": user_id},
-                "timestamp": int(__import__("time").time() * 1000)
-            }
-            with open("/home/meunji/work/cursor/household/.cursor/debug.log", "a") as f:
-                f.write(json.dumps(log_data) + "\n")
-        except: pass
-        # #endregion
-        
-        # User 레코드 확인
-        result = await db.execute(
-            select(User).where(User.user_id == user_id)
-        )
-        user = result.scalar_one_or_none()
-
-        # #region agent log
-        try:
-            log_data = {
-                "sessionId": "debug-session",
-                "runId": "run1",
-                "hypothesisId": "A",
-                "location": "dependencies.py:95",
-                "message": "After DB query",
-                "data": {"user_id": user_id, "user_found": user is not None},
-                "timestamp": int(__import__("time").time() * 1000)
-            }
-            with open("/home/meunji/work/cursor/household/.cursor/debug.log", "a") as f:
-                f.write(json.dumps(log_data) + "\n")
-        except: pass
-        # #endregion
-
-        if not user:
-            # User 레코드가 없으면 생성
-            try:
-                # #region agent log
-                try:
-                    log_data = {
-                        "sessionId": "debug-session",
-                        "runId": "run1",
-                        "hypothesisId": "B",
-                        "location": "dependencies.py:102",
-                        "message": "Before creating user record",
-                        "data": {"user_id": user_id},
-                        "timestamp": int(__import__("time").time() * 1000)
-                    }
-                    with open("/home/meunji/work/cursor/household/.cursor/debug.log", "a") as f:
-                        f.write(json.dumps(log_data) + "\n")
-                except: pass
-                # #endregion
-                
-                new_user = User(user_id=user_id)
-                db.add(new_user)
-                await db.commit()
-                await db.refresh(new_user)
-                logger.info(f"User record created: {user_id}")
-                
-                # #region agent log
-                try:
-                    log_data = {
-                        "sessionId": "debug-session",
-                        "runId": "run1",
-                        "hypothesisId": "B",
-                        "location": "dependencies.py:115",
-                        "message": "User record created successfully",
-                        "data": {"user_id": user_id},
-                        "timestamp": int(__import__("time").time() * 1000)
-                    }
-                    with open("/home/meunji/work/cursor/household/.cursor/debug.log", "a") as f:
-                        f.write(json.dumps(log_data) + "\n")
-                except: pass
-                # #endregion
-            except Exception as e:
-                # #region agent log
-                try:
-                    log_data = {
-                        "sessionId": "debug-session",
-                        "runId": "run1",
-                        "hypothesisId": "B",
-                        "location": "dependencies.py:122",
-                        "message": "Failed to create user record",
-                        "data": {"user_id": user_id, "error": str(e), "error_type": type(e).__name__},
-                        "timestamp": int(__import__("time").time() * 1000)
-                    }
-                    with open("/home/meunji/work/cursor/household/.cursor/debug.log", "a") as f:
-                        f.write(json.dumps(log_data) + "\n")
-                except: pass
-                # #endregion
-                
-                logger.warning(f"Failed to create user record: {str(e)}. Continuing without DB record.")
-                # 데이터베이스 연결 실패 시에도 계속 진행 (MVP 수준)
-                try:
-                    await db.rollback()
-                except:
-                    pass
-        
-        # #region agent log
-        try:
-            log_data = {
-                "sessionId": "debug-session",
-                "runId": "run1",
-                "hypothesisId": "A",
-                "location": "dependencies.py:137",
-                "message": "get_current_user_id success",
-                "data": {"user_id": user_id},
-                "timestamp": int(__import__("time").time() * 1000)
-            }
-            with open("/home/meunji/work/cursor/household/.cursor/debug.log", "a") as f:
-                f.write(json.dumps(log_data) + "\n")
-        except: pass
-        # #endregion
-        
+        # User 레코드 확인 및 생성 (INSERT ... ON CONFLICT DO NOTHING, 확인된 사용자는 쿼리 없음)
+        with tracer.span(
+            "B", "dependencies.py:ensure_user", "User record ensured", {"user_id": user_id}
+        ):
+            await UserService.ensure_user(db, user_id)
         return user_id
         
     except Exception as e:
-        # #region agent log
-        try:
-            log_data = {
-                "sessionId": "debug-session",
-                "runId": "run1",
-                "hypothesisId": "C",
-                "location": "dependencies.py:145",
-                "message": "Database error caught",
-                "data": {"user_id": user_id, "error": str(e), "error_type": type(e).__name__},
-                "timestamp": int(__import__("time").time() * 1000)
-            }
-            with open("/home/meunji/work/cursor/household/.cursor/debug.log", "a") as f:
-                f.write(json.dumps(log_data) + "\n")
-        except: pass
-        # #endregion
+        tracer.event(
+            "C", "dependencies.py:get_current_user_id", "Returning user_id despite DB error",
+            {"user_id": user_id, "error": str(e), "error_type": type(e).__name__},
+        )
         
         # 데이터베이스 연결 실패 등 모든 예외 처리
         logger.error(f"Database error in get_current_user_id: {str(e)}", exc_info=True)
+        try:
+            await db.rollback()
+        except:
+            pass
         # 데이터베이스 연결이 실패해도 user_id는 반환 (인증은 이미 완료됨)
         # MVP 수준에서는 데이터베이스 없이도 API가 동작하도록 함
-        
-        # #region agent log
-        try:
-            log_data = {
-                "sessionId": "debug-session",
-                "runId": "run1",
-                "hypothesisId": "C",
-                "location": "dependencies.py:155",
-                "message": "Returning user_id despite DB error",
-                "data": {"user_id": user_id},
-                "timestamp": int(__import__("time").time() * 1000)
-            }
-            with open("/home/meunji/work/cursor/household/.cursor/debug.log", "a") as f:
-                f.write(json.dumps(log_data) + "\n")
-        except: pass
-        # #endregion
-        
         return user_id
+
+
+async def check_not_modified(
+    request: Request,
+    response: Response,
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db),
+) -> None:
+    """
+    가계부 조회 엔드포인트용 조건부 GET (ETag / If-None-Match)
+    본 쿼리 전에 데이터 버전만 조회하여, 변경이 없으면 304로 바로 응답합니다.
+    버전 조회에 실패하면 ETag 없이 평소처럼 처리합니다.
+    """
+    import logging
+    logger = logging.getLogger(__name__)
+
+    try:
+        etag = await DataVersionService.get_etag(db, user_id)
+    except Exception as e:
+        logger.warning(f"데이터 버전 조회 실패, ETag 생략: {str(e)}")
+        try:
+            await db.rollback()
+        except Exception:
+            pass
+        return
+
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if DataVersionService.etag_matches(request.headers.get("If-None-Match"), etag):
+        raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+
+
+def skip_caching(response: Response) -> None:
+    """
+    조회 실패 시 반환하는 대체 응답(빈 목록 등)이 캐시되지 않도록 ETag 제거
+    check_not_modified가 미리 넣은 ETag가 남아 있으면 이후 재검증이 계속 304가 됩니다.
+    """
+    del response.headers["ETag"]
+    response.headers["Cache-Control"] = "no-store"
@@ -2,7 +2,11 @@ from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
-from app.routers import assets, transactions, calculations, categories, family
+from app.routers import assets, transactions, calculations, categories, family, dashboard
+from app.tracing import TraceMiddleware, tracer
+from app.auth import signing_keys
+from app.services.category_service import category_registry
+from app.services.partition_service import PartitionService
 import traceback
 import logging
 
@@ -59,9 +63,38 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
     allow_headers=["*"],
-    expose_headers=["*"],
+    # 자격 증명 포함 요청에서는 "*"가 적용되지 않으므로 사용하는 헤더를 명시
+    expose_headers=["*", "ETag", "X-Next-Cursor"],
 )
 
+# 요청 트레이스 (TRACE_SAMPLE_RATE > 0 인 경우에만 샘플링)
+app.add_middleware(TraceMiddleware)
+
+
+@app.on_event("startup")
+async def load_signing_keys():
+    """JWT 서명 검증 키 로드 (JWKS는 kid 미스 시 자동 갱신)"""
+    await signing_keys.load()
+
+
+@app.on_event("startup")
+async def load_category_registry():
+    """카테고리 레지스트리 로드 (실패하면 첫 요청에서 다시 시도)"""
+    await category_registry.load()
+
+
+@app.on_event("startup")
+async def ensure_transaction_partitions():
+    """거래 연도 파티션 미리 생성 (올해 ~ TRANSACTION_PARTITIONS_AHEAD년 뒤)"""
+    await PartitionService.ensure_on_startup()
+
+
+@app.on_event("shutdown")
+async def shutdown_tracer():
+    """남은 트레이스 이벤트 기록"""
+    tracer.shutdown()
+
+
 # 전역 예외 핸들러
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
@@ -82,6 +115,7 @@ app.include_router(transactions.router)
 app.include_router(calculations.router)
 app.include_router(categories.router)
 app.include_router(family.router)
+app.include_router(dashboard.router)
 
 
 @app.get("/")
@@ -3,5 +3,8 @@ from app.models.asset import Asset
 from app.models.transaction import Transaction
 from app.models.category import Category
 from app.models.family import FamilyGroup, FamilyMember, FamilyRole
+from app.models.rollup import MonthlyRollup
+from app.models.snapshot import AssetSnapshot
+from app.models.data_version import DataVersion
 
-__all__ = ["User", "Asset", "Transaction", "Category", "FamilyGroup", "FamilyMember", "FamilyRole"]
+__all__ = ["User", "Asset", "Transaction", "Category", "FamilyGroup", "FamilyMember", "FamilyRole", "MonthlyRollup", "AssetSnapshot", "DataVersion"]
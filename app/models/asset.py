@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Numeric, DateTime, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, String, Numeric, DateTime, ForeignKey, Index, Enum as SQLEnum
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 import uuid
@@ -16,6 +16,10 @@ class Asset(Base):
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(String, ForeignKey("users.user_id"), nullable=False, index=True)
+    # 가족 가계부 id (소유자가 속한 가족 그룹, 가족 구성 변경 시 함께 갱신됨, 없으면 NULL)
+    family_group_id = Column(
+        UUID(as_uuid=True), ForeignKey("family_groups.id", ondelete="SET NULL"), nullable=True
+    )
     type = Column(SQLEnum(AssetType), nullable=False)
     name = Column(String, nullable=False)
     amount = Column(Numeric(precision=15, scale=2), nullable=False)
@@ -26,3 +30,10 @@ class Asset(Base):
         onupdate=func.now(),
         nullable=False,
     )
+
+    __table_args__ = (
+        # 유형별 자산/부채 합계용
+        Index("ix_assets_user_id_type", "user_id", "type"),
+        # 가족 가계부 자산 목록 조회용
+        Index("ix_assets_family_group_id_created_at", "family_group_id", created_at.desc()),
+    )
@@ -0,0 +1,21 @@
+from sqlalchemy import Column, String, BigInteger, DateTime
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class DataVersion(Base):
+    """
+    가계부 데이터 버전 (조건부 GET의 ETag 계산용)
+    가족 그룹("g:<family_group_id>") 또는 개인("u:<user_id>") 단위로,
+    자산/거래/가족 구성 변경 시 1씩 증가합니다.
+    """
+    __tablename__ = "data_versions"
+
+    scope_key = Column(String, primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0)
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
@@ -0,0 +1,29 @@
+from sqlalchemy import Column, String, Numeric, Integer, Date, DateTime, ForeignKey, Enum as SQLEnum
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+from app.database import Base
+from app.models.transaction import TransactionType
+
+
+class MonthlyRollup(Base):
+    """
+    월별 거래 집계 (소유자, 월, 유형, 카테고리별 합계와 건수)
+    거래 생성/수정/삭제 시 같은 DB 트랜잭션에서 증감분으로 갱신됩니다.
+    """
+    __tablename__ = "monthly_rollups"
+
+    user_id = Column(String, ForeignKey("users.user_id"), primary_key=True)  # 거래 소유자
+    month = Column(Date, primary_key=True)  # 해당 월 1일
+    type = Column(SQLEnum(TransactionType), primary_key=True)
+    category_id = Column(UUID(as_uuid=True), ForeignKey("categories.id"), primary_key=True)
+    total = Column(Numeric(precision=15, scale=2), nullable=False, default=0)  # 합계
+    count = Column(Integer, nullable=False, default=0)  # 거래 수
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
+    def __repr__(self):
+        return f"<MonthlyRollup(user_id={self.user_id}, month={self.month}, type={self.type}, total={self.total})>"
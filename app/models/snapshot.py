@@ -0,0 +1,20 @@
+from sqlalchemy import Column, String, Numeric, Date, DateTime, ForeignKey
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class AssetSnapshot(Base):
+    """
+    사용자별 일일 자산 스냅샷 (순자산 추이용)
+    자산 생성/수정/삭제 시 그날의 합계로 기록되며, 같은 날의 변경은 한 행으로 합쳐집니다.
+    """
+    __tablename__ = "asset_snapshots"
+
+    user_id = Column(String, ForeignKey("users.user_id"), primary_key=True)  # 자산 소유자
+    snapshot_date = Column(Date, primary_key=True)  # 스냅샷 날짜
+    total_assets = Column(Numeric(precision=15, scale=2), nullable=False)  # 총 자산 (CASH 합계)
+    total_liabilities = Column(Numeric(precision=15, scale=2), nullable=False)  # 총 부채 (LOAN 합계)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    def __repr__(self):
+        return f"<AssetSnapshot(user_id={self.user_id}, snapshot_date={self.snapshot_date})>"
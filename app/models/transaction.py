@@ -1,5 +1,6 @@
-from sqlalchemy import Column, String, Numeric, Date, DateTime, ForeignKey, Enum as SQLEnum
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, Numeric, Date, DateTime, ForeignKey, Index, Computed, Enum as SQLEnum
+from sqlalchemy.dialects.postgresql import UUID, TSVECTOR
+from sqlalchemy.orm import deferred
 from sqlalchemy.sql import func
 import uuid
 import enum
@@ -16,11 +17,24 @@ class Transaction(Base):
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(String, ForeignKey("users.user_id"), nullable=False, index=True)
+    # 가족 가계부 id (소유자가 속한 가족 그룹, 가족 구성 변경 시 함께 갱신됨, 없으면 NULL)
+    family_group_id = Column(
+        UUID(as_uuid=True), ForeignKey("family_groups.id", ondelete="SET NULL"), nullable=True
+    )
     type = Column(SQLEnum(TransactionType), nullable=False)
     amount = Column(Numeric(precision=15, scale=2), nullable=False)
     category_id = Column(UUID(as_uuid=True), ForeignKey("categories.id"), nullable=False, index=True)
-    date = Column(Date, nullable=False, index=True)
+    # 파티션 키 (연 단위 범위 파티션, 파티션 테이블의 기본 키에는 파티션 키가 포함되어야 함)
+    date = Column(Date, primary_key=True, nullable=False, index=True)
     memo = Column(String, nullable=True)
+    # 메모 검색용 tsvector (DB가 memo로 계산해 저장, 형태소 분석 없이 공백/기호 단위 단어)
+    # 목록 조회 시 불러오지 않도록 지연 로딩
+    memo_search = deferred(
+        Column(
+            TSVECTOR,
+            Computed("to_tsvector('simple'::regconfig, coalesce(memo, ''))", persisted=True),
+        )
+    )
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(
         DateTime(timezone=True),
@@ -29,6 +43,39 @@ class Transaction(Base):
         nullable=False,
     )
     
-    # 관계 설정 (카테고리 정보 조인 시 사용)
-    from sqlalchemy.orm import relationship
-    category = relationship("Category", lazy="joined")
+    @property
+    def category(self):
+        """카테고리 정보 (카테고리 레지스트리에서 조회, SQL 조인 없음)"""
+        from app.services.category_service import category_registry
+        return category_registry.get(self.category_id)
+
+    __table_args__ = (
+        # 월별 수입/지출 합계용 (amount 포함 → index-only scan)
+        Index(
+            "ix_transactions_user_id_type_date",
+            "user_id",
+            "type",
+            "date",
+            postgresql_include=["amount"],
+        ),
+        # 거래 목록 keyset 페이지네이션용 (date DESC, created_at DESC, id DESC 정렬과 일치)
+        # 가족 가계부는 family_group_id, 개인 가계부는 user_id로 조회
+        Index(
+            "ix_transactions_family_group_id_date_id",
+            "family_group_id",
+            date.desc(),
+            created_at.desc(),
+            id.desc(),
+        ),
+        Index(
+            "ix_transactions_user_id_date_id",
+            "user_id",
+            date.desc(),
+            created_at.desc(),
+            id.desc(),
+        ),
+        # 메모 검색용 (전문 검색 GIN 인덱스)
+        Index("ix_transactions_memo_search", "memo_search", postgresql_using="gin"),
+        # 날짜 범위 파티션 (transactions_yYYYY + transactions_default, PartitionService가 관리)
+        {"postgresql_partition_by": "RANGE (date)"},
+    )
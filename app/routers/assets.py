@@ -1,16 +1,27 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 from app.database import get_db
-from app.dependencies import get_current_user_id
-from app.schemas.asset import AssetCreate, AssetUpdate, AssetResponse
+from app.dependencies import check_not_modified, get_current_user_id, skip_caching
+from app.schemas.asset import (
+    AssetCreate,
+    AssetUpdate,
+    AssetResponse,
+    AssetBatchRequest,
+    AssetBatchResponse,
+)
 from app.services.asset_service import AssetService
 
 router = APIRouter(prefix="/api/assets", tags=["assets"])
 
 
-@router.get("", response_model=list[AssetResponse])
+@router.get(
+    "",
+    response_model=list[AssetResponse],
+    dependencies=[Depends(check_not_modified)],
+)
 async def get_assets(
+    response: Response,
     user_id: str = Depends(get_current_user_id),
     db: AsyncSession = Depends(get_db),
 ):
@@ -23,7 +34,8 @@ async def get_assets(
         return assets
     except Exception as e:
         logger.error(f"Failed to get assets: {str(e)}", exc_info=True)
-        # 데이터베이스 연결 실패 시 빈 배열 반환 (MVP 수준)
+        # 데이터베이스 연결 실패 시 빈 배열 반환 (MVP 수준, 캐시되지 않도록 ETag 제거)
+        skip_caching(response)
         return []
 
 
@@ -48,7 +60,31 @@ async def create_asset(
         )
 
 
-@router.get("/{asset_id}", response_model=AssetResponse)
+@router.post("/batch", response_model=AssetBatchResponse)
+async def apply_asset_batch(
+    batch: AssetBatchRequest,
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db),
+):
+    """자산 일괄 생성/수정/삭제 (한 트랜잭션, 작업별 결과를 요청 순서대로 반환)"""
+    import logging
+    logger = logging.getLogger(__name__)
+
+    try:
+        return await AssetService.apply_batch(db, batch.operations, user_id)
+    except Exception as e:
+        logger.error(f"Failed to apply asset batch: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"데이터베이스 연결에 실패했습니다: {str(e)}",
+        )
+
+
+@router.get(
+    "/{asset_id}",
+    response_model=AssetResponse,
+    dependencies=[Depends(check_not_modified)],
+)
 async def get_asset(
     asset_id: UUID,
     user_id: str = Depends(get_current_user_id),
@@ -1,16 +1,33 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import date
 from typing import Optional
 from app.database import get_db
-from app.dependencies import get_current_user_id
-from app.schemas.calculation import SummaryResponse, MonthlyResponse
+from app.dependencies import check_not_modified, get_current_user_id, skip_caching
+from app.schemas.calculation import (
+    SummaryResponse,
+    MonthlyResponse,
+    TimeseriesGranularity,
+    TimeseriesResponse,
+    CategoryBreakdownResponse,
+    NetWorthHistoryResponse,
+    InsightsResponse,
+)
+from app.models.transaction import TransactionType
 from app.services.calculation_service import CalculationService
+from app.services.snapshot_service import SnapshotService
+from app.services.analytics_service import AnalyticsService
 
 router = APIRouter(prefix="/api/calculations", tags=["calculations"])
 
 
-@router.get("/summary", response_model=SummaryResponse)
+@router.get(
+    "/summary",
+    response_model=SummaryResponse,
+    dependencies=[Depends(check_not_modified)],
+)
 async def get_summary(
+    response: Response,
     user_id: str = Depends(get_current_user_id),
     db: AsyncSession = Depends(get_db),
 ):
@@ -23,7 +40,8 @@ async def get_summary(
         return summary
     except Exception as e:
         logger.error(f"Failed to get summary: {str(e)}", exc_info=True)
-        # 데이터베이스 연결 실패 시 빈 응답 반환 (MVP 수준)
+        # 데이터베이스 연결 실패 시 빈 응답 반환 (MVP 수준, 캐시되지 않도록 ETag 제거)
+        skip_caching(response)
         return SummaryResponse(
             total_assets=0.0,
             total_liabilities=0.0,
@@ -31,8 +49,13 @@ async def get_summary(
         )
 
 
-@router.get("/monthly", response_model=MonthlyResponse)
+@router.get(
+    "/monthly",
+    response_model=MonthlyResponse,
+    dependencies=[Depends(check_not_modified)],
+)
 async def get_monthly_summary(
+    response: Response,
     year: Optional[int] = Query(None, description="연도 (기본값: 현재 연도)"),
     month: Optional[int] = Query(None, ge=1, le=12, description="월 (기본값: 현재 월)"),
     user_id: str = Depends(get_current_user_id),
@@ -50,7 +73,8 @@ async def get_monthly_summary(
         return monthly_summary
     except Exception as e:
         logger.error(f"Failed to get monthly summary: {str(e)}", exc_info=True)
-        # 데이터베이스 연결 실패 시 빈 응답 반환 (MVP 수준)
+        # 데이터베이스 연결 실패 시 빈 응답 반환 (MVP 수준, 캐시되지 않도록 ETag 제거)
+        skip_caching(response)
         now = datetime.now()
         target_year = year if year else now.year
         target_month = month if month else now.month
@@ -60,3 +84,131 @@ async def get_monthly_summary(
             month=target_month,
             year=target_year,
         )
+
+
+@router.get(
+    "/timeseries",
+    response_model=TimeseriesResponse,
+    dependencies=[Depends(check_not_modified)],
+)
+async def get_timeseries(
+    granularity: TimeseriesGranularity = Query(
+        TimeseriesGranularity.MONTH, description="집계 단위 (day, week, month, year)"
+    ),
+    start: Optional[date] = Query(None, description="시작 날짜 (기본값: 종료 날짜 기준 최근 구간)"),
+    end: Optional[date] = Query(None, description="종료 날짜 (기본값: 오늘)"),
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db),
+):
+    """기간별 수입/지출 시계열 (차트용, 거래가 없는 구간은 0)"""
+    import logging
+    logger = logging.getLogger(__name__)
+
+    try:
+        return await CalculationService.get_timeseries(
+            db, user_id, granularity, start, end
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    except Exception as e:
+        logger.error(f"Failed to get timeseries: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"데이터베이스 연결에 실패했습니다: {str(e)}",
+        )
+
+
+@router.get(
+    "/categories",
+    response_model=CategoryBreakdownResponse,
+    dependencies=[Depends(check_not_modified)],
+)
+async def get_category_breakdown(
+    start: Optional[date] = Query(None, description="시작 날짜 (기본값: 이번 달 1일)"),
+    end: Optional[date] = Query(None, description="종료 날짜 (기본값: 이번 달 말일)"),
+    transaction_type: Optional[TransactionType] = Query(None, description="거래 유형 필터"),
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db),
+):
+    """카테고리별 수입/지출 합계"""
+    import logging
+    logger = logging.getLogger(__name__)
+
+    try:
+        return await CalculationService.get_category_breakdown(
+            db, user_id, start, end, transaction_type
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    except Exception as e:
+        logger.error(f"Failed to get category breakdown: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"데이터베이스 연결에 실패했습니다: {str(e)}",
+        )
+
+
+@router.get(
+    "/net-worth-history",
+    response_model=NetWorthHistoryResponse,
+    dependencies=[Depends(check_not_modified)],
+)
+async def get_net_worth_history(
+    start: date = Query(..., description="시작 날짜"),
+    end: Optional[date] = Query(None, description="종료 날짜 (기본값: 오늘)"),
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db),
+):
+    """순자산 추이 (가족 그룹 포함, 값이 바뀌는 날짜만 반환)"""
+    import logging
+    logger = logging.getLogger(__name__)
+
+    try:
+        return await SnapshotService.get_net_worth_history(db, user_id, start, end)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    except Exception as e:
+        logger.error(f"Failed to get net worth history: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"데이터베이스 연결에 실패했습니다: {str(e)}",
+        )
+
+
+@router.get(
+    "/insights",
+    response_model=InsightsResponse,
+    dependencies=[Depends(check_not_modified)],
+)
+async def get_insights(
+    start: Optional[date] = Query(None, description="시작 날짜 (기본값: 이번 달 포함 최근 6개월)"),
+    end: Optional[date] = Query(None, description="종료 날짜 (기본값: 오늘)"),
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db),
+):
+    """지출 분석 (이동 평균, 전월 대비 증감, 카테고리별 추세, 이상 지출)"""
+    import logging
+    logger = logging.getLogger(__name__)
+
+    try:
+        return await AnalyticsService.get_insights(db, user_id, start, end)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    except Exception as e:
+        logger.error(f"Failed to get insights: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"데이터베이스 연결에 실패했습니다: {str(e)}",
+        )
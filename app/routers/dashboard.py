@@ -0,0 +1,34 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_db
+from app.dependencies import check_not_modified, get_current_user_id
+from app.schemas.dashboard import DashboardResponse
+from app.services.dashboard_service import DashboardService, DEFAULT_RECENT_TRANSACTIONS
+
+router = APIRouter(prefix="/api/dashboard", tags=["dashboard"])
+
+
+@router.get(
+    "",
+    response_model=DashboardResponse,
+    dependencies=[Depends(check_not_modified)],
+)
+async def get_dashboard(
+    recent_limit: int = Query(
+        DEFAULT_RECENT_TRANSACTIONS, ge=1, le=200, description="최근 거래 개수"
+    ),
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db),
+):
+    """대시보드 조회 (요약, 이번 달 수입/지출, 최근 거래, 카테고리 목록)"""
+    import logging
+    logger = logging.getLogger(__name__)
+
+    try:
+        return await DashboardService.get_dashboard(db, user_id, recent_limit)
+    except Exception as e:
+        logger.error(f"Failed to get dashboard: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"데이터베이스 연결에 실패했습니다: {str(e)}",
+        )
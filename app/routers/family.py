@@ -3,7 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 from typing import Optional
 from app.database import get_db
-from app.dependencies import get_current_user_id
+from app.dependencies import get_current_user_id, get_token_claims
 from app.services.family_service import FamilyService
 from app.schemas.family import (
     FamilyGroupCreate,
@@ -13,7 +13,6 @@ from app.schemas.family import (
     FamilyGroupDetailResponse,
     FamilyMemberWithEmailResponse,
 )
-from jose import jwt
 
 router = APIRouter(prefix="/api/family", tags=["family"])
 
@@ -145,29 +144,14 @@ async def create_family_group(
 
 
 def get_email_from_token(request: Request) -> dict[str, Optional[str]]:
-    """요청 헤더의 JWT 토큰에서 user_id별 이메일 추출"""
+    """요청의 JWT 클레임에서 user_id별 이메일 추출 (verify_token에서 디코딩한 클레임 재사용)"""
     email_map = {}
-    try:
-        auth_header = request.headers.get("Authorization", "")
-        if auth_header.startswith("Bearer "):
-            token = auth_header.replace("Bearer ", "")
-            # JWT 토큰에서 payload 추출
-            payload = jwt.decode(
-                token,
-                key="",
-                options={
-                    "verify_signature": False,
-                    "verify_aud": False,
-                    "verify_exp": False,
-                }
-            )
-            # 현재 사용자의 이메일 추출
-            current_user_id = payload.get("sub")
-            current_email = payload.get("email")
-            if current_user_id and current_email:
-                email_map[current_user_id] = current_email
-    except Exception:
-        pass
+    claims = get_token_claims(request)
+    # 현재 사용자의 이메일 추출
+    current_user_id = claims.get("sub")
+    current_email = claims.get("email")
+    if current_user_id and current_email:
+        email_map[current_user_id] = current_email
     return email_map
 
 
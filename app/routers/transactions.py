@@ -1,41 +1,66 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Response, UploadFile, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 from datetime import date
 from typing import Optional
 from app.database import get_db
-from app.dependencies import get_current_user_id
+from app.dependencies import check_not_modified, get_current_user_id, skip_caching
 from app.schemas.transaction import (
     TransactionCreate,
     TransactionUpdate,
     TransactionResponse,
+    ExportFormat,
+    TransactionImportResponse,
+    TransactionBatchRequest,
+    TransactionBatchResponse,
 )
 from app.models.transaction import TransactionType
-from app.services.transaction_service import TransactionService
+from app.services.transaction_service import TransactionService, DEFAULT_SEARCH_LIMIT
+from app.services.import_service import ImportService
 
 router = APIRouter(prefix="/api/transactions", tags=["transactions"])
 
+# 거래 목록 기본/최대 페이지 크기
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
 
-@router.get("", response_model=list[TransactionResponse])
+
+@router.get(
+    "",
+    response_model=list[TransactionResponse],
+    dependencies=[Depends(check_not_modified)],
+)
 async def get_transactions(
+    response: Response,
     transaction_type: Optional[TransactionType] = Query(None, description="거래 유형 필터"),
     start_date: Optional[date] = Query(None, description="시작 날짜"),
     end_date: Optional[date] = Query(None, description="종료 날짜"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 X-Next-Cursor 헤더)"),
     user_id: str = Depends(get_current_user_id),
     db: AsyncSession = Depends(get_db),
 ):
-    """거래 목록 조회"""
+    """거래 목록 조회 (최신순, 다음 페이지가 있으면 X-Next-Cursor 헤더로 커서 반환)"""
     import logging
     logger = logging.getLogger(__name__)
     
     try:
-        transactions = await TransactionService.get_transactions(
-            db, user_id, transaction_type, start_date, end_date
+        transactions, next_cursor = await TransactionService.get_transaction_page(
+            db, user_id, limit, transaction_type, start_date, end_date, cursor
         )
+        if next_cursor:
+            response.headers["X-Next-Cursor"] = next_cursor
         return transactions
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
     except Exception as e:
         logger.error(f"Failed to get transactions: {str(e)}", exc_info=True)
-        # 데이터베이스 연결 실패 시 빈 배열 반환 (MVP 수준)
+        # 데이터베이스 연결 실패 시 빈 배열 반환 (MVP 수준, 캐시되지 않도록 ETag 제거)
+        skip_caching(response)
         return []
 
 
@@ -55,6 +80,9 @@ async def create_transaction(
             db, transaction_data, user_id
         )
         return transaction
+    except HTTPException:
+        # 없는 카테고리 (404)
+        raise
     except Exception as e:
         logger.error(f"Failed to create transaction: {str(e)}", exc_info=True)
         raise HTTPException(
@@ -63,7 +91,126 @@ async def create_transaction(
         )
 
 
-@router.get("/{transaction_id}", response_model=TransactionResponse)
+@router.get(
+    "/search",
+    response_model=list[TransactionResponse],
+    dependencies=[Depends(check_not_modified)],
+)
+async def search_transactions(
+    q: str = Query(..., min_length=1, max_length=100, description="메모 검색어 (단어 접두사 일치, 여러 단어는 모두 포함)"),
+    transaction_type: Optional[TransactionType] = Query(None, description="거래 유형 필터"),
+    start_date: Optional[date] = Query(None, description="시작 날짜"),
+    end_date: Optional[date] = Query(None, description="종료 날짜"),
+    limit: int = Query(DEFAULT_SEARCH_LIMIT, ge=1, le=MAX_PAGE_SIZE, description="최대 결과 수"),
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db),
+):
+    """거래 메모 검색 (관련도, 최신순)"""
+    import logging
+    logger = logging.getLogger(__name__)
+
+    try:
+        return await TransactionService.search_transactions(
+            db, user_id, q, transaction_type, start_date, end_date, limit
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    except Exception as e:
+        logger.error(f"Failed to search transactions: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"데이터베이스 연결에 실패했습니다: {str(e)}",
+        )
+
+
+@router.get("/export")
+async def export_transactions(
+    format: ExportFormat = Query(ExportFormat.CSV, description="내보내기 형식 (csv, ndjson)"),
+    transaction_type: Optional[TransactionType] = Query(None, description="거래 유형 필터"),
+    start_date: Optional[date] = Query(None, description="시작 날짜"),
+    end_date: Optional[date] = Query(None, description="종료 날짜"),
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db),
+):
+    """거래 내보내기 (전체 기간을 메모리에 올리지 않고 스트리밍)"""
+    import logging
+    logger = logging.getLogger(__name__)
+
+    try:
+        chunks = await TransactionService.export_transactions(
+            db, user_id, format, transaction_type, start_date, end_date
+        )
+    except Exception as e:
+        logger.error(f"Failed to export transactions: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"데이터베이스 연결에 실패했습니다: {str(e)}",
+        )
+
+    # text/csv는 charset=utf-8이 자동으로 붙음
+    media_type = "text/csv" if format == ExportFormat.CSV else "application/x-ndjson; charset=utf-8"
+    filename = f"transactions-{date.today():%Y%m%d}.{format.value}"
+    return StreamingResponse(
+        chunks,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.post("/import", response_model=TransactionImportResponse)
+async def import_transactions(
+    file: UploadFile = File(..., description="CSV 파일 (헤더: date, type, category, amount, memo)"),
+    encoding: str = Query("utf-8", description="파일 인코딩 (은행 거래내역은 cp949인 경우가 많음)"),
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db),
+):
+    """거래 일괄 등록 (CSV, 실패한 행은 줄 번호와 함께 반환)"""
+    import logging
+    logger = logging.getLogger(__name__)
+
+    try:
+        return await ImportService.import_transactions(db, user_id, file.file, encoding)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    except Exception as e:
+        logger.error(f"Failed to import transactions: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"데이터베이스 연결에 실패했습니다: {str(e)}",
+        )
+
+
+@router.post("/batch", response_model=TransactionBatchResponse)
+async def apply_transaction_batch(
+    batch: TransactionBatchRequest,
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db),
+):
+    """거래 일괄 생성/수정/삭제 (한 트랜잭션, 작업별 결과를 요청 순서대로 반환)"""
+    import logging
+    logger = logging.getLogger(__name__)
+
+    try:
+        return await TransactionService.apply_batch(db, batch.operations, user_id)
+    except Exception as e:
+        logger.error(f"Failed to apply transaction batch: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"데이터베이스 연결에 실패했습니다: {str(e)}",
+        )
+
+
+@router.get(
+    "/{transaction_id}",
+    response_model=TransactionResponse,
+    dependencies=[Depends(check_not_modified)],
+)
 async def get_transaction(
     transaction_id: UUID,
     user_id: str = Depends(get_current_user_id),
@@ -1,8 +1,9 @@
 from pydantic import BaseModel, Field
 from datetime import datetime
 from uuid import UUID
-from typing import Optional
+from typing import Annotated, Literal, Optional, Union
 from app.models.asset import AssetType
+from app.schemas.batch import BatchItemResult, MAX_BATCH_OPERATIONS
 
 
 class AssetCreate(BaseModel):
@@ -28,3 +29,38 @@ class AssetResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class AssetBatchCreate(BaseModel):
+    action: Literal["create"]
+    data: AssetCreate
+
+
+class AssetBatchUpdate(BaseModel):
+    action: Literal["update"]
+    id: UUID
+    data: AssetUpdate
+
+
+class AssetBatchDelete(BaseModel):
+    action: Literal["delete"]
+    id: UUID
+
+
+class AssetBatchRequest(BaseModel):
+    operations: list[
+        Annotated[
+            Union[AssetBatchCreate, AssetBatchUpdate, AssetBatchDelete],
+            Field(discriminator="action"),
+        ]
+    ] = Field(..., min_length=1, max_length=MAX_BATCH_OPERATIONS)
+
+
+class AssetBatchItemResult(BatchItemResult):
+    asset: Optional[AssetResponse] = None  # 생성/수정된 자산
+
+
+class AssetBatchResponse(BaseModel):
+    succeeded: int  # 성공한 작업 수
+    failed: int  # 실패한 작업 수
+    results: list[AssetBatchItemResult]  # 요청 순서와 같음
@@ -0,0 +1,21 @@
+from pydantic import BaseModel
+from enum import Enum
+from typing import Optional
+from uuid import UUID
+
+# 배치 요청 1건당 최대 작업 수
+MAX_BATCH_OPERATIONS = 1000
+
+
+class BatchAction(str, Enum):
+    CREATE = "create"
+    UPDATE = "update"
+    DELETE = "delete"
+
+
+class BatchItemResult(BaseModel):
+    index: int  # 요청 operations 내 순서 (0부터)
+    action: BatchAction
+    id: Optional[UUID]  # 대상 id (생성은 새 id, 실패한 생성은 None)
+    status: int  # 201 생성, 200 수정, 204 삭제, 400 잘못된 요청, 404 없음
+    error: Optional[str] = None  # 실패 사유
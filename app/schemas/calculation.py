@@ -1,4 +1,9 @@
 from pydantic import BaseModel
+from datetime import date
+from enum import Enum
+from typing import Optional
+from uuid import UUID
+from app.models.transaction import TransactionType
 
 
 class SummaryResponse(BaseModel):
@@ -12,3 +17,95 @@ class MonthlyResponse(BaseModel):
     total_expense: float  # 이번 달 지출 합계
     month: int  # 월 (1-12)
     year: int  # 연도
+
+
+class TimeseriesGranularity(str, Enum):
+    DAY = "day"  # 일별
+    WEEK = "week"  # 주별 (월요일 시작)
+    MONTH = "month"  # 월별
+    YEAR = "year"  # 연별
+
+
+class TimeseriesPoint(BaseModel):
+    period_start: date  # 구간 시작일
+    total_income: float  # 구간 수입 합계
+    total_expense: float  # 구간 지출 합계
+    net: float  # 수입 - 지출
+
+
+class TimeseriesResponse(BaseModel):
+    granularity: TimeseriesGranularity
+    start: date  # 조회 시작일 (포함)
+    end: date  # 조회 종료일 (포함)
+    points: list[TimeseriesPoint]  # 거래가 없는 구간도 0으로 포함
+
+
+class CategoryBreakdownItem(BaseModel):
+    category_id: UUID
+    category_name: Optional[str]  # 카테고리 이름 (삭제된 카테고리는 None)
+    type: TransactionType  # INCOME or EXPENSE
+    total: float  # 카테고리 합계
+    count: int  # 거래 수
+    share: float  # 같은 유형 합계 대비 비율 (0 ~ 1)
+
+
+class CategoryBreakdownResponse(BaseModel):
+    start: date  # 조회 시작일 (포함)
+    end: date  # 조회 종료일 (포함)
+    total_income: float  # 기간 수입 합계
+    total_expense: float  # 기간 지출 합계
+    items: list[CategoryBreakdownItem]  # 유형별, 합계 내림차순
+
+
+class NetWorthPoint(BaseModel):
+    date: date  # 이 날짜부터 적용되는 값
+    total_assets: float  # 총 자산
+    total_liabilities: float  # 총 부채
+    net_worth: float  # 순자산
+
+
+class NetWorthHistoryResponse(BaseModel):
+    start: date  # 조회 시작일 (포함)
+    end: date  # 조회 종료일 (포함)
+    points: list[NetWorthPoint]  # 값이 바뀌는 날짜만 포함 (계단형)
+
+
+class DailySpendingPoint(BaseModel):
+    date: date
+    total_expense: float  # 당일 지출 합계
+    rolling_7: float  # 최근 7일 일평균 지출
+    rolling_30: float  # 최근 30일 일평균 지출
+
+
+class MonthlySpendingPoint(BaseModel):
+    month: date  # 월 시작일
+    total_income: float  # 월 수입 합계
+    total_expense: float  # 월 지출 합계
+    expense_change: Optional[float]  # 전월 대비 지출 증감 (첫 달은 None)
+    expense_change_rate: Optional[float]  # 전월 대비 지출 증감률 (전월 지출이 0이면 None)
+
+
+class CategoryTrend(BaseModel):
+    category_id: UUID
+    category_name: Optional[str]  # 카테고리 이름 (삭제된 카테고리는 None)
+    average_monthly: float  # 월평균 지출
+    slope: float  # 월별 지출 추세 (월당 증감, 최소제곱 기울기)
+
+
+class SpendingAnomaly(BaseModel):
+    transaction_id: UUID
+    date: date
+    category_id: UUID
+    category_name: Optional[str]
+    amount: float
+    z_score: float  # 같은 카테고리 지출 평균 대비 표준편차 배수
+
+
+class InsightsResponse(BaseModel):
+    start: date  # 조회 시작일 (포함)
+    end: date  # 조회 종료일 (포함)
+    transaction_count: int  # 분석한 거래 수
+    daily: list[DailySpendingPoint]  # 일별 지출과 이동 평균 (거래가 없는 날도 포함)
+    monthly: list[MonthlySpendingPoint]  # 월별 합계와 전월 대비 증감
+    category_trends: list[CategoryTrend]  # 지출 카테고리별 추세 (기울기 내림차순)
+    anomalies: list[SpendingAnomaly]  # 이상 지출 (z_score 내림차순)
@@ -0,0 +1,11 @@
+from pydantic import BaseModel
+from app.schemas.calculation import SummaryResponse, MonthlyResponse
+from app.schemas.transaction import TransactionResponse
+from app.schemas.category import CategoryResponse
+
+
+class DashboardResponse(BaseModel):
+    summary: SummaryResponse  # 전체 요약 (총 자산, 총 부채, 순자산)
+    monthly: MonthlyResponse  # 이번 달 수입/지출 합계
+    recent_transactions: list[TransactionResponse]  # 최근 거래 (최신순)
+    categories: list[CategoryResponse]  # 전체 카테고리 목록
@@ -1,9 +1,19 @@
 from pydantic import BaseModel, Field
 from datetime import date, datetime
 from uuid import UUID
-from typing import Optional
+from enum import Enum
+from typing import Annotated, Literal, Optional, Union
 from app.models.transaction import TransactionType
 from app.schemas.category import CategoryResponse
+from app.schemas.batch import BatchItemResult, MAX_BATCH_OPERATIONS
+
+# 필드 이름 date가 클래스 본문에서 타입 date를 가리므로 (Optional[date] = None → NoneType) 별칭 사용
+DateType = date
+
+
+class ExportFormat(str, Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"  # 한 줄에 JSON 객체 하나
 
 
 class TransactionCreate(BaseModel):
@@ -18,7 +28,7 @@ class TransactionUpdate(BaseModel):
     type: Optional[TransactionType] = None
     amount: Optional[float] = Field(None, gt=0)
     category_id: Optional[UUID] = None  # 카테고리 ID
-    date: Optional[date] = None
+    date: Optional[DateType] = None
     memo: Optional[str] = Field(None, max_length=500)
 
 
@@ -36,3 +46,51 @@ class TransactionResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class TransactionImportError(BaseModel):
+    line: int  # CSV 줄 번호 (헤더 = 1)
+    error: str  # 오류 내용
+
+
+class TransactionImportResponse(BaseModel):
+    total_rows: int  # 읽은 데이터 행 수
+    imported: int  # 등록된 거래 수
+    skipped: int  # 이미 있는 id라서 건너뛴 행 수
+    failed: int  # 검증에 실패한 행 수
+    errors: list[TransactionImportError]  # 실패한 행 (최대 100건)
+
+
+class TransactionBatchCreate(BaseModel):
+    action: Literal["create"]
+    data: TransactionCreate
+
+
+class TransactionBatchUpdate(BaseModel):
+    action: Literal["update"]
+    id: UUID
+    data: TransactionUpdate
+
+
+class TransactionBatchDelete(BaseModel):
+    action: Literal["delete"]
+    id: UUID
+
+
+class TransactionBatchRequest(BaseModel):
+    operations: list[
+        Annotated[
+            Union[TransactionBatchCreate, TransactionBatchUpdate, TransactionBatchDelete],
+            Field(discriminator="action"),
+        ]
+    ] = Field(..., min_length=1, max_length=MAX_BATCH_OPERATIONS)
+
+
+class TransactionBatchItemResult(BatchItemResult):
+    transaction: Optional[TransactionResponse] = None  # 생성/수정된 거래
+
+
+class TransactionBatchResponse(BaseModel):
+    succeeded: int  # 성공한 작업 수
+    failed: int  # 실패한 작업 수
+    results: list[TransactionBatchItemResult]  # 요청 순서와 같음
@@ -0,0 +1,268 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, cast, BigInteger, Integer, String
+from datetime import date
+from typing import NamedTuple, Optional
+from uuid import UUID
+from app.models.transaction import Transaction, TransactionType
+from app.services import family_service
+from app.services.category_service import CategoryService
+from app.schemas.calculation import (
+    DailySpendingPoint,
+    MonthlySpendingPoint,
+    CategoryTrend,
+    SpendingAnomaly,
+    InsightsResponse,
+)
+import numpy as np
+
+# 분석 기간 최대 일수 (2년)
+MAX_INSIGHTS_DAYS = 731
+# 기간을 지정하지 않았을 때 분석할 개월 수 (이번 달 포함)
+DEFAULT_INSIGHTS_MONTHS = 6
+# 이상 지출 기준 (같은 카테고리 평균 대비 표준편차 배수, 최소 표본 수)
+ANOMALY_Z_THRESHOLD = 3.0
+ANOMALY_MIN_SAMPLES = 5
+MAX_ANOMALIES = 50
+
+
+class TransactionArrays(NamedTuple):
+    """분석 기간 거래를 열 단위로 담은 배열 (모든 배열의 행 순서 동일)"""
+    ids: list[str]  # 거래 id 문자열 (이상 지출 출력 시에만 사용)
+    day: np.ndarray  # 날짜 (date.toordinal() 일 번호, int64)
+    month: np.ndarray  # 시작 월 기준 월 번호 (0부터, int64)
+    amount: np.ndarray  # 금액 (최소 단위 1/100, int64)
+    is_expense: np.ndarray  # 지출 여부 (bool)
+    category: np.ndarray  # 카테고리 코드 (category_ids 인덱스, int64)
+    category_ids: list[Optional[UUID]]  # 카테고리 코드 → 카테고리 id
+
+
+class AnalyticsService:
+    """거래 배열(NumPy) 기반 지출 분석 (이동 평균, 전월 대비, 카테고리 추세, 이상 지출)"""
+
+    @staticmethod
+    def default_window(end: date) -> tuple[date, date]:
+        """기본 분석 기간: 종료일이 속한 달을 포함한 최근 DEFAULT_INSIGHTS_MONTHS개월"""
+        month_number = end.year * 12 + end.month - 1 - (DEFAULT_INSIGHTS_MONTHS - 1)
+        return date(month_number // 12, month_number % 12 + 1, 1), end
+
+    @staticmethod
+    async def load_arrays(
+        db: AsyncSession, user_id: str, start: date, end: date
+    ) -> TransactionArrays:
+        """
+        기간 [start, end] 의 거래를 배열로 로드 (가족 그룹 포함)
+        일/월 번호, 최소 단위 금액, 카테고리 코드는 SQL에서 정수로 계산해 가져오고,
+        id는 행마다 UUID 변환을 하지 않도록 문자열로 가져옵니다.
+        """
+        ledger_filter = await family_service.FamilyService.get_ledger_filter(
+            db, Transaction, user_id
+        )
+        month_number = (
+            func.extract("year", Transaction.date) * 12 + func.extract("month", Transaction.date)
+        )
+        # ORM 결과 처리를 거치지 않도록 Core 연결에서 실행 (행 수가 많으므로)
+        connection = await db.connection()
+        result = await connection.execute(
+            select(
+                cast(Transaction.id, String),
+                cast(Transaction.category_id, String),
+                cast(Transaction.date - start, Integer),
+                cast(month_number, Integer) - (start.year * 12 + start.month),
+                cast(func.round(Transaction.amount * 100), BigInteger),
+                Transaction.type == TransactionType.EXPENSE,
+            ).where(
+                ledger_filter,
+                Transaction.date >= start,
+                Transaction.date <= end,
+            )
+        )
+        rows = result.all()
+        count = len(rows)
+        ids, category_ids, day, month, amount, is_expense = zip(*rows) if rows else ((),) * 6
+
+        # 카테고리 id 문자열을 코드로 변환 (정렬 기반, 카테고리 수만큼만 UUID 변환)
+        category_keys, category = np.unique(
+            np.array(category_ids, dtype=object).astype(str), return_inverse=True
+        )
+        return TransactionArrays(
+            ids=list(ids),
+            day=np.fromiter(day, dtype=np.int64, count=count) + start.toordinal(),
+            month=np.fromiter(month, dtype=np.int64, count=count),
+            amount=np.fromiter(amount, dtype=np.int64, count=count),
+            is_expense=np.fromiter(is_expense, dtype=bool, count=count),
+            category=category.astype(np.int64).reshape(-1),
+            category_ids=[
+                UUID(key) if key != "None" else None for key in category_keys.tolist()
+            ],
+        )
+
+    @staticmethod
+    def rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+        """누적합 기반 이동 평균 (앞부분은 가능한 만큼의 구간으로 평균)"""
+        cumulative = np.concatenate(([0.0], np.cumsum(values)))
+        upper = np.arange(1, len(values) + 1)
+        lower = np.maximum(upper - window, 0)
+        return (cumulative[upper] - cumulative[lower]) / (upper - lower)
+
+    @staticmethod
+    def trend_slopes(matrix: np.ndarray) -> np.ndarray:
+        """행별(카테고리별) 최소제곱 기울기 (열 = 연속된 월)"""
+        x = np.arange(matrix.shape[1]) - (matrix.shape[1] - 1) / 2
+        denominator = x @ x
+        if denominator == 0:
+            return np.zeros(matrix.shape[0])
+        # x의 합이 0이므로 행 평균을 빼지 않아도 기울기는 같음
+        return (matrix @ x) / denominator
+
+    @staticmethod
+    def anomaly_scores(amount: np.ndarray, category: np.ndarray, n_categories: int) -> np.ndarray:
+        """
+        지출별 같은 카테고리 평균 대비 z-score
+        표본이 ANOMALY_MIN_SAMPLES 미만이거나 편차가 없는 카테고리는 0입니다.
+        """
+        counts = np.bincount(category, minlength=n_categories)
+        sums = np.bincount(category, weights=amount, minlength=n_categories)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            means = sums / counts
+            deviations = amount - means[category]
+            stds = np.sqrt(
+                np.bincount(category, weights=deviations ** 2, minlength=n_categories) / counts
+            )
+            scores = deviations / stds[category]
+        valid = (counts[category] >= ANOMALY_MIN_SAMPLES) & (stds[category] > 0)
+        return np.where(valid, scores, 0.0)
+
+    @staticmethod
+    async def get_insights(
+        db: AsyncSession,
+        user_id: str,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+    ) -> InsightsResponse:
+        """
+        지출 분석 (가족 그룹 포함, 기본값: 이번 달 포함 최근 6개월)
+        거래를 배열로 한 번 로드한 뒤 bincount/cumsum/행렬 연산으로 계산합니다 (거래 단위 Python 반복 없음).
+        """
+        if end is None:
+            end = date.today()
+        if start is None:
+            start, end = AnalyticsService.default_window(end)
+        if start > end:
+            raise ValueError("시작 날짜가 종료 날짜보다 늦습니다.")
+        n_days = (end - start).days + 1
+        if n_days > MAX_INSIGHTS_DAYS:
+            raise ValueError(f"분석 기간이 너무 깁니다 (최대 {MAX_INSIGHTS_DAYS}일).")
+        n_months = (end.year * 12 + end.month) - (start.year * 12 + start.month) + 1
+
+        arrays = await AnalyticsService.load_arrays(db, user_id, start, end)
+        categories = await CategoryService.get_category_map(db)
+        n_categories = len(arrays.category_ids)
+
+        expense = arrays.is_expense
+        income = ~expense
+        expense_amount = arrays.amount[expense].astype(np.float64)
+        expense_category = arrays.category[expense]
+        expense_month = arrays.month[expense]
+
+        # 일별 지출과 이동 평균
+        daily_expense = np.bincount(
+            arrays.day[expense] - start.toordinal(), weights=expense_amount, minlength=n_days
+        )
+        rolling_7 = AnalyticsService.rolling_mean(daily_expense, 7)
+        rolling_30 = AnalyticsService.rolling_mean(daily_expense, 30)
+
+        # 월별 합계와 전월 대비 증감
+        monthly_income = np.bincount(
+            arrays.month[income], weights=arrays.amount[income], minlength=n_months
+        )
+        monthly_expense = np.bincount(expense_month, weights=expense_amount, minlength=n_months)
+        previous_expense = np.concatenate(([np.nan], monthly_expense[:-1]))
+        expense_change = monthly_expense - previous_expense
+        expense_change_rate = np.divide(
+            expense_change,
+            previous_expense,
+            out=np.full(n_months, np.nan),
+            where=previous_expense > 0,
+        )
+
+        # 카테고리 × 월 지출 행렬로 카테고리별 추세
+        category_month = np.bincount(
+            expense_category * n_months + expense_month,
+            weights=expense_amount,
+            minlength=n_categories * n_months,
+        ).reshape(n_categories, n_months)
+        slopes = AnalyticsService.trend_slopes(category_month)
+        averages = category_month.mean(axis=1)
+        spent = np.flatnonzero(category_month.sum(axis=1) > 0)
+        trend_order = spent[np.argsort(-slopes[spent], kind="stable")]
+
+        # 이상 지출 (z-score 상위)
+        scores = AnalyticsService.anomaly_scores(expense_amount, expense_category, n_categories)
+        flagged = np.flatnonzero(scores > ANOMALY_Z_THRESHOLD)
+        flagged = flagged[np.argsort(-scores[flagged], kind="stable")][:MAX_ANOMALIES]
+        anomaly_rows = np.flatnonzero(expense)[flagged]
+
+        def category_name(category_id: Optional[UUID]) -> Optional[str]:
+            category = categories.get(category_id)
+            return category.name if category else None
+
+        daily_dates = [date.fromordinal(start.toordinal() + offset) for offset in range(n_days)]
+        month_starts = [
+            date((start.year * 12 + start.month - 1 + offset) // 12,
+                 (start.month - 1 + offset) % 12 + 1, 1)
+            for offset in range(n_months)
+        ]
+        return InsightsResponse(
+            start=start,
+            end=end,
+            transaction_count=len(arrays.ids),
+            daily=[
+                DailySpendingPoint(
+                    date=day, total_expense=total, rolling_7=avg_7, rolling_30=avg_30
+                )
+                for day, total, avg_7, avg_30 in zip(
+                    daily_dates,
+                    (daily_expense / 100).tolist(),
+                    (rolling_7 / 100).round(2).tolist(),
+                    (rolling_30 / 100).round(2).tolist(),
+                )
+            ],
+            monthly=[
+                MonthlySpendingPoint(
+                    month=month,
+                    total_income=total_income,
+                    total_expense=total_expense,
+                    expense_change=None if np.isnan(change) else change,
+                    expense_change_rate=None if np.isnan(rate) else round(rate, 4),
+                )
+                for month, total_income, total_expense, change, rate in zip(
+                    month_starts,
+                    (monthly_income / 100).tolist(),
+                    (monthly_expense / 100).tolist(),
+                    (expense_change / 100).tolist(),
+                    expense_change_rate.tolist(),
+                )
+            ],
+            category_trends=[
+                CategoryTrend(
+                    category_id=arrays.category_ids[code],
+                    category_name=category_name(arrays.category_ids[code]),
+                    average_monthly=round(averages[code] / 100, 2),
+                    slope=round(slopes[code] / 100, 2),
+                )
+                for code in trend_order.tolist()
+                if arrays.category_ids[code] is not None
+            ],
+            anomalies=[
+                SpendingAnomaly(
+                    transaction_id=arrays.ids[row],
+                    date=date.fromordinal(int(arrays.day[row])),
+                    category_id=arrays.category_ids[arrays.category[row]],
+                    category_name=category_name(arrays.category_ids[arrays.category[row]]),
+                    amount=arrays.amount[row] / 100,
+                    z_score=round(float(score), 2),
+                )
+                for row, score in zip(anomaly_rows.tolist(), scores[flagged].tolist())
+                if arrays.category_ids[arrays.category[row]] is not None
+            ],
+        )
@@ -1,25 +1,48 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, or_
-from uuid import UUID
+from sqlalchemy import select, func, insert, update, delete, values, column, literal
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from collections import Counter
+from decimal import Decimal
+from typing import NamedTuple, Optional, Union
+from uuid import UUID, uuid4
 from fastapi import HTTPException, status
 from app.models.asset import Asset, AssetType
-from app.schemas.asset import AssetCreate, AssetUpdate
+from app.schemas.asset import (
+    AssetCreate,
+    AssetUpdate,
+    AssetResponse,
+    AssetBatchCreate,
+    AssetBatchUpdate,
+    AssetBatchDelete,
+    AssetBatchItemResult,
+    AssetBatchResponse,
+)
+from app.schemas.batch import BatchAction
 from app.services import family_service
+from app.services.snapshot_service import SnapshotService
+from app.services.data_version_service import DataVersionService
+
+
+class AssetTotals(NamedTuple):
+    """자산 요약 집계 결과"""
+    total_assets: float  # 총 자산 (CASH 합계)
+    total_liabilities: float  # 총 부채 (LOAN 합계)
+    net_worth: float  # 순자산
 
 
 class AssetService:
     @staticmethod
     async def get_assets(db: AsyncSession, user_id: str) -> list[Asset]:
         """사용자의 모든 자산 조회 (가족 그룹 포함)"""
-        # 가족 그룹의 모든 구성원 user_id 가져오기
-        family_user_ids = await family_service.FamilyService.get_family_member_user_ids(
-            db, user_id
+        # 가족 가계부 조건 (가족 그룹 id 또는 본인 user_id, 단일 키)
+        ledger_filter = await family_service.FamilyService.get_ledger_filter(
+            db, Asset, user_id
         )
         
         # 가족 그룹의 모든 구성원 자산 조회
         result = await db.execute(
             select(Asset)
-            .where(Asset.user_id.in_(family_user_ids))
+            .where(ledger_filter)
             .order_by(Asset.created_at.desc())
         )
         return result.scalars().all()
@@ -27,15 +50,15 @@ class AssetService:
     @staticmethod
     async def get_asset_by_id(db: AsyncSession, asset_id: UUID, user_id: str) -> Asset:
         """특정 자산 조회 (가족 그룹 포함)"""
-        # 가족 그룹의 모든 구성원 user_id 가져오기
-        family_user_ids = await family_service.FamilyService.get_family_member_user_ids(
-            db, user_id
+        # 가족 가계부 조건 (가족 그룹 id 또는 본인 user_id, 단일 키)
+        ledger_filter = await family_service.FamilyService.get_ledger_filter(
+            db, Asset, user_id
         )
         
         result = await db.execute(
             select(Asset).where(
                 Asset.id == asset_id,
-                Asset.user_id.in_(family_user_ids)
+                ledger_filter
             )
         )
         asset = result.scalar_one_or_none()
@@ -48,102 +71,287 @@ class AssetService:
 
     @staticmethod
     async def create_asset(db: AsyncSession, asset_data: AssetCreate, user_id: str) -> Asset:
-        """자산 생성"""
-        asset = Asset(
-            user_id=user_id,
-            type=asset_data.type,
-            name=asset_data.name,
-            amount=asset_data.amount,
+        """자산 생성 (INSERT ... RETURNING 한 문장)"""
+        asset = await db.scalar(
+            insert(Asset)
+            .values(
+                user_id=user_id,
+                # 가족 그룹은 캐시가 아니라 쓰는 시점의 DB 값으로 (다른 프로세스의 구성 변경 반영)
+                family_group_id=family_service.FamilyService.family_group_id_subquery(user_id),
+                type=asset_data.type,
+                name=asset_data.name,
+                amount=asset_data.amount,
+            )
+            .returning(Asset)
         )
-        db.add(asset)
+        # 순자산 추이용 일일 스냅샷 (같은 DB 트랜잭션)
+        await SnapshotService.record_snapshot(db, user_id)
+        await DataVersionService.bump(db, user_id, [asset.family_group_id])
         await db.commit()
-        await db.refresh(asset)  # 생성된 ID를 가져오기 위해 필요
         return asset
 
     @staticmethod
     async def update_asset(
         db: AsyncSession, asset_id: UUID, asset_data: AssetUpdate, user_id: str
     ) -> Asset:
-        """자산 수정 (본인이 생성한 자산만 수정 가능)"""
-        # 본인이 생성한 자산만 수정 가능
-        result = await db.execute(
-            select(Asset).where(
+        """자산 수정 (본인이 생성한 자산만 수정 가능, UPDATE ... RETURNING 한 문장)"""
+        changes = {
+            field: value
+            for field, value in (
+                ("type", asset_data.type),
+                ("name", asset_data.name),
+                ("amount", asset_data.amount),
+            )
+            if value is not None
+        }
+        asset = await db.scalar(
+            update(Asset)
+            .where(
                 Asset.id == asset_id,
                 Asset.user_id == user_id  # 본인 것만 수정 가능
             )
+            .values(**changes, updated_at=func.now())
+            .returning(Asset)
+            .execution_options(synchronize_session=False)
         )
-        asset = result.scalar_one_or_none()
         if not asset:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Asset not found",
             )
 
-        if asset_data.type is not None:
-            asset.type = asset_data.type
-        if asset_data.name is not None:
-            asset.name = asset_data.name
-        if asset_data.amount is not None:
-            asset.amount = asset_data.amount
-
+        # 순자산 추이용 일일 스냅샷 (같은 DB 트랜잭션)
+        await SnapshotService.record_snapshot(db, user_id)
+        await DataVersionService.bump(db, user_id, [asset.family_group_id])
         await db.commit()
-        # refresh 제거 (변경사항이 이미 반영되어 있음)
         return asset
 
     @staticmethod
     async def delete_asset(db: AsyncSession, asset_id: UUID, user_id: str) -> None:
-        """자산 삭제 (가족 그룹 포함, 본인이 생성한 자산만 삭제 가능)"""
-        # 가족 그룹의 모든 구성원 user_id 가져오기
-        family_user_ids = await family_service.FamilyService.get_family_member_user_ids(
-            db, user_id
-        )
-        
+        """자산 삭제 (본인이 생성한 자산만 삭제 가능, DELETE ... RETURNING 한 문장)"""
         # 본인이 생성한 자산만 삭제 가능 (가족 그룹 내에서도)
         result = await db.execute(
-            select(Asset).where(
-                Asset.id == asset_id,
-                Asset.user_id == user_id  # 본인 것만 삭제 가능
-            )
+            delete(Asset)
+            .where(Asset.id == asset_id, Asset.user_id == user_id)
+            .returning(Asset.family_group_id)
+            .execution_options(synchronize_session=False)
         )
-        asset = result.scalar_one_or_none()
-        if not asset:
+        deleted = result.one_or_none()
+        if deleted is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Asset not found",
             )
-        await db.delete(asset)
+        # 순자산 추이용 일일 스냅샷 (같은 DB 트랜잭션)
+        await SnapshotService.record_snapshot(db, user_id)
+        await DataVersionService.bump(db, user_id, [deleted.family_group_id])
         await db.commit()
 
     @staticmethod
-    async def get_total_assets(db: AsyncSession, user_id: str) -> float:
-        """총 자산 계산 (CASH 타입의 합계, 가족 그룹 포함)"""
-        # 가족 그룹의 모든 구성원 user_id 가져오기
-        family_user_ids = await family_service.FamilyService.get_family_member_user_ids(
-            db, user_id
+    async def apply_batch(
+        db: AsyncSession,
+        operations: list[Union[AssetBatchCreate, AssetBatchUpdate, AssetBatchDelete]],
+        user_id: str,
+    ) -> AssetBatchResponse:
+        """
+        자산 생성/수정/삭제 일괄 처리 (한 DB 트랜잭션, 본인이 생성한 자산만 수정/삭제 가능)
+        대상 조회 1번 후 DELETE ... IN, UPDATE ... FROM (VALUES ...), 다중 행 INSERT를 실행하고
+        스냅샷은 마지막에 한 번만 기록합니다.
+        실패한 작업(없는 자산, 같은 id 중복)은 건너뛰고 결과에 표시합니다.
+        """
+        table = Asset.__table__
+        results: list[Optional[AssetBatchItemResult]] = [None] * len(operations)
+
+        # 수정/삭제 대상 한 번에 조회
+        target_counts = Counter(
+            operation.id for operation in operations if operation.action != BatchAction.CREATE
         )
-        
-        result = await db.execute(
-            select(Asset.amount).where(
-                Asset.user_id.in_(family_user_ids),
-                Asset.type == AssetType.CASH
+        existing = {}
+        if target_counts:
+            # 행 잠금 후 읽으므로 커밋 전까지 다른 요청이 대상을 바꾸거나 지우지 못함
+            # (id 순서로 잠가 겹치는 배치끼리 교착되지 않도록)
+            result = await db.execute(
+                select(table)
+                .where(table.c.id.in_(list(target_counts)), table.c.user_id == user_id)
+                .order_by(table.c.id)
+                .with_for_update()
             )
-        )
-        amounts = result.scalars().all()
-        return float(sum(amounts)) if amounts else 0.0
+            existing = {row.id: row for row in result}
+
+        def fail(index: int, operation, status_code: int, error: str) -> None:
+            results[index] = AssetBatchItemResult(
+                index=index,
+                action=operation.action,
+                id=getattr(operation, "id", None),
+                status=status_code,
+                error=error,
+            )
+
+        inserts: dict[UUID, int] = {}
+        insert_rows = []
+        updates: dict[UUID, int] = {}
+        update_rows = []
+        deletes: dict[UUID, int] = {}
+
+        for index, operation in enumerate(operations):
+            if operation.action == BatchAction.CREATE:
+                data = operation.data
+                asset_id = uuid4()
+                inserts[asset_id] = index
+                insert_rows.append((asset_id, data.type, data.name, Decimal(str(data.amount))))
+                continue
+
+            if target_counts[operation.id] > 1:
+                fail(index, operation, status.HTTP_400_BAD_REQUEST, "같은 id에 대한 작업이 여러 번 있습니다.")
+                continue
+            current = existing.get(operation.id)
+            if current is None:
+                fail(index, operation, status.HTTP_404_NOT_FOUND, "Asset not found")
+                continue
+
+            if operation.action == BatchAction.DELETE:
+                deletes[operation.id] = index
+                continue
+
+            data = operation.data
+            updates[operation.id] = index
+            update_rows.append(
+                (
+                    current.id,
+                    data.type if data.type is not None else current.type,
+                    data.name if data.name is not None else current.name,
+                    Decimal(str(data.amount)) if data.amount is not None else current.amount,
+                )
+            )
+
+        deleted_rows = []
+        changed_rows = []
+        if deletes:
+            result = await db.execute(
+                delete(table)
+                .where(table.c.id.in_(list(deletes)), table.c.user_id == user_id)
+                .returning(table.c.id, table.c.family_group_id)
+            )
+            deleted_rows = result.all()
+        deleted_ids = {row.id for row in deleted_rows}
+        if update_rows:
+            batch = values(
+                column("id", PGUUID(as_uuid=True)),
+                column("type", table.c.type.type),
+                column("name", table.c.name.type),
+                column("amount", table.c.amount.type),
+                name="batch",
+            ).data(update_rows)
+            result = await db.execute(
+                update(table)
+                .where(table.c.id == batch.c.id, table.c.user_id == user_id)
+                .values(
+                    type=batch.c.type,
+                    name=batch.c.name,
+                    amount=batch.c.amount,
+                    updated_at=func.now(),
+                )
+                .returning(*table.c)
+            )
+            changed_rows.extend(result.all())
+        if insert_rows:
+            rows = values(
+                column("id", PGUUID(as_uuid=True)),
+                column("type", table.c.type.type),
+                column("name", table.c.name.type),
+                column("amount", table.c.amount.type),
+                name="rows",
+            ).data(insert_rows)
+            # 가족 그룹은 쓰는 시점의 DB 값 (상관 없는 서브쿼리이므로 문장당 한 번 계산)
+            result = await db.execute(
+                insert(table)
+                .from_select(
+                    ["id", "user_id", "family_group_id", "type", "name", "amount"],
+                    select(
+                        rows.c.id,
+                        literal(user_id),
+                        family_service.FamilyService.family_group_id_subquery(user_id),
+                        rows.c.type,
+                        rows.c.name,
+                        rows.c.amount,
+                    ),
+                )
+                .returning(*table.c)
+            )
+            changed_rows.extend(result.all())
+
+        # 조회 후 사라진 대상은 404
+        changed_ids = deleted_ids | {row.id for row in changed_rows}
+        for asset_id, index in {**deletes, **updates}.items():
+            if asset_id not in changed_ids:
+                fail(index, operations[index], status.HTTP_404_NOT_FOUND, "Asset not found")
+
+        if changed_ids:
+            # 순자산 추이용 일일 스냅샷 (같은 DB 트랜잭션, 배치당 한 번)
+            await SnapshotService.record_snapshot(db, user_id)
+            await DataVersionService.bump(
+                db,
+                user_id,
+                {row.family_group_id for row in deleted_rows}
+                | {row.family_group_id for row in changed_rows},
+            )
+            await db.commit()
+
+        for asset_id in deleted_ids:
+            index = deletes[asset_id]
+            results[index] = AssetBatchItemResult(
+                index=index, action=BatchAction.DELETE, id=asset_id, status=status.HTTP_204_NO_CONTENT
+            )
+        for row in changed_rows:
+            created = row.id in inserts
+            index = inserts[row.id] if created else updates[row.id]
+            results[index] = AssetBatchItemResult(
+                index=index,
+                action=BatchAction.CREATE if created else BatchAction.UPDATE,
+                id=row.id,
+                status=status.HTTP_201_CREATED if created else status.HTTP_200_OK,
+                asset=AssetResponse.model_validate(row),
+            )
+
+        failed = sum(1 for item in results if item.error is not None)
+        return AssetBatchResponse(succeeded=len(results) - failed, failed=failed, results=results)
 
     @staticmethod
-    async def get_total_liabilities(db: AsyncSession, user_id: str) -> float:
-        """총 부채 계산 (LOAN 타입의 합계, 가족 그룹 포함)"""
-        # 가족 그룹의 모든 구성원 user_id 가져오기
-        family_user_ids = await family_service.FamilyService.get_family_member_user_ids(
-            db, user_id
+    async def get_asset_totals(db: AsyncSession, user_id: str) -> AssetTotals:
+        """
+        총 자산 / 총 부채 / 순자산 계산 (가족 그룹 포함)
+        SUM ... FILTER로 한 번의 집계 쿼리에서 계산합니다 (자산 행을 가져오지 않음).
+        """
+        # 가족 가계부 조건 (가족 그룹 id 또는 본인 user_id, 단일 키)
+        ledger_filter = await family_service.FamilyService.get_ledger_filter(
+            db, Asset, user_id
         )
-        
+
         result = await db.execute(
-            select(Asset.amount).where(
-                Asset.user_id.in_(family_user_ids),
-                Asset.type == AssetType.LOAN
-            )
+            select(
+                func.coalesce(
+                    func.sum(Asset.amount).filter(Asset.type == AssetType.CASH), 0
+                ),
+                func.coalesce(
+                    func.sum(Asset.amount).filter(Asset.type == AssetType.LOAN), 0
+                ),
+            ).where(ledger_filter)
         )
-        amounts = result.scalars().all()
-        return float(sum(amounts)) if amounts else 0.0
+        total_assets, total_liabilities = result.one()
+        return AssetTotals(
+            total_assets=float(total_assets),
+            total_liabilities=float(total_liabilities),
+            net_worth=float(total_assets - total_liabilities),
+        )
+
+    @staticmethod
+    async def get_total_assets(db: AsyncSession, user_id: str) -> float:
+        """총 자산 계산 (CASH 타입의 합계, 가족 그룹 포함)"""
+        totals = await AssetService.get_asset_totals(db, user_id)
+        return totals.total_assets
+
+    @staticmethod
+    async def get_total_liabilities(db: AsyncSession, user_id: str) -> float:
+        """총 부채 계산 (LOAN 타입의 합계, 가족 그룹 포함)"""
+        totals = await AssetService.get_asset_totals(db, user_id)
+        return totals.total_liabilities
@@ -1,23 +1,44 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from datetime import datetime
+from sqlalchemy import select, func, cast, Date, DateTime
+from datetime import date, datetime, timedelta
 from typing import Optional
+from app.models.transaction import Transaction, TransactionType
+from app.services import family_service
 from app.services.asset_service import AssetService
 from app.services.transaction_service import TransactionService
-from app.schemas.calculation import SummaryResponse, MonthlyResponse
+from app.services.category_service import CategoryService
+from app.services.rollup_service import RollupService
+from app.schemas.calculation import (
+    SummaryResponse,
+    MonthlyResponse,
+    TimeseriesGranularity,
+    TimeseriesPoint,
+    TimeseriesResponse,
+    CategoryBreakdownItem,
+    CategoryBreakdownResponse,
+)
+
+# 시계열 조회 최대 구간 수 (일별 1년치 + 여유)
+MAX_TIMESERIES_BUCKETS = 400
+# 기간을 지정하지 않았을 때 기본 구간 수
+DEFAULT_TIMESERIES_BUCKETS = {
+    TimeseriesGranularity.DAY: 30,
+    TimeseriesGranularity.WEEK: 12,
+    TimeseriesGranularity.MONTH: 12,
+    TimeseriesGranularity.YEAR: 5,
+}
 
 
 class CalculationService:
     @staticmethod
     async def get_summary(db: AsyncSession, user_id: str) -> SummaryResponse:
         """전체 요약 계산 (총 자산, 총 부채, 순자산)"""
-        total_assets = await AssetService.get_total_assets(db, user_id)
-        total_liabilities = await AssetService.get_total_liabilities(db, user_id)
-        net_worth = total_assets - total_liabilities
+        totals = await AssetService.get_asset_totals(db, user_id)
 
         return SummaryResponse(
-            total_assets=total_assets,
-            total_liabilities=total_liabilities,
-            net_worth=net_worth,
+            total_assets=totals.total_assets,
+            total_liabilities=totals.total_liabilities,
+            net_worth=totals.net_worth,
         )
 
     @staticmethod
@@ -29,16 +50,215 @@ class CalculationService:
         target_year = year if year else now.year
         target_month = month if month else now.month
 
-        total_income = await TransactionService.get_monthly_income(
-            db, user_id, target_year, target_month
-        )
-        total_expense = await TransactionService.get_monthly_expense(
+        totals = await TransactionService.get_monthly_totals(
             db, user_id, target_year, target_month
         )
 
         return MonthlyResponse(
-            total_income=total_income,
-            total_expense=total_expense,
+            total_income=totals.total_income,
+            total_expense=totals.total_expense,
             month=target_month,
             year=target_year,
         )
+
+    @staticmethod
+    def bucket_start(day: date, granularity: TimeseriesGranularity) -> date:
+        """day가 속한 구간의 시작일 (PostgreSQL date_trunc와 동일, 주는 월요일 시작)"""
+        if granularity == TimeseriesGranularity.WEEK:
+            return day - timedelta(days=day.weekday())
+        if granularity == TimeseriesGranularity.MONTH:
+            return day.replace(day=1)
+        if granularity == TimeseriesGranularity.YEAR:
+            return day.replace(month=1, day=1)
+        return day
+
+    @staticmethod
+    def next_bucket(start: date, granularity: TimeseriesGranularity) -> date:
+        """다음 구간의 시작일"""
+        if granularity == TimeseriesGranularity.WEEK:
+            return start + timedelta(days=7)
+        if granularity == TimeseriesGranularity.MONTH:
+            if start.month == 12:
+                return date(start.year + 1, 1, 1)
+            return date(start.year, start.month + 1, 1)
+        if granularity == TimeseriesGranularity.YEAR:
+            return date(start.year + 1, 1, 1)
+        return start + timedelta(days=1)
+
+    @staticmethod
+    def previous_bucket(start: date, granularity: TimeseriesGranularity) -> date:
+        """이전 구간의 시작일"""
+        if granularity == TimeseriesGranularity.WEEK:
+            return start - timedelta(days=7)
+        if granularity == TimeseriesGranularity.MONTH:
+            if start.month == 1:
+                return date(start.year - 1, 12, 1)
+            return date(start.year, start.month - 1, 1)
+        if granularity == TimeseriesGranularity.YEAR:
+            return date(start.year - 1, 1, 1)
+        return start - timedelta(days=1)
+
+    @staticmethod
+    def timeseries_buckets(
+        start: date, end: date, granularity: TimeseriesGranularity
+    ) -> list[date]:
+        """start ~ end 를 덮는 구간 시작일 목록 (MAX_TIMESERIES_BUCKETS 초과 시 ValueError)"""
+        if start > end:
+            raise ValueError("시작 날짜가 종료 날짜보다 늦습니다.")
+        buckets = []
+        current = CalculationService.bucket_start(start, granularity)
+        while current <= end:
+            if len(buckets) >= MAX_TIMESERIES_BUCKETS:
+                raise ValueError(
+                    f"조회 구간이 너무 많습니다 (최대 {MAX_TIMESERIES_BUCKETS}개). "
+                    "기간을 줄이거나 더 큰 단위를 사용하세요."
+                )
+            buckets.append(current)
+            current = CalculationService.next_bucket(current, granularity)
+        return buckets
+
+    @staticmethod
+    async def get_timeseries(
+        db: AsyncSession,
+        user_id: str,
+        granularity: TimeseriesGranularity = TimeseriesGranularity.MONTH,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+    ) -> TimeseriesResponse:
+        """
+        기간별 수입/지출 시계열 (가족 그룹 포함)
+        집계 쿼리 한 번으로 계산하고 (월/연 단위는 월별 집계, 그 외는 date_trunc GROUP BY),
+        거래가 없는 구간은 0으로 채웁니다.
+        """
+        end = end or date.today()
+        if start is None:
+            start = CalculationService.bucket_start(end, granularity)
+            for _ in range(DEFAULT_TIMESERIES_BUCKETS[granularity] - 1):
+                start = CalculationService.previous_bucket(start, granularity)
+        buckets = CalculationService.timeseries_buckets(start, end, granularity)
+
+        if granularity in (TimeseriesGranularity.MONTH, TimeseriesGranularity.YEAR) and (
+            RollupService.is_month_aligned(start, end + timedelta(days=1))
+        ):
+            # 월 경계와 일치하는 월/연 단위 조회는 월별 집계(monthly_rollups)에서 계산
+            totals = {}
+            month_totals = await RollupService.get_month_totals(
+                db, user_id, start, end + timedelta(days=1)
+            )
+            for month, (income, expense) in month_totals.items():
+                period_start = CalculationService.bucket_start(month, granularity)
+                prev_income, prev_expense = totals.get(period_start, (0.0, 0.0))
+                totals[period_start] = (prev_income + income, prev_expense + expense)
+        else:
+            totals = await CalculationService._scan_timeseries_totals(
+                db, user_id, granularity, start, end
+            )
+
+        points = []
+        for period_start in buckets:
+            total_income, total_expense = totals.get(period_start, (0.0, 0.0))
+            points.append(
+                TimeseriesPoint(
+                    period_start=period_start,
+                    total_income=total_income,
+                    total_expense=total_expense,
+                    net=total_income - total_expense,
+                )
+            )
+
+        return TimeseriesResponse(
+            granularity=granularity,
+            start=start,
+            end=end,
+            points=points,
+        )
+
+    @staticmethod
+    async def _scan_timeseries_totals(
+        db: AsyncSession,
+        user_id: str,
+        granularity: TimeseriesGranularity,
+        start: date,
+        end: date,
+    ) -> dict[date, tuple[float, float]]:
+        """거래를 직접 집계한 구간 시작일별 (수입 합계, 지출 합계)"""
+        # 가족 가계부 조건 (가족 그룹 id 또는 본인 user_id, 단일 키)
+        ledger_filter = await family_service.FamilyService.get_ledger_filter(
+            db, Transaction, user_id
+        )
+
+        # date → timestamp 변환 후 date_trunc (timestamptz 변환에 따른 시간대 영향 방지)
+        bucket = cast(
+            func.date_trunc(granularity.value, cast(Transaction.date, DateTime)), Date
+        ).label("bucket")
+        result = await db.execute(
+            select(
+                bucket,
+                func.coalesce(
+                    func.sum(Transaction.amount).filter(Transaction.type == TransactionType.INCOME), 0
+                ),
+                func.coalesce(
+                    func.sum(Transaction.amount).filter(Transaction.type == TransactionType.EXPENSE), 0
+                ),
+            )
+            .where(
+                ledger_filter,
+                Transaction.date >= start,
+                Transaction.date <= end,
+            )
+            .group_by(bucket)
+        )
+        return {row[0]: (float(row[1]), float(row[2])) for row in result.all()}
+
+    @staticmethod
+    async def get_category_breakdown(
+        db: AsyncSession,
+        user_id: str,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        transaction_type: Optional[TransactionType] = None,
+    ) -> CategoryBreakdownResponse:
+        """
+        카테고리별 수입/지출 합계 (가족 그룹 포함, 기본값: 이번 달)
+        카테고리별 GROUP BY 집계 후, 이름은 카테고리 목록에서 채웁니다.
+        """
+        if start is None or end is None:
+            today = date.today()
+            month_start, next_month = TransactionService.month_range(today.year, today.month)
+            start = start or month_start
+            end = end or next_month - timedelta(days=1)
+        if start > end:
+            raise ValueError("시작 날짜가 종료 날짜보다 늦습니다.")
+
+        totals = await TransactionService.get_category_totals(
+            db, user_id, start, end + timedelta(days=1), transaction_type
+        )
+        categories = await CategoryService.get_category_map(db)
+
+        type_totals = {TransactionType.INCOME: 0.0, TransactionType.EXPENSE: 0.0}
+        for row in totals:
+            type_totals[row.type] += row.total
+
+        items = []
+        for row in totals:
+            category = categories.get(row.category_id)
+            type_total = type_totals[row.type]
+            items.append(
+                CategoryBreakdownItem(
+                    category_id=row.category_id,
+                    category_name=category.name if category else None,
+                    type=row.type,
+                    total=row.total,
+                    count=row.count,
+                    share=row.total / type_total if type_total else 0.0,
+                )
+            )
+        items.sort(key=lambda item: (item.type.value, -item.total))
+
+        return CategoryBreakdownResponse(
+            start=start,
+            end=end,
+            total_income=type_totals[TransactionType.INCOME],
+            total_expense=type_totals[TransactionType.EXPENSE],
+            items=items,
+        )
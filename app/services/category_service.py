@@ -1,26 +1,142 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from types import MappingProxyType
+from typing import Iterable, Mapping, NamedTuple, Optional
+from uuid import UUID
+from app.config import settings
+from app.database import AsyncSessionLocal
 from app.models.category import Category
 from app.models.transaction import TransactionType
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+# 모르는 id로 인한 레지스트리 재로드 최소 간격 (초, 임의 id 요청의 반복 재로드 방지)
+CATEGORY_MIN_REFRESH_INTERVAL = 10.0
+
+
+class CategoryInfo(NamedTuple):
+    """카테고리 참조 데이터 (레지스트리에 보관하는 불변 값)"""
+    id: UUID
+    type: TransactionType
+    name: str
+    display_order: int
+
+
+class CategoryRegistry:
+    """
+    카테고리 레지스트리 (프로세스 내, 시작 시 로드)
+    id → 카테고리 맵은 읽기 전용(MappingProxyType)이고 다시 읽을 때 통째로 교체하므로 잠금 없이 읽습니다.
+    다른 프로세스나 SQL 스크립트의 변경은 category_cache_ttl 이후, 또는 모르는 id를 만났을 때 반영됩니다.
+    모르는 id로 인한 재로드는 CATEGORY_MIN_REFRESH_INTERVAL에 한 번까지이고, 그 사이에는 없는 id로 봅니다.
+    """
+
+    def __init__(self):
+        self._by_id: Mapping[UUID, CategoryInfo] = MappingProxyType({})
+        self._ordered: tuple[CategoryInfo, ...] = ()
+        self._loaded_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def categories(self) -> Mapping[UUID, CategoryInfo]:
+        """id → 카테고리 (읽기 전용)"""
+        return self._by_id
+
+    @property
+    def ordered(self) -> tuple[CategoryInfo, ...]:
+        """유형, 표시 순서, 이름 순 카테고리"""
+        return self._ordered
+
+    def get(self, category_id: Optional[UUID]) -> Optional[CategoryInfo]:
+        return self._by_id.get(category_id)
+
+    def _is_stale(self) -> bool:
+        return (
+            self._loaded_at is None
+            or time.monotonic() - self._loaded_at >= settings.category_cache_ttl
+        )
+
+    def _can_refresh_for_miss(self) -> bool:
+        return (
+            self._loaded_at is None
+            or time.monotonic() - self._loaded_at >= CATEGORY_MIN_REFRESH_INTERVAL
+        )
+
+    async def load(self) -> None:
+        """시작 시 로드 (DB 연결에 실패하면 첫 요청에서 다시 시도)"""
+        try:
+            async with AsyncSessionLocal() as session:
+                await self.refresh(session)
+        except Exception as e:
+            logger.warning(f"카테고리 로드 실패: {str(e)}")
+
+    async def refresh(self, db: AsyncSession) -> None:
+        """카테고리를 다시 읽어 맵 교체"""
+        result = await db.execute(
+            select(Category.id, Category.type, Category.name, Category.display_order)
+            .order_by(Category.type, Category.display_order, Category.name)
+        )
+        ordered = tuple(CategoryInfo(*row) for row in result)
+        self._by_id = MappingProxyType({category.id: category for category in ordered})
+        self._ordered = ordered
+        self._loaded_at = time.monotonic()
+        logger.info(f"카테고리 로드 완료: {len(ordered)}개")
+
+    async def ensure(
+        self, db: AsyncSession, category_ids: Iterable[Optional[UUID]] = ()
+    ) -> Mapping[UUID, CategoryInfo]:
+        """
+        필요하면 다시 읽은 뒤 맵 반환
+        (로드 전, TTL 경과, category_ids 중 모르는 id가 있고 최근 CATEGORY_MIN_REFRESH_INTERVAL 안에 읽지 않았을 때)
+        다시 읽지 않았거나 다시 읽어도 없는 id는 맵에 없으므로 호출하는 쪽에서 확인합니다.
+        """
+        missing = {
+            category_id for category_id in category_ids
+            if category_id is not None and category_id not in self._by_id
+        }
+        if self._is_stale() or (missing and self._can_refresh_for_miss()):
+            async with self._lock:
+                # 기다리는 동안 다른 요청이 다시 읽었으면 생략
+                if self._is_stale() or (
+                    self._can_refresh_for_miss()
+                    and any(category_id not in self._by_id for category_id in missing)
+                ):
+                    await self.refresh(db)
+        return self._by_id
+
+
+category_registry = CategoryRegistry()
 
 
 class CategoryService:
     @staticmethod
     async def get_categories(
         db: AsyncSession, transaction_type: TransactionType
-    ) -> list[Category]:
-        """거래 유형별 카테고리 목록 조회"""
-        result = await db.execute(
-            select(Category)
-            .where(Category.type == transaction_type)
-            .order_by(Category.display_order, Category.name)
-        )
-        return result.scalars().all()
+    ) -> list[CategoryInfo]:
+        """거래 유형별 카테고리 목록 조회 (표시 순서, 이름 순)"""
+        await category_registry.ensure(db)
+        return [
+            category for category in category_registry.ordered
+            if category.type == transaction_type
+        ]
 
     @staticmethod
-    async def get_all_categories(db: AsyncSession) -> list[Category]:
+    async def get_all_categories(db: AsyncSession) -> list[CategoryInfo]:
         """모든 카테고리 조회"""
-        result = await db.execute(
-            select(Category).order_by(Category.type, Category.display_order, Category.name)
-        )
-        return result.scalars().all()
+        await category_registry.ensure(db)
+        return list(category_registry.ordered)
+
+    @staticmethod
+    async def get_category(db: AsyncSession, category_id: UUID) -> Optional[CategoryInfo]:
+        """id로 카테고리 조회 (없으면 None, 쿼리는 레지스트리를 다시 읽을 때만)"""
+        categories = await category_registry.ensure(db, [category_id])
+        return categories.get(category_id)
+
+    @staticmethod
+    async def get_category_map(
+        db: AsyncSession, category_ids: Iterable[Optional[UUID]] = ()
+    ) -> Mapping[UUID, CategoryInfo]:
+        """카테고리 id → 카테고리 (읽기 전용, category_ids를 지정하면 모르는 id가 있을 때 다시 읽음)"""
+        return await category_registry.ensure(db, category_ids)
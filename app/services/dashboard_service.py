@@ -0,0 +1,45 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.services.family_service import FamilyService
+from app.services.calculation_service import CalculationService
+from app.services.transaction_service import TransactionService
+from app.services.category_service import CategoryService
+from app.schemas.dashboard import DashboardResponse
+from app.schemas.transaction import TransactionResponse
+from app.schemas.category import CategoryResponse
+
+# 대시보드 최근 거래 기본 개수
+DEFAULT_RECENT_TRANSACTIONS = 20
+
+
+class DashboardService:
+    @staticmethod
+    async def get_dashboard(
+        db: AsyncSession, user_id: str, recent_limit: int = DEFAULT_RECENT_TRANSACTIONS
+    ) -> DashboardResponse:
+        """
+        대시보드 화면 데이터 (요약, 이번 달 합계, 최근 거래, 카테고리)를 한 번에 조회
+        가족 범위와 카테고리는 한 번만 확인해 캐시에 올려 두고, 나머지 조회는 요청 세션에서 차례로 실행합니다.
+        각 조회가 집계 한 번(월별 집계, SUM ... FILTER) 또는 인덱스 조회 한 번이므로
+        세션을 더 열어 동시에 실행하지 않습니다 (요청당 연결 하나, 연결 풀 고갈 방지).
+        """
+        await FamilyService.resolve_family_scope(db, user_id)
+        # 카테고리는 레지스트리에서 (필요할 때만 다시 읽음)
+        categories = await CategoryService.get_all_categories(db)
+
+        summary = await CalculationService.get_summary(db, user_id)
+        monthly = await CalculationService.get_monthly_summary(db, user_id)
+        recent_transactions = await TransactionService.get_transactions(
+            db, user_id, limit=recent_limit
+        )
+
+        return DashboardResponse(
+            summary=summary,
+            monthly=monthly,
+            recent_transactions=[
+                TransactionResponse.model_validate(transaction)
+                for transaction in recent_transactions
+            ],
+            categories=[
+                CategoryResponse.model_validate(category) for category in categories
+            ],
+        )
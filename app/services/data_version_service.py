@@ -0,0 +1,91 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func
+from sqlalchemy.dialects.postgresql import insert
+from datetime import date
+from typing import Iterable, Optional
+from uuid import UUID
+from app.models.data_version import DataVersion
+from app.services import family_service
+import hashlib
+
+
+class DataVersionService:
+    """가계부 데이터 버전 관리 (쓰기 시 증가, 조회 시 ETag 계산)"""
+
+    @staticmethod
+    def scope_key(family_group_id: Optional[UUID], user_id: str) -> str:
+        """가족 그룹이 있으면 "g:<family_group_id>", 없으면 "u:<user_id>" """
+        if family_group_id is not None:
+            return f"g:{family_group_id}"
+        return f"u:{user_id}"
+
+    @staticmethod
+    async def get_scope_key(db: AsyncSession, user_id: str) -> str:
+        """사용자의 현재 가계부 범위 키 (가족 그룹 id는 캐시 우선)"""
+        family_group_id = await family_service.FamilyService.get_family_group_id(db, user_id)
+        return DataVersionService.scope_key(family_group_id, user_id)
+
+    @staticmethod
+    async def bump_keys(db: AsyncSession, scope_keys: Iterable[str]) -> None:
+        """범위 키들의 버전 증가 (커밋은 호출하는 쪽에서 수행)"""
+        scope_keys = sorted(set(scope_keys))
+        if not scope_keys:
+            return
+        stmt = insert(DataVersion).values(
+            [{"scope_key": key, "version": 1} for key in scope_keys]
+        )
+        await db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[DataVersion.scope_key],
+                set_={
+                    "version": DataVersion.version + 1,
+                    "updated_at": func.now(),
+                },
+            )
+        )
+
+    @staticmethod
+    async def bump(
+        db: AsyncSession, user_id: str, family_group_ids: Iterable[Optional[UUID]]
+    ) -> None:
+        """
+        쓴 행들이 속한 가계부의 버전 증가 (커밋은 호출하는 쪽에서 수행)
+        family_group_ids는 INSERT/UPDATE/DELETE ... RETURNING으로 받은 행의 family_group_id입니다.
+        구성 캐시는 다른 프로세스에서 오래됐을 수 있으므로 쓰지 않습니다.
+        """
+        await DataVersionService.bump_keys(
+            db,
+            [
+                DataVersionService.scope_key(family_group_id, user_id)
+                for family_group_id in family_group_ids
+            ],
+        )
+
+    @staticmethod
+    async def get_etag(db: AsyncSession, user_id: str) -> str:
+        """
+        사용자 가계부의 약한 ETag (W/"...")
+        범위 키, 버전, 오늘 날짜(기본 기간이 오늘 기준인 조회가 있으므로)로 계산합니다.
+        """
+        scope_key = await DataVersionService.get_scope_key(db, user_id)
+        result = await db.execute(
+            select(DataVersion.version).where(DataVersion.scope_key == scope_key)
+        )
+        version = result.scalar() or 0
+        digest = hashlib.sha256(
+            f"{scope_key}:{version}:{date.today().isoformat()}".encode()
+        ).hexdigest()[:20]
+        return f'W/"{digest}"'
+
+    @staticmethod
+    def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+        """If-None-Match 헤더가 ETag와 일치하는지 (약한 비교, 여러 값 및 * 지원)"""
+        if not if_none_match:
+            return False
+        if if_none_match.strip() == "*":
+            return True
+        opaque = etag.removeprefix("W/")
+        return any(
+            candidate.strip().removeprefix("W/") == opaque
+            for candidate in if_none_match.split(",")
+        )
@@ -1,16 +1,55 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, update, and_, func, literal, union, String
+from sqlalchemy.sql import Select
 from sqlalchemy.orm import selectinload
 from uuid import UUID
 from app.models.family import FamilyGroup, FamilyMember, FamilyRole
-from app.models.user import User
+from app.models.asset import Asset
+from app.models.transaction import Transaction
+from app.services.user_service import UserService
+from app.services import data_version_service
 from app.schemas.family import FamilyGroupCreate, FamilyMemberCreate
-from typing import List, Optional
+from typing import Iterable, List, NamedTuple, Optional, Union
+from collections import OrderedDict
 import logging
+import time
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+class FamilyScope(NamedTuple):
+    """사용자의 가족 범위 (가족 그룹이 없으면 family_group_id는 None, 구성원은 본인만)"""
+    family_group_id: Optional[UUID]
+    member_user_ids: tuple[str, ...]
+
+
+# user_id → (만료 시각, 가족 범위) 캐시 (프로세스 내, LRU 방식으로 크기 제한)
+# 가족 구성 변경 시 무효화되며, 다른 프로세스의 변경은 TTL 이후 반영됨
+_membership_cache: "OrderedDict[str, tuple[float, FamilyScope]]" = OrderedDict()
+MEMBERSHIP_CACHE_MAX_SIZE = 10000
+
+# 요청(세션) 단위 메모이제이션 키 (AsyncSession.info)
+_SESSION_MEMBERSHIP_KEY = "family_scope"
+
+
+def _get_cached_scope(user_id: str) -> Optional[FamilyScope]:
+    entry = _membership_cache.get(user_id)
+    if entry is None:
+        return None
+    expires_at, scope = entry
+    if expires_at <= time.monotonic():
+        _membership_cache.pop(user_id, None)
+        return None
+    _membership_cache.move_to_end(user_id)
+    return scope
+
+
+def _set_cached_scope(user_id: str, scope: FamilyScope) -> None:
+    _membership_cache[user_id] = (time.monotonic() + settings.family_cache_ttl, scope)
+    _membership_cache.move_to_end(user_id)
+    while len(_membership_cache) > MEMBERSHIP_CACHE_MAX_SIZE:
+        _membership_cache.popitem(last=False)
+
 # Supabase 클라이언트는 필요할 때만 생성 (지연 로딩)
 _supabase_admin_client_cache = None
 
@@ -69,7 +108,16 @@ class FamilyService:
             role=FamilyRole.ADMIN,
         )
         db.add(admin_member)
+        await db.flush()
+        # 관리자의 기존 자산/거래를 가족 가계부로 이동
+        await FamilyService.sync_ledger_family_group(db, [admin_user_id])
+        # 조건부 GET용 데이터 버전 증가 (관리자의 개인 가계부 → 가족 가계부)
+        await data_version_service.DataVersionService.bump_keys(db, [
+            data_version_service.DataVersionService.scope_key(family_group.id, admin_user_id),
+            data_version_service.DataVersionService.scope_key(None, admin_user_id),
+        ])
         await db.commit()
+        FamilyService.invalidate_membership(db, [admin_user_id])
         await db.refresh(family_group)
         
         # 구성원 정보를 포함하도록 members 관계 로드
@@ -186,16 +234,8 @@ class FamilyService:
             # Service Key가 없으면 에러
             raise ValueError("서비스 키가 설정되지 않았습니다. Supabase Service Key를 설정해주세요.")
 
-        # users 테이블에 사용자가 없으면 생성 (자동 생성)
-        user_result = await db.execute(
-            select(User).where(User.user_id == target_user_id)
-        )
-        user = user_result.scalar_one_or_none()
-        if not user:
-            # 사용자가 없으면 생성
-            user = User(user_id=target_user_id)
-            db.add(user)
-            await db.flush()
+        # users 테이블에 사용자가 없으면 생성 (자동 생성, INSERT ... ON CONFLICT DO NOTHING)
+        await UserService.ensure_user(db, target_user_id, commit=False)
 
         # 이미 구성원인지 확인
         existing_member = await db.execute(
@@ -216,7 +256,16 @@ class FamilyService:
             role=member_data.role,
         )
         db.add(member)
+        await db.flush()
+        # 새 구성원의 기존 자산/거래를 가족 가계부로 이동
+        await FamilyService.sync_ledger_family_group(db, [target_user_id])
+        # 조건부 GET용 데이터 버전 증가 (새 구성원의 데이터가 가족 가계부에 포함됨)
+        await data_version_service.DataVersionService.bump_keys(db, [
+            data_version_service.DataVersionService.scope_key(family_group_id, target_user_id),
+            data_version_service.DataVersionService.scope_key(None, target_user_id),
+        ])
         await db.commit()
+        FamilyService.invalidate_membership(db, [target_user_id, admin_user_id])
         await db.refresh(member)
 
         return member
@@ -254,48 +303,159 @@ class FamilyService:
             raise ValueError("구성원을 찾을 수 없습니다.")
 
         await db.delete(member_obj)
+        await db.flush()
+        # 제거된 구성원의 자산/거래를 개인 가계부로 이동
+        await FamilyService.sync_ledger_family_group(db, [member_user_id])
+        # 조건부 GET용 데이터 버전 증가 (제거된 구성원의 데이터가 개인 가계부로 이동)
+        await data_version_service.DataVersionService.bump_keys(db, [
+            data_version_service.DataVersionService.scope_key(family_group_id, member_user_id),
+            data_version_service.DataVersionService.scope_key(None, member_user_id),
+        ])
         await db.commit()
+        FamilyService.invalidate_membership(db, [member_user_id, admin_user_id])
+
+    @staticmethod
+    def invalidate_membership(db: AsyncSession, user_ids: Iterable[str]) -> None:
+        """
+        가족 구성 변경 시 캐시 무효화
+        주어진 user_id와, 이들을 구성원으로 포함하는 모든 캐시 항목을 제거합니다.
+        """
+        affected = set(user_ids)
+        stale = [
+            cached_user_id
+            for cached_user_id, (_, scope) in _membership_cache.items()
+            if cached_user_id in affected or affected.intersection(scope.member_user_ids)
+        ]
+        for cached_user_id in stale:
+            _membership_cache.pop(cached_user_id, None)
+        db.info.pop(_SESSION_MEMBERSHIP_KEY, None)
+
+    @staticmethod
+    async def resolve_family_scope(db: AsyncSession, user_id: str) -> FamilyScope:
+        """
+        사용자의 가족 그룹 id와 구성원 user_id 목록 반환
+        요청(세션) 단위로 메모이제이션하고, 프로세스 내 캐시(TTL)를 우선 사용합니다.
+        """
+        session_memo = db.info.setdefault(_SESSION_MEMBERSHIP_KEY, {})
+        scope = session_memo.get(user_id)
+        if scope is None:
+            scope = _get_cached_scope(user_id)
+        if scope is None:
+            scope = await FamilyService._load_family_scope(db, user_id)
+            if scope is None:
+                # 조회 실패 시 본인 user_id만 사용 (캐시하지 않음)
+                return FamilyScope(None, (user_id,))
+            _set_cached_scope(user_id, scope)
+        session_memo[user_id] = scope
+        return scope
 
     @staticmethod
     async def get_family_member_user_ids(
         db: AsyncSession,
         user_id: str,
     ) -> List[str]:
-        """사용자가 속한 가족 그룹의 모든 구성원 user_id 목록 반환 (최적화)"""
-        try:
-            # 단일 쿼리로 가족 그룹과 구성원을 한 번에 조회 (성능 개선)
-            # 먼저 관리자로 관리하는 그룹 확인
-            admin_result = await db.execute(
-                select(FamilyGroup.id).where(FamilyGroup.admin_user_id == user_id)
+        """사용자가 속한 가족 그룹의 모든 구성원 user_id 목록 반환 (캐시 우선)"""
+        scope = await FamilyService.resolve_family_scope(db, user_id)
+        return list(scope.member_user_ids)
+
+    @staticmethod
+    async def get_family_group_id(db: AsyncSession, user_id: str) -> Optional[UUID]:
+        """사용자가 속한 가족 그룹 id 반환 (없으면 None, 캐시 우선)"""
+        scope = await FamilyService.resolve_family_scope(db, user_id)
+        return scope.family_group_id
+
+    @staticmethod
+    async def get_ledger_filter(db: AsyncSession, model, user_id: str):
+        """
+        가족 가계부 조회 조건 (단일 키)
+        가족 그룹이 있으면 family_group_id로, 없으면 본인 user_id로 필터링합니다.
+        """
+        family_group_id = await FamilyService.get_family_group_id(db, user_id)
+        if family_group_id is not None:
+            return model.family_group_id == family_group_id
+        return model.user_id == user_id
+
+    @staticmethod
+    def family_group_id_subquery(user_id):
+        """
+        사용자의 가족 그룹 id (스칼라 서브쿼리)
+        관리하는 그룹을 우선하고, 없으면 구성원으로 속한 그룹, 둘 다 없으면 NULL
+        user_id에 컬럼을 넘기면 상관 서브쿼리로 사용할 수 있습니다.
+        """
+        return func.coalesce(
+            select(FamilyGroup.id)
+            .where(FamilyGroup.admin_user_id == user_id)
+            .limit(1)
+            .scalar_subquery(),
+            select(FamilyMember.family_group_id)
+            .where(FamilyMember.user_id == user_id)
+            .limit(1)
+            .scalar_subquery(),
+        )
+
+    @staticmethod
+    def family_scope_query(user_id: str):
+        """
+        사용자가 속한 가족 그룹의 모든 구성원 user_id를 반환하는 단일 SELECT
+        (관리자/구성원 구분 없이 한 번에 조회, 가족 그룹이 없으면 본인 user_id만 반환)
+        다른 쿼리의 IN (...) 서브쿼리로 그대로 사용할 수 있습니다.
+        """
+        return union(
+            select(FamilyMember.user_id).where(
+                FamilyMember.family_group_id == FamilyService.family_group_id_subquery(user_id)
+            ),
+            select(literal(user_id, String)),
+        )
+
+    @staticmethod
+    def get_family_scope(db: AsyncSession, user_id: str) -> Union[List[str], Select]:
+        """
+        가족 범위 필터에 사용할 값 반환 (column.in_(...)에 그대로 사용)
+        캐시된 구성원 목록이 있으면 목록을, 없으면 메인 쿼리에 포함될 서브쿼리를 반환하여
+        구성원 조회를 위한 별도 왕복이 생기지 않도록 합니다.
+        """
+        scope = db.info.get(_SESSION_MEMBERSHIP_KEY, {}).get(user_id)
+        if scope is None:
+            scope = _get_cached_scope(user_id)
+        if scope is not None:
+            return list(scope.member_user_ids)
+        return FamilyService.family_scope_query(user_id)
+
+    @staticmethod
+    async def sync_ledger_family_group(db: AsyncSession, user_ids: Iterable[str]) -> None:
+        """
+        가족 구성 변경 후 해당 사용자들의 자산/거래 family_group_id를 현재 소속 그룹으로 갱신
+        (커밋은 호출하는 쪽에서 수행)
+        """
+        user_ids = list(user_ids)
+        for model in (Asset, Transaction):
+            await db.execute(
+                update(model)
+                .where(model.user_id.in_(user_ids))
+                .values(family_group_id=FamilyService.family_group_id_subquery(model.user_id))
+                .execution_options(synchronize_session=False)
             )
-            admin_group_id = admin_result.scalar_one_or_none()
-            
-            family_group_id = admin_group_id
-            
-            # 관리하는 그룹이 없으면 구성원으로 속한 그룹 확인
-            if not family_group_id:
-                member_result = await db.execute(
-                    select(FamilyMember.family_group_id).where(
-                        FamilyMember.user_id == user_id
-                    ).limit(1)
-                )
-                family_group_id = member_result.scalar_one_or_none()
-            
-            if not family_group_id:
-                # 가족 그룹에 속하지 않으면 자신의 user_id만 반환
-                return [user_id]
 
-            # 가족 그룹의 모든 구성원 user_id 가져오기
-            members = await db.execute(
-                select(FamilyMember.user_id).where(
-                    FamilyMember.family_group_id == family_group_id
+    @staticmethod
+    async def _load_family_scope(
+        db: AsyncSession,
+        user_id: str,
+    ) -> Optional[FamilyScope]:
+        """DB에서 가족 그룹 id와 구성원 목록 조회 (단일 쿼리, 실패 시 None)"""
+        try:
+            result = await db.execute(
+                select(FamilyMember.family_group_id, FamilyMember.user_id).where(
+                    FamilyMember.family_group_id == FamilyService.family_group_id_subquery(user_id)
                 )
             )
-            user_ids = [row[0] for row in members.fetchall()]
-            return user_ids if user_ids else [user_id]
+            rows = result.all()
+            if not rows:
+                # 가족 그룹에 속하지 않으면 자신의 user_id만 반환
+                return FamilyScope(None, (user_id,))
+            return FamilyScope(rows[0][0], tuple(row[1] for row in rows))
         except Exception as e:
             logger.warning(f"가족 그룹 조회 실패, 본인 user_id만 반환: {str(e)}")
-            return [user_id]
+            return None
 
     @staticmethod
     async def get_user_email(user_id: str) -> Optional[str]:
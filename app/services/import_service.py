@@ -0,0 +1,328 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import Table, Column, MetaData, String, Numeric, Date, DateTime, select, func, cast, literal
+from sqlalchemy.dialects.postgresql import UUID as PGUUID, insert
+from decimal import Decimal, InvalidOperation
+from datetime import date
+from typing import BinaryIO, Mapping, Optional
+from uuid import UUID, uuid4
+from starlette.concurrency import run_in_threadpool
+from app.models.transaction import Transaction, TransactionType
+from app.models.rollup import MonthlyRollup
+from app.services import family_service
+from app.services.category_service import CategoryService, CategoryInfo
+from app.services.data_version_service import DataVersionService
+from app.schemas.transaction import TransactionImportError, TransactionImportResponse
+import codecs
+import csv
+import io
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 스테이징 테이블로 한 번에 COPY하는 행 수
+IMPORT_BATCH_SIZE = 5000
+# 응답에 포함하는 최대 오류 행 수
+MAX_IMPORT_ERRORS = 100
+# transactions.amount (Numeric(15, 2)) 최대값
+MAX_AMOUNT = Decimal("9999999999999.99")
+
+# CSV 헤더 별칭 (내보내기 형식과 은행 거래내역 한글 헤더)
+HEADER_ALIASES = {
+    "id": "id",
+    "date": "date",
+    "날짜": "date",
+    "거래일": "date",
+    "type": "type",
+    "유형": "type",
+    "구분": "type",
+    "category": "category",
+    "카테고리": "category",
+    "amount": "amount",
+    "금액": "amount",
+    "memo": "memo",
+    "메모": "memo",
+    "내용": "memo",
+}
+REQUIRED_HEADERS = {"date", "category", "amount"}
+TYPE_ALIASES = {
+    "INCOME": TransactionType.INCOME,
+    "수입": TransactionType.INCOME,
+    "EXPENSE": TransactionType.EXPENSE,
+    "지출": TransactionType.EXPENSE,
+}
+
+# 가져오기 스테이징 테이블 (세션 전용 임시 테이블, 커밋/롤백 시 삭제)
+import_staging = Table(
+    "transaction_import_staging",
+    MetaData(),
+    Column("id", PGUUID(as_uuid=True)),
+    Column("type", String),
+    Column("amount", Numeric(precision=15, scale=2)),
+    Column("category_id", PGUUID(as_uuid=True)),
+    Column("date", Date),
+    Column("memo", String),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP",
+)
+STAGING_COLUMNS = [column.name for column in import_staging.columns]
+
+
+class ImportParser:
+    """
+    CSV 읽기와 행 검증 (동기 코드, 워커 스레드에서 실행)
+    read_batch()를 호출할 때마다 통과한 행을 최대 IMPORT_BATCH_SIZE개까지 스테이징 레코드로 반환하고
+    전체 행 수, 실패 수, 오류(최대 MAX_IMPORT_ERRORS개)를 누적합니다.
+    """
+
+    def __init__(
+        self, file: BinaryIO, encoding: str, categories_by_id: Mapping[UUID, CategoryInfo]
+    ):
+        self.encoding = encoding
+        # UTF-8은 BOM(Excel 저장 파일)을 제거하며 읽음
+        text_encoding = "utf-8-sig" if codecs.lookup(encoding).name == "utf-8" else encoding
+        self.reader = csv.DictReader(io.TextIOWrapper(file, encoding=text_encoding, newline=""))
+        self.categories_by_id = categories_by_id
+        self.categories_by_name = {
+            (category.type, category.name): category for category in categories_by_id.values()
+        }
+        self.total_rows = 0
+        self.failed = 0
+        self.errors: list[TransactionImportError] = []
+
+    def read_header(self) -> None:
+        """헤더를 읽어 별칭을 표준 열 이름으로 바꿈 (필수 열이 없으면 ValueError)"""
+        try:
+            fieldnames = self.reader.fieldnames or []
+        except UnicodeDecodeError:
+            raise ValueError(
+                f"파일을 {self.encoding}(으)로 읽을 수 없습니다. encoding을 확인하세요."
+            )
+        self.reader.fieldnames = [
+            HEADER_ALIASES.get(name.strip().lower(), name.strip().lower()) for name in fieldnames
+        ]
+        missing = REQUIRED_HEADERS - set(self.reader.fieldnames)
+        if missing:
+            raise ValueError(f"필수 열이 없습니다: {', '.join(sorted(missing))}")
+
+    def read_batch(self) -> list[tuple]:
+        """다음 레코드 묶음 (파일 끝이면 빈 목록, 읽을 수 없는 파일이면 ValueError)"""
+        batch = []
+        try:
+            while len(batch) < IMPORT_BATCH_SIZE:
+                row = next(self.reader, None)
+                if row is None:
+                    break
+                self.total_rows += 1
+                try:
+                    batch.append(
+                        ImportService.parse_row(row, self.categories_by_id, self.categories_by_name)
+                    )
+                except ValueError as e:
+                    self.failed += 1
+                    if len(self.errors) < MAX_IMPORT_ERRORS:
+                        self.errors.append(
+                            TransactionImportError(line=self.reader.line_num, error=str(e))
+                        )
+        except (UnicodeDecodeError, csv.Error) as e:
+            raise ValueError(f"CSV를 읽을 수 없습니다 ({self.reader.line_num}번째 줄): {e}")
+        return batch
+
+
+class ImportService:
+    """CSV 거래 일괄 등록 (COPY → 스테이징 테이블 → INSERT ... SELECT 병합)"""
+
+    @staticmethod
+    def parse_row(
+        row: dict,
+        categories_by_id: Mapping[UUID, CategoryInfo],
+        categories_by_name: dict[tuple[TransactionType, str], CategoryInfo],
+    ) -> tuple:
+        """
+        CSV 한 행 → 스테이징 레코드 (형식이 잘못되면 ValueError)
+        유형이 비어 있으면 금액 부호로 판단합니다 (은행 거래내역: 양수 수입, 음수 지출).
+        """
+        amount_text = (row.get("amount") or "").replace(",", "").strip()
+        try:
+            amount = Decimal(amount_text)
+        except InvalidOperation:
+            raise ValueError(f"금액 형식이 잘못되었습니다: {amount_text!r}")
+        if not amount.is_finite():
+            raise ValueError(f"금액 형식이 잘못되었습니다: {amount_text!r}")
+
+        type_text = (row.get("type") or "").strip()
+        if type_text:
+            transaction_type = TYPE_ALIASES.get(type_text.upper())
+            if transaction_type is None:
+                raise ValueError(f"거래 유형은 INCOME/EXPENSE(수입/지출)이어야 합니다: {type_text!r}")
+        else:
+            transaction_type = TransactionType.INCOME if amount > 0 else TransactionType.EXPENSE
+            amount = abs(amount)
+        if amount <= 0:
+            raise ValueError("금액은 0보다 커야 합니다.")
+        if amount.as_tuple().exponent < -2 or amount > MAX_AMOUNT:
+            raise ValueError(f"금액 범위를 벗어났습니다 (소수점 둘째 자리까지): {amount_text!r}")
+
+        date_text = (row.get("date") or "").strip()
+        try:
+            transaction_date = date.fromisoformat(date_text.replace(".", "-").replace("/", "-"))
+        except ValueError:
+            raise ValueError(f"날짜 형식이 잘못되었습니다 (YYYY-MM-DD): {date_text!r}")
+
+        category_text = (row.get("category") or "").strip()
+        try:
+            category = categories_by_id.get(UUID(category_text))
+        except ValueError:
+            category = categories_by_name.get((transaction_type, category_text))
+        if category is None:
+            raise ValueError(f"카테고리를 찾을 수 없습니다: {category_text!r}")
+        if category.type != transaction_type:
+            raise ValueError(f"카테고리 유형이 거래 유형과 다릅니다: {category.name}")
+
+        memo = (row.get("memo") or "").strip() or None
+        if memo and len(memo) > 500:
+            raise ValueError("메모는 500자 이하여야 합니다.")
+
+        id_text = (row.get("id") or "").strip()
+        try:
+            transaction_id = UUID(id_text) if id_text else uuid4()
+        except ValueError:
+            raise ValueError(f"id 형식이 잘못되었습니다: {id_text!r}")
+
+        return (
+            transaction_id,
+            transaction_type.name,
+            amount,
+            category.id,
+            transaction_date,
+            memo,
+        )
+
+    @staticmethod
+    async def import_transactions(
+        db: AsyncSession, user_id: str, file: BinaryIO, encoding: str = "utf-8"
+    ) -> TransactionImportResponse:
+        """
+        CSV 파일의 거래를 일괄 등록 (헤더: date, type, category, amount, memo, id)
+        워커 스레드에서 파일을 IMPORT_BATCH_SIZE 행씩 읽어 검증하고, 통과한 행은 임시 테이블에 COPY한 뒤
+        INSERT ... SELECT 한 번으로 병합하면서 월별 집계도 함께 갱신합니다.
+        이미 있는 id의 행은 건너뛰므로 내보내기 파일을 다시 가져와도 중복되지 않습니다.
+        """
+        try:
+            codecs.lookup(encoding)
+        except LookupError:
+            raise ValueError(f"지원하지 않는 인코딩입니다: {encoding}")
+
+        categories_by_id = await CategoryService.get_category_map(db)
+        parser = ImportParser(file, encoding, categories_by_id)
+        # 파일 읽기와 검증은 워커 스레드에서 (큰 파일을 읽는 동안 다른 요청이 멈추지 않도록)
+        await run_in_threadpool(parser.read_header)
+
+        connection = await db.connection()
+        await connection.run_sync(import_staging.create)
+        driver_connection = (await connection.get_raw_connection()).driver_connection
+
+        staged = 0
+        while True:
+            try:
+                batch = await run_in_threadpool(parser.read_batch)
+            except ValueError:
+                await db.rollback()
+                raise
+            if not batch:
+                break
+            await driver_connection.copy_records_to_table(
+                import_staging.name, records=batch, columns=STAGING_COLUMNS
+            )
+            staged += len(batch)
+
+        imported = 0
+        if staged:
+            imported, family_group_ids = await ImportService._merge_staging(db, user_id)
+            await DataVersionService.bump(db, user_id, family_group_ids)
+        await db.commit()
+        logger.info(
+            f"거래 가져오기 완료: {imported}건 등록, {staged - imported}건 건너뜀, "
+            f"{parser.failed}건 실패 (user_id: {user_id})"
+        )
+
+        return TransactionImportResponse(
+            total_rows=parser.total_rows,
+            imported=imported,
+            skipped=staged - imported,
+            failed=parser.failed,
+            errors=parser.errors,
+        )
+
+    @staticmethod
+    async def _merge_staging(
+        db: AsyncSession, user_id: str
+    ) -> tuple[int, set[Optional[UUID]]]:
+        """
+        스테이징 행을 transactions에 병합하고 등록된 행만큼 월별 집계를 갱신 (한 문장)
+        등록된 행 수와 등록된 행의 family_group_id(데이터 버전 증가용)를 반환합니다.
+        """
+        source = select(
+            import_staging.c.id,
+            literal(user_id),
+            # 가족 그룹은 캐시가 아니라 쓰는 시점의 DB 값 (문장당 한 번 계산)
+            family_service.FamilyService.family_group_id_subquery(user_id),
+            cast(import_staging.c.type, Transaction.type.type),
+            import_staging.c.amount,
+            import_staging.c.category_id,
+            import_staging.c.date,
+            import_staging.c.memo,
+        ).where(
+            # 기본 키가 (id, date)이므로 날짜가 다른 같은 id도 이미 있는 거래로 보고 건너뜀
+            ~select(Transaction.id).where(Transaction.id == import_staging.c.id).exists()
+        ).distinct(import_staging.c.id)  # 파일 안에서 id가 겹치면 한 행만
+        inserted = (
+            insert(Transaction)
+            .from_select(
+                ["id", "user_id", "family_group_id", "type", "amount", "category_id", "date", "memo"],
+                source,
+            )
+            .on_conflict_do_nothing(index_elements=[Transaction.id, Transaction.date])
+            .returning(
+                Transaction.user_id,
+                Transaction.family_group_id,
+                Transaction.date,
+                Transaction.type,
+                Transaction.category_id,
+                Transaction.amount,
+            )
+            .cte("inserted")
+        )
+
+        month = cast(func.date_trunc("month", cast(inserted.c.date, DateTime)), Date)
+        rollup = insert(MonthlyRollup).from_select(
+            ["user_id", "month", "type", "category_id", "total", "count"],
+            select(
+                inserted.c.user_id,
+                month,
+                inserted.c.type,
+                inserted.c.category_id,
+                func.sum(inserted.c.amount),
+                func.count(),
+            ).group_by(inserted.c.user_id, month, inserted.c.type, inserted.c.category_id),
+        )
+        rollup = rollup.on_conflict_do_update(
+            index_elements=[
+                MonthlyRollup.user_id,
+                MonthlyRollup.month,
+                MonthlyRollup.type,
+                MonthlyRollup.category_id,
+            ],
+            set_={
+                "total": MonthlyRollup.total + rollup.excluded.total,
+                "count": MonthlyRollup.count + rollup.excluded.count,
+                "updated_at": func.now(),
+            },
+        ).cte("rollup")
+
+        result = await db.execute(
+            select(inserted.c.family_group_id, func.count())
+            .group_by(inserted.c.family_group_id)
+            .add_cte(rollup)
+        )
+        counts = dict(result.all())
+        return sum(counts.values()), set(counts)
@@ -0,0 +1,184 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import text, delete, update, func
+from datetime import date
+from typing import NamedTuple, Optional
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models.transaction import Transaction
+from app.models.rollup import MonthlyRollup
+from app.models.data_version import DataVersion
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+# 거래 파티션 이름 (연 단위: transactions_y2026 = [2026-01-01, 2027-01-01))
+PARTITION_PREFIX = "transactions_y"
+# 어느 연도 파티션에도 속하지 않는 날짜의 거래가 들어가는 기본 파티션
+DEFAULT_PARTITION = "transactions_default"
+# 여러 프로세스가 동시에 파티션을 만들지 않도록 잡는 advisory lock 키
+PARTITION_LOCK_KEY = 250_001
+# 파티션 경계 (pg_get_expr(relpartbound) 결과)
+BOUND_PATTERN = re.compile(r"FROM \('(\d{4}-\d{2}-\d{2})'\) TO \('(\d{4}-\d{2}-\d{2})'\)")
+
+
+class TransactionPartition(NamedTuple):
+    """transactions 파티션 (기본 파티션은 start/end가 None)"""
+    name: str
+    start: Optional[date]
+    end: Optional[date]
+    estimated_rows: int  # 통계 기준 추정 행 수 (ANALYZE 전에는 0)
+
+
+class PartitionService:
+    """거래 테이블 연 단위 파티션 관리 (미리 생성, 분리)"""
+
+    @staticmethod
+    def partition_name(year: int) -> str:
+        return f"{PARTITION_PREFIX}{year}"
+
+    @staticmethod
+    def year_bounds(year: int) -> tuple[date, date]:
+        """연도 파티션 범위 [시작, 끝)"""
+        return date(year, 1, 1), date(year + 1, 1, 1)
+
+    @staticmethod
+    async def is_partitioned(db: AsyncSession) -> bool:
+        """transactions가 파티션 테이블인지 (파티션 마이그레이션 적용 여부)"""
+        result = await db.execute(
+            text(
+                "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table "
+                "WHERE partrelid = to_regclass('transactions'))"
+            )
+        )
+        return result.scalar()
+
+    @staticmethod
+    async def lock(db: AsyncSession) -> None:
+        """파티션 변경 잠금 (트랜잭션 끝까지, 서버 여러 대의 시작 시점/유지보수 스크립트가 겹치지 않도록)"""
+        await db.execute(
+            text("SELECT pg_advisory_xact_lock(:key)"), {"key": PARTITION_LOCK_KEY}
+        )
+
+    @staticmethod
+    async def list_partitions(db: AsyncSession) -> list[TransactionPartition]:
+        """transactions 파티션 목록 (시작일 순, 기본 파티션은 마지막)"""
+        result = await db.execute(
+            text(
+                "SELECT c.relname, pg_get_expr(c.relpartbound, c.oid), "
+                "greatest(c.reltuples, 0)::bigint "
+                "FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+                "WHERE i.inhparent = 'transactions'::regclass"
+            )
+        )
+        partitions = []
+        for name, bound, rows in result:
+            match = BOUND_PATTERN.search(bound or "")
+            start, end = (
+                (date.fromisoformat(match.group(1)), date.fromisoformat(match.group(2)))
+                if match else (None, None)
+            )
+            partitions.append(TransactionPartition(name, start, end, rows))
+        return sorted(partitions, key=lambda p: (p.start is None, p.start or date.min))
+
+    @staticmethod
+    async def create_partition(db: AsyncSession, year: int) -> bool:
+        """
+        연도 파티션 생성 (이미 있으면 False, 잠금과 커밋은 호출하는 쪽에서 수행)
+        기본 파티션에 그 연도의 거래가 있으면 파티션을 만들 수 없으므로
+        임시 테이블로 옮겨 두었다가 파티션을 만든 뒤 다시 넣습니다 (월별 집계는 그대로).
+        """
+        start, end = PartitionService.year_bounds(year)
+        name = PartitionService.partition_name(year)
+        for partition in await PartitionService.list_partitions(db):
+            if partition.start is None:
+                continue
+            if partition.start == start and partition.end == end:
+                return False
+            if partition.start < end and start < partition.end:
+                raise ValueError(f"{year}년 범위와 겹치는 파티션이 있습니다: {partition.name}")
+
+        # 경계 값은 date에서 만든 문자열이고 이름은 연도(int)로 만들므로 그대로 넣음 (DDL은 바인드 변수 불가)
+        in_range = f"date >= DATE '{start.isoformat()}' AND date < DATE '{end.isoformat()}'"
+        columns = ", ".join(
+            column.name for column in Transaction.__table__.columns if column.computed is None
+        )
+        moving = (await db.execute(
+            text(f"SELECT count(*) FROM {DEFAULT_PARTITION} WHERE {in_range}")
+        )).scalar()
+        if moving:
+            await db.execute(text(
+                f"CREATE TEMPORARY TABLE {name}_moving ON COMMIT DROP AS "
+                f"SELECT {columns} FROM {DEFAULT_PARTITION} WHERE {in_range}"
+            ))
+            await db.execute(text(f"DELETE FROM {DEFAULT_PARTITION} WHERE {in_range}"))
+        await db.execute(text(
+            f"CREATE TABLE {name} PARTITION OF transactions "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        ))
+        if moving:
+            await db.execute(text(
+                f"INSERT INTO transactions ({columns}) SELECT {columns} FROM {name}_moving"
+            ))
+            await db.execute(text(f"DROP TABLE {name}_moving"))
+        logger.info(f"거래 파티션 생성: {name} (기본 파티션에서 {moving}건 이동)")
+        return True
+
+    @staticmethod
+    async def ensure_partitions(
+        db: AsyncSession, years_ahead: Optional[int] = None
+    ) -> list[str]:
+        """
+        올해부터 years_ahead년 뒤까지 연도 파티션을 미리 생성 (기본값: transaction_partitions_ahead)
+        만든 파티션 이름을 반환하고, 파티션 테이블이 아니면(마이그레이션 전) 아무것도 하지 않습니다.
+        """
+        if years_ahead is None:
+            years_ahead = settings.transaction_partitions_ahead
+        if not await PartitionService.is_partitioned(db):
+            return []
+        await PartitionService.lock(db)
+        this_year = date.today().year
+        created = [
+            PartitionService.partition_name(year)
+            for year in range(this_year, this_year + years_ahead + 1)
+            if await PartitionService.create_partition(db, year)
+        ]
+        await db.commit()
+        return created
+
+    @staticmethod
+    async def ensure_on_startup() -> None:
+        """시작 시 파티션 미리 생성 (실패해도 서버는 시작, 기본 파티션이 받음)"""
+        try:
+            async with AsyncSessionLocal() as session:
+                created = await PartitionService.ensure_partitions(session)
+            if created:
+                logger.info(f"거래 파티션 생성 완료: {', '.join(created)}")
+        except Exception as e:
+            logger.warning(f"거래 파티션 생성 실패: {str(e)}")
+
+    @staticmethod
+    async def detach_partition(db: AsyncSession, year: int) -> str:
+        """
+        연도 파티션을 transactions에서 분리 (테이블은 남으므로 백업 후 삭제하거나 다시 붙일 수 있음)
+        분리한 거래는 조회/집계에서 빠지므로 그 연도의 월별 집계를 삭제하고 모든 가계부 버전을 올립니다.
+        분리한 테이블 이름을 반환합니다.
+        """
+        start, end = PartitionService.year_bounds(year)
+        name = PartitionService.partition_name(year)
+        await PartitionService.lock(db)
+        if not any(
+            partition.name == name for partition in await PartitionService.list_partitions(db)
+        ):
+            raise ValueError(f"파티션이 없습니다: {name}")
+        await db.execute(text(f"ALTER TABLE transactions DETACH PARTITION {name}"))
+        await db.execute(
+            delete(MonthlyRollup).where(MonthlyRollup.month >= start, MonthlyRollup.month < end)
+        )
+        # 조건부 GET 캐시가 분리 전 결과를 돌려주지 않도록
+        await db.execute(
+            update(DataVersion).values(version=DataVersion.version + 1, updated_at=func.now())
+        )
+        await db.commit()
+        logger.info(f"거래 파티션 분리: {name}")
+        return name
@@ -0,0 +1,243 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, delete, func, cast, Date, DateTime
+from sqlalchemy.dialects.postgresql import insert
+from decimal import Decimal
+from datetime import date
+from typing import NamedTuple, Optional, Union
+from uuid import UUID
+from app.models.rollup import MonthlyRollup
+from app.models.transaction import Transaction, TransactionType
+from app.services import family_service
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class RollupKey(NamedTuple):
+    """월별 집계 행 키 (거래 1건이 기여하는 집계 행)"""
+    user_id: str
+    month: date
+    type: TransactionType
+    category_id: UUID
+
+
+class RollupService:
+    """월별 거래 집계(monthly_rollups) 유지 및 조회"""
+
+    @staticmethod
+    def month_of(day: date) -> date:
+        return day.replace(day=1)
+
+    @staticmethod
+    def is_month_aligned(start_date: Optional[date], end_date: Optional[date]) -> bool:
+        """기간 [start_date, end_date) 가 월 경계와 일치하는지 (집계 테이블로 계산 가능한지)"""
+        return (start_date is None or start_date.day == 1) and (
+            end_date is None or end_date.day == 1
+        )
+
+    @staticmethod
+    def key_of(transaction: Transaction) -> RollupKey:
+        return RollupKey(
+            user_id=transaction.user_id,
+            month=RollupService.month_of(transaction.date),
+            type=transaction.type,
+            category_id=transaction.category_id,
+        )
+
+    @staticmethod
+    async def apply_deltas(
+        db: AsyncSession, deltas: dict[RollupKey, tuple[Decimal, int]]
+    ) -> None:
+        """집계 행들에 증감분 반영 (INSERT ... ON CONFLICT DO UPDATE 한 문장, 커밋은 호출하는 쪽에서 수행)"""
+        deltas = {key: delta for key, delta in deltas.items() if delta != (0, 0)}
+        if not deltas:
+            return
+        stmt = insert(MonthlyRollup).values(
+            [
+                {
+                    "user_id": key.user_id,
+                    "month": key.month,
+                    "type": key.type,
+                    "category_id": key.category_id,
+                    "total": amount,
+                    "count": count,
+                }
+                for key, (amount, count) in deltas.items()
+            ]
+        )
+        await db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[
+                    MonthlyRollup.user_id,
+                    MonthlyRollup.month,
+                    MonthlyRollup.type,
+                    MonthlyRollup.category_id,
+                ],
+                set_={
+                    "total": MonthlyRollup.total + stmt.excluded.total,
+                    "count": MonthlyRollup.count + stmt.excluded.count,
+                    "updated_at": func.now(),
+                },
+            )
+        )
+
+    @staticmethod
+    async def record_change(
+        db: AsyncSession,
+        old: Optional[tuple[RollupKey, Union[Decimal, float]]],
+        new: Optional[tuple[RollupKey, Union[Decimal, float]]],
+    ) -> None:
+        """
+        거래 1건의 변경을 집계에 반영
+        old/new는 변경 전/후의 (집계 키, 금액)이며, 생성은 old=None, 삭제는 new=None입니다.
+        날짜/유형/카테고리가 바뀌면 이전 행에서 빼고 새 행에 더합니다.
+        """
+        deltas: dict[RollupKey, tuple[Decimal, int]] = {}
+        RollupService.add_change(deltas, old, new)
+        # 이전 행과 새 행의 증감분을 한 문장으로 반영 (같은 행이면 금액 차이만)
+        await RollupService.apply_deltas(db, deltas)
+
+    @staticmethod
+    def add_change(
+        deltas: dict[RollupKey, tuple[Decimal, int]],
+        old: Optional[tuple[RollupKey, Union[Decimal, float]]],
+        new: Optional[tuple[RollupKey, Union[Decimal, float]]],
+    ) -> None:
+        """거래 1건의 변경(record_change와 같은 old/new)을 증감분 모음에 누적 (일괄 처리용)"""
+        for entry, sign in ((old, -1), (new, 1)):
+            if entry is None:
+                continue
+            key, amount = entry
+            total, count = deltas.get(key, (Decimal(0), 0))
+            deltas[key] = (total + sign * Decimal(str(amount)), count + sign)
+
+    @staticmethod
+    async def rebuild(db: AsyncSession, user_id: Optional[str] = None) -> int:
+        """
+        transactions에서 집계를 다시 계산 (초기 채우기 및 불일치 복구, 커밋 포함)
+        user_id를 지정하면 해당 사용자의 집계만 다시 계산합니다. 생성된 집계 행 수를 반환합니다.
+        """
+        delete_stmt = delete(MonthlyRollup)
+        if user_id is not None:
+            delete_stmt = delete_stmt.where(MonthlyRollup.user_id == user_id)
+        await db.execute(delete_stmt)
+
+        month = cast(func.date_trunc("month", cast(Transaction.date, DateTime)), Date)
+        source = (
+            select(
+                Transaction.user_id,
+                month,
+                Transaction.type,
+                Transaction.category_id,
+                func.sum(Transaction.amount),
+                func.count(),
+            )
+            # category_id가 없는 과거 데이터는 집계 대상에서 제외
+            .where(Transaction.category_id.is_not(None))
+            .group_by(Transaction.user_id, month, Transaction.type, Transaction.category_id)
+        )
+        if user_id is not None:
+            source = source.where(Transaction.user_id == user_id)
+
+        result = await db.execute(
+            insert(MonthlyRollup).from_select(
+                ["user_id", "month", "type", "category_id", "total", "count"], source
+            )
+        )
+        await db.commit()
+        logger.info(f"월별 집계 재생성 완료: {result.rowcount}행 (user_id: {user_id or '전체'})")
+        return result.rowcount
+
+    @staticmethod
+    def _scope_query(
+        db: AsyncSession,
+        user_id: str,
+        start_month: Optional[date],
+        end_month: Optional[date],
+        *columns,
+    ):
+        """가족 범위 + 월 범위 [start_month, end_month) 의 집계 행 조회 쿼리"""
+        scope = family_service.FamilyService.get_family_scope(db, user_id)
+        query = select(*columns).where(
+            MonthlyRollup.user_id.in_(scope),
+            MonthlyRollup.count > 0,
+        )
+        if start_month:
+            query = query.where(MonthlyRollup.month >= start_month)
+        if end_month:
+            query = query.where(MonthlyRollup.month < end_month)
+        return query
+
+    @staticmethod
+    async def get_totals_by_type(
+        db: AsyncSession,
+        user_id: str,
+        start_month: Optional[date] = None,
+        end_month: Optional[date] = None,
+    ) -> tuple[float, float]:
+        """월 범위 [start_month, end_month) 의 (수입 합계, 지출 합계) (가족 그룹 포함)"""
+        query = RollupService._scope_query(
+            db,
+            user_id,
+            start_month,
+            end_month,
+            func.coalesce(
+                func.sum(MonthlyRollup.total).filter(MonthlyRollup.type == TransactionType.INCOME), 0
+            ),
+            func.coalesce(
+                func.sum(MonthlyRollup.total).filter(MonthlyRollup.type == TransactionType.EXPENSE), 0
+            ),
+        )
+        total_income, total_expense = (await db.execute(query)).one()
+        return float(total_income), float(total_expense)
+
+    @staticmethod
+    async def get_category_totals(
+        db: AsyncSession,
+        user_id: str,
+        start_month: Optional[date] = None,
+        end_month: Optional[date] = None,
+        transaction_type: Optional[TransactionType] = None,
+    ) -> list[tuple[UUID, TransactionType, float, int]]:
+        """월 범위 [start_month, end_month) 의 카테고리별 (category_id, type, 합계, 건수)"""
+        query = RollupService._scope_query(
+            db,
+            user_id,
+            start_month,
+            end_month,
+            MonthlyRollup.category_id,
+            MonthlyRollup.type,
+            func.sum(MonthlyRollup.total),
+            func.sum(MonthlyRollup.count),
+        ).group_by(MonthlyRollup.category_id, MonthlyRollup.type)
+        if transaction_type:
+            query = query.where(MonthlyRollup.type == transaction_type)
+        result = await db.execute(query)
+        return [
+            (category_id, type_, float(total), int(count))
+            for category_id, type_, total, count in result.all()
+        ]
+
+    @staticmethod
+    async def get_month_totals(
+        db: AsyncSession,
+        user_id: str,
+        start_month: Optional[date] = None,
+        end_month: Optional[date] = None,
+    ) -> dict[date, tuple[float, float]]:
+        """월 범위 [start_month, end_month) 의 월별 (수입 합계, 지출 합계)"""
+        query = RollupService._scope_query(
+            db,
+            user_id,
+            start_month,
+            end_month,
+            MonthlyRollup.month,
+            func.coalesce(
+                func.sum(MonthlyRollup.total).filter(MonthlyRollup.type == TransactionType.INCOME), 0
+            ),
+            func.coalesce(
+                func.sum(MonthlyRollup.total).filter(MonthlyRollup.type == TransactionType.EXPENSE), 0
+            ),
+        ).group_by(MonthlyRollup.month)
+        result = await db.execute(query)
+        return {month: (float(income), float(expense)) for month, income, expense in result.all()}
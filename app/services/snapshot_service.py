@@ -0,0 +1,124 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, literal, exists
+from sqlalchemy.dialects.postgresql import insert
+from datetime import date
+from typing import Optional
+from app.models.asset import Asset, AssetType
+from app.models.snapshot import AssetSnapshot
+from app.services import family_service
+from app.schemas.calculation import NetWorthPoint, NetWorthHistoryResponse
+
+
+class SnapshotService:
+    """일일 자산 스냅샷(asset_snapshots) 기록 및 순자산 추이 조회"""
+
+    @staticmethod
+    async def record_snapshot(db: AsyncSession, user_id: str) -> None:
+        """
+        사용자의 현재 자산 합계를 오늘 날짜 스냅샷으로 기록 (커밋은 호출하는 쪽에서 수행)
+        INSERT ... SELECT 한 번으로 처리하며, 같은 날의 스냅샷은 덮어쓰고
+        직전 스냅샷과 합계가 같으면 기록하지 않습니다 (이름 변경 등).
+        """
+        cash_sum = func.coalesce(func.sum(Asset.amount).filter(Asset.type == AssetType.CASH), 0)
+        loan_sum = func.coalesce(func.sum(Asset.amount).filter(Asset.type == AssetType.LOAN), 0)
+        latest_date = (
+            select(func.max(AssetSnapshot.snapshot_date))
+            .where(AssetSnapshot.user_id == user_id)
+            .scalar_subquery()
+        )
+        unchanged = exists().where(
+            AssetSnapshot.user_id == user_id,
+            AssetSnapshot.snapshot_date == latest_date,
+            AssetSnapshot.total_assets == cash_sum,
+            AssetSnapshot.total_liabilities == loan_sum,
+        )
+        source = (
+            select(literal(user_id), func.current_date(), cash_sum, loan_sum)
+            .where(Asset.user_id == user_id)
+            .having(~unchanged)
+        )
+        stmt = insert(AssetSnapshot).from_select(
+            ["user_id", "snapshot_date", "total_assets", "total_liabilities"], source
+        )
+        await db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[AssetSnapshot.user_id, AssetSnapshot.snapshot_date],
+                set_={
+                    "total_assets": stmt.excluded.total_assets,
+                    "total_liabilities": stmt.excluded.total_liabilities,
+                },
+            )
+        )
+
+    @staticmethod
+    async def get_net_worth_history(
+        db: AsyncSession,
+        user_id: str,
+        start: date,
+        end: Optional[date] = None,
+    ) -> NetWorthHistoryResponse:
+        """
+        기간 내 순자산 추이 (가족 그룹 포함)
+        구성원별 스냅샷을 한 번의 범위 쿼리로 가져와 (시작일 이전 마지막 스냅샷 포함)
+        날짜순으로 누적하며, 합계가 바뀌는 날짜만 반환합니다 (계단형 시계열).
+        """
+        end = end or date.today()
+        if start > end:
+            raise ValueError("시작 날짜가 종료 날짜보다 늦습니다.")
+
+        scope = family_service.FamilyService.get_family_scope(db, user_id)
+        # 구성원별 시작일 이전 마지막 스냅샷 날짜 (시작일의 값으로 사용)
+        prior = AssetSnapshot.__table__.alias("prior")
+        carry_from = func.coalesce(
+            select(func.max(prior.c.snapshot_date))
+            .where(
+                prior.c.user_id == AssetSnapshot.user_id,
+                prior.c.snapshot_date <= start,
+            )
+            .scalar_subquery(),
+            start,
+        )
+        result = await db.execute(
+            select(
+                AssetSnapshot.user_id,
+                AssetSnapshot.snapshot_date,
+                AssetSnapshot.total_assets,
+                AssetSnapshot.total_liabilities,
+            )
+            .where(
+                AssetSnapshot.user_id.in_(scope),
+                AssetSnapshot.snapshot_date >= carry_from,
+                AssetSnapshot.snapshot_date <= end,
+            )
+            .order_by(AssetSnapshot.snapshot_date)
+        )
+
+        # 날짜순으로 구성원별 최신 값을 갱신하며 가족 합계 계산
+        latest: dict[str, tuple[float, float]] = {}
+        points: list[NetWorthPoint] = []
+        rows = result.all()
+        for i, (member_id, snapshot_date, total_assets, total_liabilities) in enumerate(rows):
+            latest[member_id] = (float(total_assets), float(total_liabilities))
+            # 같은 날짜의 마지막 행에서만 기록
+            if i + 1 < len(rows) and rows[i + 1][1] == snapshot_date:
+                continue
+            assets_sum = sum(value[0] for value in latest.values())
+            liabilities_sum = sum(value[1] for value in latest.values())
+            point_date = max(snapshot_date, start)
+            if points and points[-1].date == point_date:
+                points.pop()
+            if points and (points[-1].total_assets, points[-1].total_liabilities) == (
+                assets_sum,
+                liabilities_sum,
+            ):
+                continue
+            points.append(
+                NetWorthPoint(
+                    date=point_date,
+                    total_assets=assets_sum,
+                    total_liabilities=liabilities_sum,
+                    net_worth=assets_sum - liabilities_sum,
+                )
+            )
+
+        return NetWorthHistoryResponse(start=start, end=end, points=points)
@@ -1,17 +1,115 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, func
+from sqlalchemy import select, func, tuple_, insert, update, delete, values, column, literal, literal_column
 from sqlalchemy.orm import selectinload
-from uuid import UUID
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from uuid import UUID, uuid4
 from datetime import date, datetime
-from typing import Optional
+from decimal import Decimal
+from collections import Counter
+from typing import AsyncIterator, Mapping, NamedTuple, Optional, Union
+import base64
+import binascii
+import csv
+import io
+import json
+import logging
+import re
 from fastapi import HTTPException, status
 from app.models.transaction import Transaction, TransactionType
-from app.models.category import Category
-from app.schemas.transaction import TransactionCreate, TransactionUpdate
+from app.database import AsyncSessionLocal
+from app.schemas.transaction import (
+    TransactionCreate,
+    TransactionUpdate,
+    TransactionResponse,
+    ExportFormat,
+    TransactionBatchCreate,
+    TransactionBatchUpdate,
+    TransactionBatchDelete,
+    TransactionBatchItemResult,
+    TransactionBatchResponse,
+)
+from app.schemas.category import CategoryResponse
+from app.schemas.batch import BatchAction
 from app.services import family_service
+from app.services.category_service import CategoryService, CategoryInfo
+from app.services.rollup_service import RollupService, RollupKey
+from app.services.data_version_service import DataVersionService
+
+
+logger = logging.getLogger(__name__)
+
+# 내보내기 시 서버 측 커서에서 한 번에 가져오는 행 수
+EXPORT_CHUNK_SIZE = 1000
+# 내보내기 열 (CSV 헤더 및 NDJSON 키)
+EXPORT_COLUMNS = ["id", "date", "type", "category", "amount", "memo", "user_id", "created_at"]
+# 메모 검색 기본 결과 수, 검색어 최대 단어 수
+DEFAULT_SEARCH_LIMIT = 50
+MAX_SEARCH_TERMS = 8
+
+
+class TransactionTotals(NamedTuple):
+    """기간별 수입/지출 집계 결과"""
+    total_income: float  # 수입 합계
+    total_expense: float  # 지출 합계
+
+
+class CategoryTotal(NamedTuple):
+    """카테고리별 집계 결과"""
+    category_id: UUID
+    type: TransactionType
+    total: float  # 합계
+    count: int  # 거래 수
+
+
+class TransactionPosition(NamedTuple):
+    """거래 목록 정렬 키 (date DESC, created_at DESC, id DESC)"""
+    date: date
+    created_at: datetime
+    id: UUID
+
+
+class TransactionCursor(NamedTuple):
+    """거래 목록 다음 페이지 커서 (마지막 위치 + 조회 필터)"""
+    after: TransactionPosition
+    transaction_type: Optional[TransactionType]
+    start_date: Optional[date]
+    end_date: Optional[date]
 
 
 class TransactionService:
+    @staticmethod
+    def encode_cursor(cursor: TransactionCursor) -> str:
+        """커서 → 불투명 문자열 (URL-safe base64 JSON)"""
+        payload = {
+            "d": cursor.after.date.isoformat(),
+            "c": cursor.after.created_at.isoformat(),
+            "i": str(cursor.after.id),
+            "t": cursor.transaction_type.value if cursor.transaction_type else None,
+            "s": cursor.start_date.isoformat() if cursor.start_date else None,
+            "e": cursor.end_date.isoformat() if cursor.end_date else None,
+        }
+        raw = json.dumps(payload, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @staticmethod
+    def decode_cursor(value: str) -> TransactionCursor:
+        """불투명 문자열 → 커서 (형식이 잘못되면 ValueError)"""
+        try:
+            raw = base64.urlsafe_b64decode(value + "=" * (-len(value) % 4))
+            payload = json.loads(raw)
+            return TransactionCursor(
+                after=TransactionPosition(
+                    date=date.fromisoformat(payload["d"]),
+                    created_at=datetime.fromisoformat(payload["c"]),
+                    id=UUID(payload["i"]),
+                ),
+                transaction_type=TransactionType(payload["t"]) if payload["t"] else None,
+                start_date=date.fromisoformat(payload["s"]) if payload["s"] else None,
+                end_date=date.fromisoformat(payload["e"]) if payload["e"] else None,
+            )
+        except (binascii.Error, UnicodeDecodeError, ValueError, KeyError, TypeError):
+            raise ValueError("잘못된 커서입니다.")
+
     @staticmethod
     async def get_transactions(
         db: AsyncSession,
@@ -19,20 +117,20 @@ class TransactionService:
         transaction_type: Optional[TransactionType] = None,
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
+        limit: Optional[int] = None,
+        after: Optional[TransactionPosition] = None,
     ) -> list[Transaction]:
-        """거래 목록 조회 (카테고리 정보 포함, 가족 그룹 포함)"""
-        from sqlalchemy.orm import joinedload
-        
-        # 가족 그룹의 모든 구성원 user_id 가져오기
-        family_user_ids = await family_service.FamilyService.get_family_member_user_ids(
-            db, user_id
+        """
+        거래 목록 조회 (카테고리 정보 포함, 가족 그룹 포함, limit 지정 시 최근 limit건)
+        after를 지정하면 그 위치 다음 거래부터 조회합니다 (keyset, OFFSET 없음).
+        카테고리는 조인하지 않고 카테고리 레지스트리에서 붙입니다.
+        """
+        # 가족 가계부 조건 (가족 그룹 id 또는 본인 user_id, 단일 키)
+        ledger_filter = await family_service.FamilyService.get_ledger_filter(
+            db, Transaction, user_id
         )
         
-        query = (
-            select(Transaction)
-            .options(joinedload(Transaction.category))
-            .where(Transaction.user_id.in_(family_user_ids))
-        )
+        query = select(Transaction).where(ledger_filter)
 
         if transaction_type:
             query = query.where(Transaction.type == transaction_type)
@@ -40,65 +138,278 @@ class TransactionService:
             query = query.where(Transaction.date >= start_date)
         if end_date:
             query = query.where(Transaction.date <= end_date)
+        if after:
+            query = query.where(
+                tuple_(Transaction.date, Transaction.created_at, Transaction.id)
+                < tuple_(after.date, after.created_at, after.id),
+                # 행 비교는 파티션 제외에 쓰이지 않으므로 날짜 조건을 따로 추가
+                Transaction.date <= after.date,
+            )
 
-        query = query.order_by(Transaction.date.desc(), Transaction.created_at.desc())
+        query = query.order_by(
+            Transaction.date.desc(), Transaction.created_at.desc(), Transaction.id.desc()
+        )
+        if limit:
+            query = query.limit(limit)
 
         result = await db.execute(query)
-        # unique()를 사용하여 중복 제거 (joinedload 사용 시)
-        transactions = result.unique().scalars().all()
+        transactions = result.scalars().all()
+        # 레지스트리에 없는 카테고리가 있으면 다시 읽음 (다른 프로세스에서 추가된 카테고리)
+        await CategoryService.get_category_map(
+            db, {transaction.category_id for transaction in transactions}
+        )
         return transactions
 
+    @staticmethod
+    async def get_transaction_page(
+        db: AsyncSession,
+        user_id: str,
+        limit: int,
+        transaction_type: Optional[TransactionType] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        cursor: Optional[str] = None,
+    ) -> tuple[list[Transaction], Optional[str]]:
+        """
+        거래 목록 한 페이지와 다음 페이지 커서 (마지막 페이지면 None)
+        커서에는 조회 필터가 함께 들어 있으며, 커서와 다른 필터를 함께 지정하면 ValueError입니다.
+        """
+        after = None
+        if cursor:
+            decoded = TransactionService.decode_cursor(cursor)
+            for requested, encoded in (
+                (transaction_type, decoded.transaction_type),
+                (start_date, decoded.start_date),
+                (end_date, decoded.end_date),
+            ):
+                if requested is not None and requested != encoded:
+                    raise ValueError("커서와 조회 조건이 일치하지 않습니다.")
+            after = decoded.after
+            transaction_type = decoded.transaction_type
+            start_date = decoded.start_date
+            end_date = decoded.end_date
+
+        # 한 건 더 조회해 다음 페이지 존재 여부 확인
+        transactions = await TransactionService.get_transactions(
+            db, user_id, transaction_type, start_date, end_date, limit + 1, after
+        )
+        if len(transactions) <= limit:
+            return transactions, None
+
+        transactions = transactions[:limit]
+        last = transactions[-1]
+        next_cursor = TransactionService.encode_cursor(
+            TransactionCursor(
+                after=TransactionPosition(last.date, last.created_at, last.id),
+                transaction_type=transaction_type,
+                start_date=start_date,
+                end_date=end_date,
+            )
+        )
+        return transactions, next_cursor
+
+    @staticmethod
+    def build_search_query(text: str) -> str:
+        """
+        검색어 → tsquery 문자열 (단어마다 접두사 일치, 모든 단어 AND)
+        예: "점심 스타벅" → '점심':* & '스타벅':*  (단어가 없으면 ValueError)
+        """
+        terms = re.findall(r"[^\W_]+", text.lower())[:MAX_SEARCH_TERMS]
+        if not terms:
+            raise ValueError("검색어를 입력하세요.")
+        return " & ".join(f"'{term}':*" for term in terms)
+
+    @staticmethod
+    async def search_transactions(
+        db: AsyncSession,
+        user_id: str,
+        text: str,
+        transaction_type: Optional[TransactionType] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        limit: int = DEFAULT_SEARCH_LIMIT,
+    ) -> list[Transaction]:
+        """
+        메모 검색 (가족 그룹 포함, 목록과 같은 유형/기간 필터)
+        memo_search 컬럼의 GIN 인덱스로 일치하는 거래만 찾은 뒤
+        관련도(ts_rank), 최신순으로 정렬해 limit건 반환합니다.
+        """
+        ts_query = func.to_tsquery(
+            literal_column("'simple'::regconfig"), TransactionService.build_search_query(text)
+        )
+        ledger_filter = await family_service.FamilyService.get_ledger_filter(
+            db, Transaction, user_id
+        )
+
+        query = select(Transaction).where(
+            ledger_filter, Transaction.memo_search.bool_op("@@")(ts_query)
+        )
+        if transaction_type:
+            query = query.where(Transaction.type == transaction_type)
+        if start_date:
+            query = query.where(Transaction.date >= start_date)
+        if end_date:
+            query = query.where(Transaction.date <= end_date)
+        query = query.order_by(
+            func.ts_rank(Transaction.memo_search, ts_query).desc(),
+            Transaction.date.desc(),
+            Transaction.created_at.desc(),
+            Transaction.id.desc(),
+        ).limit(limit)
+
+        result = await db.execute(query)
+        transactions = result.scalars().all()
+        await CategoryService.get_category_map(
+            db, {transaction.category_id for transaction in transactions}
+        )
+        return transactions
+
+    @staticmethod
+    async def export_transactions(
+        db: AsyncSession,
+        user_id: str,
+        export_format: ExportFormat,
+        transaction_type: Optional[TransactionType] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> AsyncIterator[str]:
+        """
+        거래 내보내기 (가족 그룹 포함, 목록과 같은 정렬과 필터)
+        가계부 범위는 요청 세션에서 확인하고, 행은 응답을 보내는 동안
+        별도 세션의 서버 측 커서에서 EXPORT_CHUNK_SIZE 단위로 읽어 문자열 조각으로 반환합니다.
+        """
+        ledger_filter = await family_service.FamilyService.get_ledger_filter(
+            db, Transaction, user_id
+        )
+        categories = await CategoryService.get_category_map(db)
+        query = select(
+            Transaction.id,
+            Transaction.date,
+            Transaction.type,
+            Transaction.category_id,
+            Transaction.amount,
+            Transaction.memo,
+            Transaction.user_id,
+            Transaction.created_at,
+        ).where(ledger_filter)
+        if transaction_type:
+            query = query.where(Transaction.type == transaction_type)
+        if start_date:
+            query = query.where(Transaction.date >= start_date)
+        if end_date:
+            query = query.where(Transaction.date <= end_date)
+        query = query.order_by(
+            Transaction.date.desc(), Transaction.created_at.desc(), Transaction.id.desc()
+        ).execution_options(yield_per=EXPORT_CHUNK_SIZE)
+
+        return TransactionService._stream_export(query, export_format, categories)
+
+    @staticmethod
+    async def _stream_export(
+        query, export_format: ExportFormat, categories: Mapping[UUID, CategoryInfo]
+    ) -> AsyncIterator[str]:
+        """서버 측 커서로 읽은 행 묶음을 CSV/NDJSON 조각으로 변환 (카테고리 이름은 레지스트리에서)"""
+
+        def category_name(category_id: Optional[UUID]) -> Optional[str]:
+            category = categories.get(category_id)
+            return category.name if category else None
+
+        # 요청 세션은 응답 스트리밍 전에 닫히므로 별도 세션 사용
+        async with AsyncSessionLocal() as session:
+            result = await session.stream(query)
+            if export_format == ExportFormat.CSV:
+                # Excel에서 한글이 깨지지 않도록 BOM 포함
+                yield "\ufeff" + ",".join(EXPORT_COLUMNS) + "\r\n"
+            exported = 0
+            async for rows in result.partitions():
+                if export_format == ExportFormat.CSV:
+                    buffer = io.StringIO()
+                    csv.writer(buffer).writerows(
+                        (
+                            row.id,
+                            row.date.isoformat(),
+                            row.type.value,
+                            category_name(row.category_id) or "",
+                            row.amount,
+                            row.memo or "",
+                            row.user_id,
+                            row.created_at.isoformat(),
+                        )
+                        for row in rows
+                    )
+                    yield buffer.getvalue()
+                else:
+                    yield "".join(
+                        json.dumps(
+                            {
+                                "id": str(row.id),
+                                "date": row.date.isoformat(),
+                                "type": row.type.value,
+                                "category": category_name(row.category_id),
+                                "amount": float(row.amount),
+                                "memo": row.memo,
+                                "user_id": row.user_id,
+                                "created_at": row.created_at.isoformat(),
+                            },
+                            ensure_ascii=False,
+                        )
+                        + "\n"
+                        for row in rows
+                    )
+                exported += len(rows)
+            logger.info(f"거래 내보내기 완료: {exported}건 ({export_format.value})")
+
     @staticmethod
     async def get_transaction_by_id(
         db: AsyncSession, transaction_id: UUID, user_id: str
     ) -> Transaction:
         """특정 거래 조회 (카테고리 정보 포함)"""
-        from sqlalchemy.orm import joinedload
-        
         result = await db.execute(
-            select(Transaction)
-            .options(joinedload(Transaction.category))
-            .where(
+            select(Transaction).where(
                 Transaction.id == transaction_id, Transaction.user_id == user_id
             )
         )
-        transaction = result.unique().scalar_one_or_none()
+        transaction = result.scalar_one_or_none()
         if not transaction:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Transaction not found",
             )
+        await CategoryService.get_category_map(db, [transaction.category_id])
         return transaction
 
     @staticmethod
     async def create_transaction(
         db: AsyncSession, transaction_data: TransactionCreate, user_id: str
     ) -> Transaction:
-        """거래 생성"""
-        # 카테고리 존재 확인
-        category_result = await db.execute(
-            select(Category).where(Category.id == transaction_data.category_id)
-        )
-        category = category_result.scalar_one_or_none()
-        if not category:
+        """거래 생성 (INSERT ... RETURNING 한 문장, 카테고리는 레지스트리에서 확인)"""
+        # 카테고리 존재 확인 (카테고리 레지스트리)
+        if not await CategoryService.get_category(db, transaction_data.category_id):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Category not found",
             )
-        
-        transaction = Transaction(
-            user_id=user_id,
-            type=transaction_data.type,
-            amount=transaction_data.amount,
-            category_id=transaction_data.category_id,
-            date=transaction_data.date,
-            memo=transaction_data.memo,
+
+        transaction = await db.scalar(
+            insert(Transaction)
+            .values(
+                user_id=user_id,
+                # 가족 그룹은 캐시가 아니라 쓰는 시점의 DB 값으로 (다른 프로세스의 구성 변경 반영)
+                family_group_id=family_service.FamilyService.family_group_id_subquery(user_id),
+                type=transaction_data.type,
+                amount=transaction_data.amount,
+                category_id=transaction_data.category_id,
+                date=transaction_data.date,
+                memo=transaction_data.memo,
+            )
+            .returning(Transaction)
+        )
+        # 월별 집계 갱신 (같은 DB 트랜잭션)
+        await RollupService.record_change(
+            db, None, (RollupService.key_of(transaction), transaction.amount)
         )
-        db.add(transaction)
+        await DataVersionService.bump(db, user_id, [transaction.family_group_id])
         await db.commit()
-        await db.refresh(transaction)
-        # 카테고리 정보 로드
-        await db.refresh(transaction, ["category"])
         return transaction
 
     @staticmethod
@@ -108,126 +419,470 @@ class TransactionService:
         transaction_data: TransactionUpdate,
         user_id: str,
     ) -> Transaction:
-        """거래 수정 (본인이 생성한 거래만 수정 가능)"""
-        from sqlalchemy.orm import joinedload
-        
-        # 본인이 생성한 거래만 수정 가능
-        result = await db.execute(
-            select(Transaction)
-            .options(joinedload(Transaction.category))
+        """
+        거래 수정 (본인이 생성한 거래만 수정 가능)
+        UPDATE ... FROM (변경 전 행, FOR UPDATE) ... RETURNING 한 문장으로 수정하고
+        변경 전/후 값을 함께 받아 월별 집계를 옮깁니다.
+        """
+        if transaction_data.category_id is not None:
+            # 카테고리 존재 확인 (카테고리 레지스트리)
+            if not await CategoryService.get_category(db, transaction_data.category_id):
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Category not found",
+                )
+        changes = {
+            field: value
+            for field, value in (
+                ("type", transaction_data.type),
+                ("amount", transaction_data.amount),
+                ("category_id", transaction_data.category_id),
+                ("date", transaction_data.date),
+                ("memo", transaction_data.memo),
+            )
+            if value is not None
+        }
+
+        # 변경 전 행 (행 잠금 후 읽으므로 동시 수정 시에도 집계가 어긋나지 않음)
+        previous = (
+            select(
+                Transaction.id,
+                Transaction.date,
+                Transaction.type,
+                Transaction.category_id,
+                Transaction.amount,
+            )
             .where(
                 Transaction.id == transaction_id,
-                Transaction.user_id == user_id  # 본인 것만 수정 가능
+                Transaction.user_id == user_id,  # 본인 것만 수정 가능
             )
+            .with_for_update()
+            .subquery("previous")
         )
-        transaction = result.unique().scalar_one_or_none()
-        if not transaction:
+        result = await db.execute(
+            update(Transaction)
+            .where(Transaction.id == previous.c.id)
+            .values(**changes, updated_at=func.now())
+            .returning(
+                Transaction,
+                previous.c.date,
+                previous.c.type,
+                previous.c.category_id,
+                previous.c.amount,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        row = result.one_or_none()
+        if row is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Transaction not found",
             )
+        transaction, old_date, old_type, old_category_id, old_amount = row
+        old_key = RollupKey(
+            user_id=user_id,
+            month=RollupService.month_of(old_date),
+            type=old_type,
+            category_id=old_category_id,
+        )
 
-        if transaction_data.type is not None:
-            transaction.type = transaction_data.type
-        if transaction_data.amount is not None:
-            transaction.amount = transaction_data.amount
-        if transaction_data.category_id is not None:
-            # 카테고리 존재 확인
-            category_result = await db.execute(
-                select(Category).where(Category.id == transaction_data.category_id)
-            )
-            category = category_result.scalar_one_or_none()
-            if not category:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail="Category not found",
-                )
-            transaction.category_id = transaction_data.category_id
-        if transaction_data.date is not None:
-            transaction.date = transaction_data.date
-        if transaction_data.memo is not None:
-            transaction.memo = transaction_data.memo
-
+        # 월별 집계 갱신 (날짜/유형/카테고리가 바뀌면 이전 월/카테고리에서 새 위치로 이동)
+        await RollupService.record_change(
+            db, (old_key, old_amount), (RollupService.key_of(transaction), transaction.amount)
+        )
+        await DataVersionService.bump(db, user_id, [transaction.family_group_id])
         await db.commit()
-        # refresh 제거 (변경사항이 이미 반영되어 있음)
         return transaction
 
     @staticmethod
     async def delete_transaction(
         db: AsyncSession, transaction_id: UUID, user_id: str
     ) -> None:
-        """거래 삭제 (최적화: 직접 삭제 쿼리 사용)"""
-        # 불필요한 조회 없이 직접 삭제 (성능 개선)
+        """거래 삭제 (DELETE ... RETURNING 한 문장, 본인이 생성한 거래만 삭제 가능)"""
         result = await db.execute(
-            select(Transaction).where(
-                Transaction.id == transaction_id, Transaction.user_id == user_id
+            delete(Transaction)
+            .where(Transaction.id == transaction_id, Transaction.user_id == user_id)
+            .returning(
+                Transaction.date,
+                Transaction.type,
+                Transaction.category_id,
+                Transaction.amount,
+                Transaction.family_group_id,
             )
+            .execution_options(synchronize_session=False)
         )
-        transaction = result.scalar_one_or_none()
-        if not transaction:
+        row = result.one_or_none()
+        if row is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Transaction not found",
             )
-        await db.delete(transaction)
+        key = RollupKey(
+            user_id=user_id,
+            month=RollupService.month_of(row.date),
+            type=row.type,
+            category_id=row.category_id,
+        )
+        # 월별 집계 갱신 (같은 DB 트랜잭션)
+        await RollupService.record_change(db, (key, row.amount), None)
+        await DataVersionService.bump(db, user_id, [row.family_group_id])
         await db.commit()
 
     @staticmethod
-    async def get_monthly_income(
-        db: AsyncSession, user_id: str, year: int, month: int
-    ) -> float:
-        """특정 월의 수입 합계 (가족 그룹 포함)"""
-        # 가족 그룹의 모든 구성원 user_id 가져오기
-        family_user_ids = await family_service.FamilyService.get_family_member_user_ids(
-            db, user_id
+    async def apply_batch(
+        db: AsyncSession,
+        operations: list[
+            Union[TransactionBatchCreate, TransactionBatchUpdate, TransactionBatchDelete]
+        ],
+        user_id: str,
+    ) -> TransactionBatchResponse:
+        """
+        거래 생성/수정/삭제 일괄 처리 (한 DB 트랜잭션, 본인이 생성한 거래만 수정/삭제 가능)
+        대상 조회 1번 후 DELETE ... IN, UPDATE ... FROM (VALUES ...), 다중 행 INSERT,
+        월별 집계 다중 행 upsert를 각각 한 문장으로 실행합니다.
+        실패한 작업(없는 거래/카테고리, 같은 id 중복)은 건너뛰고 결과에 표시합니다.
+        월별 집계 증감분은 실제로 삭제/수정/등록된 행(RETURNING)으로 계산합니다.
+        """
+        table = Transaction.__table__
+        categories = await CategoryService.get_category_map(
+            db,
+            {
+                operation.data.category_id
+                for operation in operations
+                if operation.action != BatchAction.DELETE
+            },
         )
-        
-        start_date = date(year, month, 1)
-        # 다음 달 1일
-        if month == 12:
-            end_date = date(year + 1, 1, 1)
-        else:
-            end_date = date(year, month + 1, 1)
+        results: list[Optional[TransactionBatchItemResult]] = [None] * len(operations)
 
-        result = await db.execute(
-            select(func.sum(Transaction.amount)).where(
-                and_(
-                    Transaction.user_id.in_(family_user_ids),
-                    Transaction.type == TransactionType.INCOME,
-                    Transaction.date >= start_date,
-                    Transaction.date < end_date,
+        # 수정/삭제 대상 한 번에 조회
+        target_counts = Counter(
+            operation.id for operation in operations if operation.action != BatchAction.CREATE
+        )
+        existing = {}
+        if target_counts:
+            # 행 잠금 후 읽으므로 커밋 전까지 다른 요청이 대상을 바꾸거나 지우지 못함
+            # (id 순서로 잠가 겹치는 배치끼리 교착되지 않도록)
+            result = await db.execute(
+                select(table)
+                .where(table.c.id.in_(list(target_counts)), table.c.user_id == user_id)
+                .order_by(table.c.id)
+                .with_for_update()
+            )
+            existing = {row.id: row for row in result}
+
+        def fail(index: int, operation, status_code: int, error: str) -> None:
+            results[index] = TransactionBatchItemResult(
+                index=index,
+                action=operation.action,
+                id=getattr(operation, "id", None),
+                status=status_code,
+                error=error,
+            )
+
+        def rollup_entry(row: dict) -> tuple[RollupKey, Decimal]:
+            key = RollupKey(
+                user_id=row["user_id"],
+                month=RollupService.month_of(row["date"]),
+                type=row["type"],
+                category_id=row["category_id"],
+            )
+            return key, row["amount"]
+
+        inserts: dict[UUID, int] = {}
+        insert_rows = []
+        updates: dict[UUID, int] = {}
+        update_rows = []
+        deletes: dict[UUID, int] = {}
+        rollup_deltas: dict[RollupKey, tuple[Decimal, int]] = {}
+
+        for index, operation in enumerate(operations):
+            if operation.action == BatchAction.CREATE:
+                data = operation.data
+                if data.category_id not in categories:
+                    fail(index, operation, status.HTTP_404_NOT_FOUND, "Category not found")
+                    continue
+                row = {
+                    "id": uuid4(),
+                    "type": data.type,
+                    "amount": Decimal(str(data.amount)),
+                    "category_id": data.category_id,
+                    "date": data.date,
+                    "memo": data.memo,
+                }
+                inserts[row["id"]] = index
+                insert_rows.append(row)
+                continue
+
+            if target_counts[operation.id] > 1:
+                fail(index, operation, status.HTTP_400_BAD_REQUEST, "같은 id에 대한 작업이 여러 번 있습니다.")
+                continue
+            current = existing.get(operation.id)
+            if current is None:
+                fail(index, operation, status.HTTP_404_NOT_FOUND, "Transaction not found")
+                continue
+            current = dict(current._mapping)
+
+            if operation.action == BatchAction.DELETE:
+                deletes[operation.id] = index
+                continue
+
+            data = operation.data
+            if data.category_id is not None and data.category_id not in categories:
+                fail(index, operation, status.HTTP_404_NOT_FOUND, "Category not found")
+                continue
+            row = {
+                **current,
+                "type": data.type if data.type is not None else current["type"],
+                "amount": Decimal(str(data.amount)) if data.amount is not None else current["amount"],
+                "category_id": data.category_id if data.category_id is not None else current["category_id"],
+                "date": data.date if data.date is not None else current["date"],
+                "memo": data.memo if data.memo is not None else current["memo"],
+            }
+            updates[operation.id] = index
+            update_rows.append(row)
+
+        deleted_rows = []
+        changed_rows = []
+        if deletes:
+            result = await db.execute(
+                delete(table)
+                .where(table.c.id.in_(list(deletes)), table.c.user_id == user_id)
+                .returning(table.c.id, table.c.family_group_id)
+            )
+            deleted_rows = result.all()
+        deleted_ids = {row.id for row in deleted_rows}
+        if update_rows:
+            batch = values(
+                column("id", PGUUID(as_uuid=True)),
+                column("type", table.c.type.type),
+                column("amount", table.c.amount.type),
+                column("category_id", PGUUID(as_uuid=True)),
+                column("date", table.c.date.type),
+                column("memo", table.c.memo.type),
+                name="batch",
+            ).data(
+                [
+                    (row["id"], row["type"], row["amount"], row["category_id"], row["date"], row["memo"])
+                    for row in update_rows
+                ]
+            )
+            result = await db.execute(
+                update(table)
+                .where(table.c.id == batch.c.id, table.c.user_id == user_id)
+                .values(
+                    type=batch.c.type,
+                    amount=batch.c.amount,
+                    category_id=batch.c.category_id,
+                    date=batch.c.date,
+                    memo=batch.c.memo,
+                    updated_at=func.now(),
+                )
+                .returning(*table.c)
+            )
+            changed_rows.extend(result.all())
+        if insert_rows:
+            rows = values(
+                column("id", PGUUID(as_uuid=True)),
+                column("type", table.c.type.type),
+                column("amount", table.c.amount.type),
+                column("category_id", PGUUID(as_uuid=True)),
+                column("date", table.c.date.type),
+                column("memo", table.c.memo.type),
+                name="rows",
+            ).data(
+                [
+                    (row["id"], row["type"], row["amount"], row["category_id"], row["date"], row["memo"])
+                    for row in insert_rows
+                ]
+            )
+            # 가족 그룹은 쓰는 시점의 DB 값 (상관 없는 서브쿼리이므로 문장당 한 번 계산)
+            result = await db.execute(
+                insert(table)
+                .from_select(
+                    ["id", "user_id", "family_group_id", "type", "amount", "category_id", "date", "memo"],
+                    select(
+                        rows.c.id,
+                        literal(user_id),
+                        family_service.FamilyService.family_group_id_subquery(user_id),
+                        rows.c.type,
+                        rows.c.amount,
+                        rows.c.category_id,
+                        rows.c.date,
+                        rows.c.memo,
+                    ),
                 )
+                .returning(*table.c)
+            )
+            changed_rows.extend(result.all())
+
+        # 실제로 바뀐 행으로 집계 증감분 계산 (조회 후 사라진 대상은 404)
+        for transaction_id in deleted_ids:
+            RollupService.add_change(
+                rollup_deltas, rollup_entry(existing[transaction_id]._mapping), None
+            )
+        for row in changed_rows:
+            old = None if row.id in inserts else rollup_entry(existing[row.id]._mapping)
+            RollupService.add_change(rollup_deltas, old, rollup_entry(row._mapping))
+        changed_ids = deleted_ids | {row.id for row in changed_rows}
+        for transaction_id, index in {**deletes, **updates}.items():
+            if transaction_id not in changed_ids:
+                fail(index, operations[index], status.HTTP_404_NOT_FOUND, "Transaction not found")
+
+        if changed_ids:
+            await RollupService.apply_deltas(db, rollup_deltas)
+            await DataVersionService.bump(
+                db,
+                user_id,
+                {row.family_group_id for row in deleted_rows}
+                | {row.family_group_id for row in changed_rows},
+            )
+            await db.commit()
+
+        for transaction_id in deleted_ids:
+            index = deletes[transaction_id]
+            results[index] = TransactionBatchItemResult(
+                index=index, action=BatchAction.DELETE, id=transaction_id, status=status.HTTP_204_NO_CONTENT
             )
+        for row in changed_rows:
+            created = row.id in inserts
+            index = inserts[row.id] if created else updates[row.id]
+            results[index] = TransactionBatchItemResult(
+                index=index,
+                action=BatchAction.CREATE if created else BatchAction.UPDATE,
+                id=row.id,
+                status=status.HTTP_201_CREATED if created else status.HTTP_200_OK,
+                transaction=TransactionResponse(
+                    **row._mapping,
+                    category=CategoryResponse.model_validate(categories[row.category_id]),
+                ),
+            )
+
+        failed = sum(1 for item in results if item.error is not None)
+        return TransactionBatchResponse(
+            succeeded=len(results) - failed, failed=failed, results=results
         )
-        total = result.scalar()
-        return float(total) if total else 0.0
 
     @staticmethod
-    async def get_monthly_expense(
-        db: AsyncSession, user_id: str, year: int, month: int
-    ) -> float:
-        """특정 월의 지출 합계 (가족 그룹 포함)"""
-        # 가족 그룹의 모든 구성원 user_id 가져오기
-        family_user_ids = await family_service.FamilyService.get_family_member_user_ids(
-            db, user_id
-        )
-        
+    def month_range(year: int, month: int) -> tuple[date, date]:
+        """해당 월의 [1일, 다음 달 1일) 기간"""
         start_date = date(year, month, 1)
         # 다음 달 1일
         if month == 12:
             end_date = date(year + 1, 1, 1)
         else:
             end_date = date(year, month + 1, 1)
+        return start_date, end_date
 
-        result = await db.execute(
-            select(func.sum(Transaction.amount)).where(
-                and_(
-                    Transaction.user_id.in_(family_user_ids),
-                    Transaction.type == TransactionType.EXPENSE,
-                    Transaction.date >= start_date,
-                    Transaction.date < end_date,
-                )
+    @staticmethod
+    async def get_totals_by_type(
+        db: AsyncSession,
+        user_id: str,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> TransactionTotals:
+        """
+        기간 [start_date, end_date) 의 수입/지출 합계 (가족 그룹 포함)
+        SUM ... FILTER로 수입과 지출을 한 번의 집계 쿼리에서 계산합니다.
+        기간이 월 경계와 일치하면 거래 대신 월별 집계(monthly_rollups)를 읽습니다.
+        """
+        if RollupService.is_month_aligned(start_date, end_date):
+            total_income, total_expense = await RollupService.get_totals_by_type(
+                db, user_id, start_date, end_date
             )
+            return TransactionTotals(total_income=total_income, total_expense=total_expense)
+
+        # 가족 가계부 조건 (가족 그룹 id 또는 본인 user_id, 단일 키)
+        ledger_filter = await family_service.FamilyService.get_ledger_filter(
+            db, Transaction, user_id
+        )
+
+        query = select(
+            func.coalesce(
+                func.sum(Transaction.amount).filter(Transaction.type == TransactionType.INCOME), 0
+            ),
+            func.coalesce(
+                func.sum(Transaction.amount).filter(Transaction.type == TransactionType.EXPENSE), 0
+            ),
+        ).where(ledger_filter)
+        if start_date:
+            query = query.where(Transaction.date >= start_date)
+        if end_date:
+            query = query.where(Transaction.date < end_date)
+
+        result = await db.execute(query)
+        total_income, total_expense = result.one()
+        return TransactionTotals(
+            total_income=float(total_income),
+            total_expense=float(total_expense),
+        )
+
+    @staticmethod
+    async def get_category_totals(
+        db: AsyncSession,
+        user_id: str,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        transaction_type: Optional[TransactionType] = None,
+    ) -> list[CategoryTotal]:
+        """
+        기간 [start_date, end_date) 의 카테고리별 합계와 거래 수 (가족 그룹 포함)
+        카테고리 이름은 조인하지 않습니다 (호출하는 쪽에서 카테고리 목록으로 채움).
+        기간이 월 경계와 일치하면 거래 대신 월별 집계(monthly_rollups)를 읽습니다.
+        """
+        if RollupService.is_month_aligned(start_date, end_date):
+            rows = await RollupService.get_category_totals(
+                db, user_id, start_date, end_date, transaction_type
+            )
+            return [CategoryTotal(*row) for row in rows]
+
+        # 가족 가계부 조건 (가족 그룹 id 또는 본인 user_id, 단일 키)
+        ledger_filter = await family_service.FamilyService.get_ledger_filter(
+            db, Transaction, user_id
         )
-        total = result.scalar()
-        return float(total) if total else 0.0
+
+        query = (
+            select(
+                Transaction.category_id,
+                Transaction.type,
+                func.sum(Transaction.amount),
+                func.count(),
+            )
+            .where(ledger_filter)
+            .group_by(Transaction.category_id, Transaction.type)
+        )
+        if transaction_type:
+            query = query.where(Transaction.type == transaction_type)
+        if start_date:
+            query = query.where(Transaction.date >= start_date)
+        if end_date:
+            query = query.where(Transaction.date < end_date)
+
+        result = await db.execute(query)
+        return [
+            CategoryTotal(category_id, type_, float(total), count)
+            for category_id, type_, total, count in result.all()
+        ]
+
+    @staticmethod
+    async def get_monthly_totals(
+        db: AsyncSession, user_id: str, year: int, month: int
+    ) -> TransactionTotals:
+        """특정 월의 수입/지출 합계 (가족 그룹 포함)"""
+        start_date, end_date = TransactionService.month_range(year, month)
+        return await TransactionService.get_totals_by_type(db, user_id, start_date, end_date)
+
+    @staticmethod
+    async def get_monthly_income(
+        db: AsyncSession, user_id: str, year: int, month: int
+    ) -> float:
+        """특정 월의 수입 합계 (가족 그룹 포함)"""
+        totals = await TransactionService.get_monthly_totals(db, user_id, year, month)
+        return totals.total_income
+
+    @staticmethod
+    async def get_monthly_expense(
+        db: AsyncSession, user_id: str, year: int, month: int
+    ) -> float:
+        """특정 월의 지출 합계 (가족 그룹 포함)"""
+        totals = await TransactionService.get_monthly_totals(db, user_id, year, month)
+        return totals.total_expense
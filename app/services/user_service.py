@@ -0,0 +1,62 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.dialects.postgresql import insert
+from collections import OrderedDict
+from threading import Lock
+from app.models.user import User
+from app.config import settings
+import logging
+
+logger = logging.getLogger(__name__)
+
+# users 테이블에 존재가 확인된 user_id 캐시 (프로세스 내, LRU 방식으로 크기 제한)
+_known_user_ids: "OrderedDict[str, None]" = OrderedDict()
+_known_user_ids_lock = Lock()
+
+
+class UserService:
+    """사용자 레코드 프로비저닝 서비스"""
+
+    @staticmethod
+    def is_known_user(user_id: str) -> bool:
+        """users 테이블에 이미 존재하는 것으로 확인된 user_id인지 확인"""
+        with _known_user_ids_lock:
+            if user_id in _known_user_ids:
+                _known_user_ids.move_to_end(user_id)
+                return True
+            return False
+
+    @staticmethod
+    def remember_user(user_id: str) -> None:
+        """user_id를 확인된 사용자로 등록 (최대 크기 초과 시 가장 오래된 항목 제거)"""
+        with _known_user_ids_lock:
+            _known_user_ids[user_id] = None
+            _known_user_ids.move_to_end(user_id)
+            while len(_known_user_ids) > settings.known_user_cache_size:
+                _known_user_ids.popitem(last=False)
+
+    @staticmethod
+    def forget_user(user_id: str) -> None:
+        """캐시에서 user_id 제거"""
+        with _known_user_ids_lock:
+            _known_user_ids.pop(user_id, None)
+
+    @staticmethod
+    async def ensure_user(db: AsyncSession, user_id: str, commit: bool = True) -> None:
+        """
+        User 레코드가 없으면 생성합니다.
+        이미 확인된 user_id는 쿼리 없이 바로 반환하고,
+        처음 보는 user_id는 INSERT ... ON CONFLICT DO NOTHING 한 번으로 처리합니다.
+        """
+        if UserService.is_known_user(user_id):
+            return
+
+        await db.execute(
+            insert(User)
+            .values(user_id=user_id)
+            .on_conflict_do_nothing(index_elements=[User.user_id])
+        )
+        if commit:
+            await db.commit()
+            # 커밋된 경우에만 캐시에 등록 (롤백 시 잘못된 캐시 방지)
+            UserService.remember_user(user_id)
+        logger.debug(f"User record ensured: {user_id}")
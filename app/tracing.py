@@ -0,0 +1,202 @@
+"""
+요청 트레이스 파이프라인
+샘플링된 요청의 디버그 이벤트(hypothesis/location/message)를 큐에 넣고,
+백그라운드 스레드가 파일에 기록합니다. 요청 처리 중에는 파일 I/O가 발생하지 않습니다.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Optional
+from app.config import settings
+import json
+import logging
+import os
+import queue
+import random
+import threading
+import time
+import uuid
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TraceContext:
+    """샘플링된 요청 하나의 트레이스 정보"""
+    trace_id: str
+    path: str
+
+
+# 현재 요청의 트레이스 (샘플링되지 않은 요청은 None)
+_current_trace: ContextVar[Optional[TraceContext]] = ContextVar("current_trace", default=None)
+
+
+class TraceWriter:
+    """큐 기반 백그라운드 트레이스 기록기 (버퍼가 가득 차면 이벤트를 버림)"""
+
+    def __init__(self, path: str, buffer_size: int):
+        self.path = path
+        self.dropped = 0
+        self._queue: "queue.Queue[Optional[dict]]" = queue.Queue(maxsize=buffer_size)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def emit(self, event: dict) -> None:
+        """이벤트를 큐에 넣음 (블로킹 없음)"""
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            self.dropped += 1
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="trace-writer", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        while True:
+            event = self._queue.get()
+            batch = [event]
+            # 쌓여 있는 이벤트를 한 번에 기록
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = None in batch
+            lines = [json.dumps(e, default=str) for e in batch if e is not None]
+            if lines:
+                try:
+                    with open(self.path, "a") as f:
+                        f.write("\n".join(lines) + "\n")
+                except OSError as e:
+                    logger.warning(f"트레이스 기록 실패: {str(e)}")
+            if stop:
+                return
+
+    def shutdown(self, timeout: float = 2.0) -> None:
+        """남은 이벤트를 기록하고 기록 스레드 종료"""
+        if self._thread is None:
+            return
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            pass
+        self._thread.join(timeout=timeout)
+        self._thread = None
+        if self.dropped:
+            logger.warning(f"트레이스 버퍼 초과로 버려진 이벤트: {self.dropped}개")
+
+
+class Tracer:
+    """샘플링 결정 및 트레이스 이벤트 생성"""
+
+    def __init__(self, sample_rate: float, path: str, buffer_size: int):
+        self.sample_rate = max(0.0, min(1.0, sample_rate))
+        self.writer = TraceWriter(path, buffer_size)
+
+    @property
+    def enabled(self) -> bool:
+        return self.sample_rate > 0.0
+
+    def should_sample(self) -> bool:
+        return self.enabled and random.random() < self.sample_rate
+
+    def event(
+        self,
+        hypothesis_id: str,
+        location: str,
+        message: str,
+        data: Optional[dict[str, Any]] = None,
+        duration_ms: Optional[float] = None,
+    ) -> None:
+        """현재 요청이 샘플링된 경우에만 이벤트 기록"""
+        trace = _current_trace.get()
+        if trace is None:
+            return
+        event = {
+            "sessionId": "debug-session",
+            "runId": trace.trace_id,
+            "hypothesisId": hypothesis_id,
+            "location": location,
+            "message": message,
+            "path": trace.path,
+            "data": data or {},
+            "timestamp": int(time.time() * 1000),
+        }
+        if duration_ms is not None:
+            event["durationMs"] = round(duration_ms, 3)
+        self.writer.emit(event)
+
+    @contextmanager
+    def span(
+        self,
+        hypothesis_id: str,
+        location: str,
+        message: str,
+        data: Optional[dict[str, Any]] = None,
+    ):
+        """구간 소요 시간을 기록하는 스팬 (샘플링되지 않은 요청에서는 아무 일도 하지 않음)"""
+        if _current_trace.get() is None:
+            yield
+            return
+        started = time.perf_counter()
+        error: Optional[BaseException] = None
+        try:
+            yield
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            span_data = dict(data or {})
+            if error is not None:
+                span_data["error"] = str(error)
+                span_data["error_type"] = type(error).__name__
+            self.event(
+                hypothesis_id,
+                location,
+                message,
+                span_data,
+                duration_ms=(time.perf_counter() - started) * 1000,
+            )
+
+    def shutdown(self) -> None:
+        self.writer.shutdown()
+
+
+tracer = Tracer(
+    sample_rate=settings.trace_sample_rate,
+    path=settings.trace_log_path,
+    buffer_size=settings.trace_buffer_size,
+)
+
+
+class TraceMiddleware:
+    """요청 단위 샘플링 (ASGI 미들웨어, 샘플링 비활성화 시 오버헤드 없음)"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not tracer.should_sample():
+            await self.app(scope, receive, send)
+            return
+
+        token = _current_trace.set(
+            TraceContext(trace_id=uuid.uuid4().hex, path=scope.get("path", ""))
+        )
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _current_trace.reset(token)
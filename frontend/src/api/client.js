@@ -59,6 +59,11 @@ const apiRequest = async (url, options = {}) => {
     
     clearTimeout(timeoutId) // 성공 시 타임아웃 취소
     
+    // 응답 헤더가 필요한 호출(페이지네이션 등)을 위한 콜백
+    if (options.onResponse) {
+      options.onResponse(response)
+    }
+    
     if (!response.ok) {
       // 에러 응답 본문 읽기 (본문이 없을 수 있음)
       let error = { detail: response.statusText }
@@ -173,6 +178,29 @@ export const apiGet = async (url, params = {}) => {
   return apiRequest(urlObj.toString())
 }
 
+/**
+ * 페이지 단위 GET 요청 (X-Next-Cursor 헤더로 다음 페이지 커서 반환)
+ * @param {string} url - 요청 URL
+ * @param {Object} params - 쿼리 파라미터 (limit, cursor 등)
+ * @returns {Promise<{items: any[], nextCursor: string|null}>}
+ */
+export const apiGetPage = async (url, params = {}) => {
+  const urlObj = new URL(url)
+  Object.entries(params).forEach(([key, value]) => {
+    if (value !== null && value !== undefined) {
+      urlObj.searchParams.append(key, value.toString())
+    }
+  })
+  
+  let nextCursor = null
+  const items = await apiRequest(urlObj.toString(), {
+    onResponse: (response) => {
+      nextCursor = response.headers.get('X-Next-Cursor')
+    },
+  })
+  return { items: items || [], nextCursor }
+}
+
 /**
  * POST 요청
  * @param {string} url - 요청 URL
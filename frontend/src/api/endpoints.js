@@ -18,6 +18,7 @@ export const API_ENDPOINTS = {
     GET: (id) => `${API_BASE_URL}/api/assets/${id}`,
     UPDATE: (id) => `${API_BASE_URL}/api/assets/${id}`,
     DELETE: (id) => `${API_BASE_URL}/api/assets/${id}`,
+    BATCH: `${API_BASE_URL}/api/assets/batch`,
   },
   
   // 거래 관련
@@ -27,14 +28,25 @@ export const API_ENDPOINTS = {
     GET: (id) => `${API_BASE_URL}/api/transactions/${id}`,
     UPDATE: (id) => `${API_BASE_URL}/api/transactions/${id}`,
     DELETE: (id) => `${API_BASE_URL}/api/transactions/${id}`,
+    SEARCH: `${API_BASE_URL}/api/transactions/search`,
+    EXPORT: `${API_BASE_URL}/api/transactions/export`,
+    IMPORT: `${API_BASE_URL}/api/transactions/import`,
+    BATCH: `${API_BASE_URL}/api/transactions/batch`,
   },
   
   // 계산 관련
   CALCULATIONS: {
     SUMMARY: `${API_BASE_URL}/api/calculations/summary`,
     MONTHLY: `${API_BASE_URL}/api/calculations/monthly`,
+    TIMESERIES: `${API_BASE_URL}/api/calculations/timeseries`,
+    CATEGORIES: `${API_BASE_URL}/api/calculations/categories`,
+    NET_WORTH_HISTORY: `${API_BASE_URL}/api/calculations/net-worth-history`,
+    INSIGHTS: `${API_BASE_URL}/api/calculations/insights`,
   },
   
+  // 대시보드 (요약, 이번 달 합계, 최근 거래, 카테고리 한 번에 조회)
+  DASHBOARD: `${API_BASE_URL}/api/dashboard`,
+  
   // 카테고리 관련
   CATEGORIES: {
     LIST: `${API_BASE_URL}/api/categories`,
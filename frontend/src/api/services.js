@@ -1,4 +1,4 @@
-import { apiRequest, apiGet, apiPost, apiPut, apiDelete } from './client'
+import { apiRequest, apiGet, apiGetPage, apiPost, apiPut, apiDelete } from './client'
 import { API_ENDPOINTS } from './endpoints'
 
 /**
@@ -10,6 +10,8 @@ export const assetService = {
   createAsset: (data) => apiPost(API_ENDPOINTS.ASSETS.CREATE, data),
   updateAsset: (id, data) => apiPut(API_ENDPOINTS.ASSETS.UPDATE(id), data),
   deleteAsset: (id) => apiDelete(API_ENDPOINTS.ASSETS.DELETE(id)),
+  // operations: [{ action: 'create' | 'update' | 'delete', id?, data? }]
+  applyAssetBatch: (operations) => apiPost(API_ENDPOINTS.ASSETS.BATCH, { operations }),
 }
 
 /**
@@ -17,10 +19,23 @@ export const assetService = {
  */
 export const transactionService = {
   getTransactions: () => apiGet(API_ENDPOINTS.TRANSACTIONS.LIST),
+  // 최신순 한 페이지 조회 ({ items, nextCursor }, 다음 페이지는 nextCursor로 요청)
+  getTransactionPage: (cursor, limit) =>
+    apiGetPage(API_ENDPOINTS.TRANSACTIONS.LIST, { cursor, limit }),
+  // 메모 검색 (관련도, 최신순)
+  searchTransactions: (q, limit) => {
+    const url = new URL(API_ENDPOINTS.TRANSACTIONS.SEARCH)
+    url.searchParams.set('q', q)
+    if (limit) url.searchParams.set('limit', limit)
+    return apiGet(url.toString())
+  },
   getTransaction: (id) => apiGet(API_ENDPOINTS.TRANSACTIONS.GET(id)),
   createTransaction: (data) => apiPost(API_ENDPOINTS.TRANSACTIONS.CREATE, data),
   updateTransaction: (id, data) => apiPut(API_ENDPOINTS.TRANSACTIONS.UPDATE(id), data),
   deleteTransaction: (id) => apiDelete(API_ENDPOINTS.TRANSACTIONS.DELETE(id)),
+  // operations: [{ action: 'create' | 'update' | 'delete', id?, data? }]
+  applyTransactionBatch: (operations) =>
+    apiPost(API_ENDPOINTS.TRANSACTIONS.BATCH, { operations }),
 }
 
 /**
@@ -34,6 +49,48 @@ export const calculationService = {
     if (month) url.searchParams.set('month', month)
     return apiGet(url.toString())
   },
+  // granularity: 'day' | 'week' | 'month' | 'year', start/end: 'YYYY-MM-DD'
+  getTimeseries: (granularity, start, end) => {
+    const url = new URL(API_ENDPOINTS.CALCULATIONS.TIMESERIES)
+    if (granularity) url.searchParams.set('granularity', granularity)
+    if (start) url.searchParams.set('start', start)
+    if (end) url.searchParams.set('end', end)
+    return apiGet(url.toString())
+  },
+  // 카테고리별 합계 (기본값: 이번 달)
+  getCategoryBreakdown: (start, end, type) => {
+    const url = new URL(API_ENDPOINTS.CALCULATIONS.CATEGORIES)
+    if (start) url.searchParams.set('start', start)
+    if (end) url.searchParams.set('end', end)
+    if (type) url.searchParams.set('transaction_type', type)
+    return apiGet(url.toString())
+  },
+  // 순자산 추이 (값이 바뀌는 날짜만 반환)
+  getNetWorthHistory: (start, end) => {
+    const url = new URL(API_ENDPOINTS.CALCULATIONS.NET_WORTH_HISTORY)
+    url.searchParams.set('start', start)
+    if (end) url.searchParams.set('end', end)
+    return apiGet(url.toString())
+  },
+  // 지출 분석 (이동 평균, 전월 대비, 카테고리 추세, 이상 지출, 기본값: 최근 6개월)
+  getInsights: (start, end) => {
+    const url = new URL(API_ENDPOINTS.CALCULATIONS.INSIGHTS)
+    if (start) url.searchParams.set('start', start)
+    if (end) url.searchParams.set('end', end)
+    return apiGet(url.toString())
+  },
+}
+
+/**
+ * 대시보드 API 서비스
+ */
+export const dashboardService = {
+  // 요약, 이번 달 합계, 최근 거래(recentLimit건), 카테고리를 한 번에 조회
+  getDashboard: (recentLimit) => {
+    const url = new URL(API_ENDPOINTS.DASHBOARD)
+    if (recentLimit) url.searchParams.set('recent_limit', recentLimit)
+    return apiGet(url.toString())
+  },
 }
 
 /**
@@ -1,6 +1,6 @@
 import { useState, useEffect } from 'react'
 import { useLocation } from 'react-router-dom'
-import { calculationService } from '../api/services'
+import { dashboardService } from '../api/services'
 
 /**
  * 요약 화면 컴포넌트
@@ -56,10 +56,10 @@ export default function Summary() {
       setError(null)
       
       // API 호출 (타임아웃은 apiRequest 내부에서 처리)
-      const [summaryData, monthlyData] = await Promise.all([
-        calculationService.getSummary(),
-        calculationService.getMonthlySummary(),
-      ])
+      // 대시보드 한 번의 요청으로 요약과 이번 달 합계를 함께 조회
+      const dashboard = await dashboardService.getDashboard()
+      const summaryData = dashboard?.summary
+      const monthlyData = dashboard?.monthly
       
       // 데이터가 정상적으로 반환된 경우에만 상태 업데이트
       if (summaryData && monthlyData) {
@@ -6,7 +6,9 @@ import { transactionService, categoryService } from '../api/services'
  */
 export default function TransactionForm() {
   const [transactions, setTransactions] = useState([])
+  const [nextCursor, setNextCursor] = useState(null)
   const [loading, setLoading] = useState(false)
+  const [loadingMore, setLoadingMore] = useState(false)
   const [submitting, setSubmitting] = useState(false)
   const [deletingId, setDeletingId] = useState(null)
   const [error, setError] = useState(null)
@@ -45,9 +47,11 @@ export default function TransactionForm() {
       setError(null)
       
       // API 호출 (타임아웃은 apiRequest 내부에서 처리)
-      const data = await transactionService.getTransactions()
+      // 첫 페이지만 조회하고, 이후 페이지는 '더 보기'로 불러옴
+      const { items, nextCursor } = await transactionService.getTransactionPage()
       
-      setTransactions(data || [])
+      setTransactions(items)
+      setNextCursor(nextCursor)
     } catch (err) {
       console.error('거래 로드 오류:', err)
       const errorMessage = err.message || '거래를 불러오는 중 오류가 발생했습니다.'
@@ -65,6 +69,23 @@ export default function TransactionForm() {
     }
   }
 
+  const loadMoreTransactions = async () => {
+    if (!nextCursor || loadingMore) return
+    
+    try {
+      setLoadingMore(true)
+      setError(null)
+      const { items, nextCursor: cursor } = await transactionService.getTransactionPage(nextCursor)
+      setTransactions(prev => [...prev, ...items])
+      setNextCursor(cursor)
+    } catch (err) {
+      console.error('거래 추가 로드 오류:', err)
+      setError(err.message || '거래를 불러오는 중 오류가 발생했습니다.')
+    } finally {
+      setLoadingMore(false)
+    }
+  }
+
   const handleSubmit = async (e) => {
     e.preventDefault()
     setError(null)
@@ -557,6 +578,26 @@ export default function TransactionForm() {
             ))}
           </div>
         )}
+        {!loading && nextCursor && (
+          <div style={{ textAlign: 'center', marginTop: '20px' }}>
+            <button
+              onClick={loadMoreTransactions}
+              disabled={loadingMore}
+              style={{
+                padding: '12px 28px',
+                backgroundColor: loadingMore ? '#BDBDBD' : '#FFFFFF',
+                color: loadingMore ? '#FFFFFF' : '#5D4037',
+                border: loadingMore ? 'none' : '2px solid #D7CCC8',
+                borderRadius: '12px',
+                cursor: loadingMore ? 'not-allowed' : 'pointer',
+                fontWeight: '500',
+                fontSize: '15px',
+              }}
+            >
+              {loadingMore ? '불러오는 중...' : '더 보기'}
+            </button>
+          </div>
+        )}
       </div>
     </div>
   )
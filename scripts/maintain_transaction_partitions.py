@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+거래 연도 파티션 관리
+올해부터 N년 뒤까지 파티션을 미리 만들고, 오래된 연도 파티션을 분리합니다.
+서버 시작 시에도 미리 만들지만 오래 떠 있는 서버를 위해 매년(예: 12월) cron으로 실행하세요.
+
+실행:
+    python -m scripts.maintain_transaction_partitions                 # 올해 ~ TRANSACTION_PARTITIONS_AHEAD년 뒤
+    python -m scripts.maintain_transaction_partitions --ahead 3       # 올해 ~ 3년 뒤
+    python -m scripts.maintain_transaction_partitions --year 2019     # 특정 연도 (기본 파티션의 행 이동)
+    python -m scripts.maintain_transaction_partitions --list          # 파티션 목록
+    python -m scripts.maintain_transaction_partitions --detach 2019   # 2019년 파티션 분리 (보관용)
+"""
+import argparse
+import asyncio
+import logging
+
+from app.database import AsyncSessionLocal, engine
+from app.services.partition_service import PartitionService
+
+
+async def main(args: argparse.Namespace) -> None:
+    async with AsyncSessionLocal() as db:
+        if not await PartitionService.is_partitioned(db):
+            print("transactions가 파티션 테이블이 아닙니다 (alembic upgrade head 먼저 실행)")
+        elif args.list:
+            for partition in await PartitionService.list_partitions(db):
+                bounds = (
+                    f"{partition.start} ~ {partition.end}" if partition.start else "DEFAULT"
+                )
+                print(f"{partition.name}\t{bounds}\t약 {partition.estimated_rows}행")
+        elif args.detach is not None:
+            name = await PartitionService.detach_partition(db, args.detach)
+            print(f"파티션 분리 완료: {name} (백업 후 DROP TABLE {name}; 으로 삭제)")
+        elif args.year is not None:
+            await PartitionService.lock(db)
+            created = await PartitionService.create_partition(db, args.year)
+            await db.commit()
+            print(f"파티션 {'생성' if created else '이미 있음'}: "
+                  f"{PartitionService.partition_name(args.year)}")
+        else:
+            created = await PartitionService.ensure_partitions(db, args.ahead)
+            print(f"파티션 생성 완료: {', '.join(created) if created else '없음 (모두 있음)'}")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="거래 연도 파티션 관리")
+    parser.add_argument("--ahead", type=int, help="올해 이후 미리 만들 햇수 (기본값: 설정값)")
+    parser.add_argument("--year", type=int, help="만들 연도 (과거 연도 포함)")
+    parser.add_argument("--detach", type=int, metavar="YEAR", help="분리할 연도")
+    parser.add_argument("--list", action="store_true", help="파티션 목록 출력")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main(args))
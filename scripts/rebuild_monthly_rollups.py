@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+월별 거래 집계(monthly_rollups) 재생성
+transactions에서 집계를 다시 계산합니다 (초기 채우기 및 불일치 복구).
+
+실행:
+    python -m scripts.rebuild_monthly_rollups              # 전체
+    python -m scripts.rebuild_monthly_rollups --user <id>  # 특정 사용자만
+"""
+import argparse
+import asyncio
+import logging
+
+from app.database import AsyncSessionLocal, engine
+from app.services.rollup_service import RollupService
+
+
+async def main(user_id: str = None) -> None:
+    async with AsyncSessionLocal() as db:
+        rows = await RollupService.rebuild(db, user_id)
+    await engine.dispose()
+    print(f"월별 집계 재생성 완료: {rows}행")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="월별 거래 집계 재생성")
+    parser.add_argument("--user", dest="user_id", help="다시 계산할 user_id (기본값: 전체)")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main(args.user_id))
@@ -0,0 +1,22 @@
+-- 일일 자산 스냅샷 테이블 (순자산 추이용)
+-- 자산 생성/수정/삭제 시 소유자의 그날 합계가 기록되며, 같은 날의 변경은 한 행으로 합쳐집니다
+-- Supabase 대시보드의 SQL Editor에서 실행하세요
+
+-- 1. asset_snapshots 테이블 생성 (기본키 (user_id, snapshot_date)로 기간 조회)
+CREATE TABLE IF NOT EXISTS asset_snapshots (
+    user_id VARCHAR NOT NULL REFERENCES users(user_id),
+    snapshot_date DATE NOT NULL,
+    total_assets NUMERIC(15, 2) NOT NULL,
+    total_liabilities NUMERIC(15, 2) NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+    PRIMARY KEY (user_id, snapshot_date)
+);
+
+-- 2. 현재 자산 합계를 첫 스냅샷으로 기록
+INSERT INTO asset_snapshots (user_id, snapshot_date, total_assets, total_liabilities)
+SELECT user_id, CURRENT_DATE,
+       COALESCE(SUM(amount) FILTER (WHERE type = 'CASH'), 0),
+       COALESCE(SUM(amount) FILTER (WHERE type = 'LOAN'), 0)
+FROM assets
+GROUP BY user_id
+ON CONFLICT (user_id, snapshot_date) DO NOTHING;
@@ -0,0 +1,10 @@
+-- 가계부 데이터 버전 테이블 (조건부 GET / ETag용)
+-- 가족 그룹("g:<family_group_id>") 또는 개인("u:<user_id>") 단위로 자산/거래/가족 구성 변경 시 증가합니다
+-- 행이 없는 범위는 버전 0으로 취급하므로 채울 데이터는 없습니다
+-- Supabase 대시보드의 SQL Editor에서 실행하세요
+
+CREATE TABLE IF NOT EXISTS data_versions (
+    scope_key VARCHAR PRIMARY KEY,
+    version BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now()
+);
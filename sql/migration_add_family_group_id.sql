@@ -0,0 +1,34 @@
+-- assets / transactions 테이블에 family_group_id (가족 가계부 id) 추가
+-- 가족 가계부 조회를 구성원 목록 IN (...) 대신 단일 키 인덱스 범위 스캔으로 처리하기 위함
+-- Supabase 대시보드의 SQL Editor에서 실행하세요 (create_family_tables.sql 실행 후)
+
+-- 1. family_group_id 컬럼 추가 (가족 그룹이 없는 사용자의 데이터는 NULL)
+ALTER TABLE assets ADD COLUMN IF NOT EXISTS family_group_id UUID;
+ALTER TABLE transactions ADD COLUMN IF NOT EXISTS family_group_id UUID;
+
+-- 2. 외래키 제약 조건 추가 (가족 그룹 삭제 시 개인 데이터로 전환)
+ALTER TABLE assets
+    ADD CONSTRAINT fk_assets_family_group_id
+    FOREIGN KEY (family_group_id) REFERENCES family_groups(id) ON DELETE SET NULL;
+ALTER TABLE transactions
+    ADD CONSTRAINT fk_transactions_family_group_id
+    FOREIGN KEY (family_group_id) REFERENCES family_groups(id) ON DELETE SET NULL;
+
+-- 3. 기존 데이터 채우기 (관리하는 그룹 우선, 없으면 구성원으로 속한 그룹)
+UPDATE assets a
+SET family_group_id = COALESCE(
+    (SELECT g.id FROM family_groups g WHERE g.admin_user_id = a.user_id LIMIT 1),
+    (SELECT m.family_group_id FROM family_members m WHERE m.user_id = a.user_id LIMIT 1)
+);
+
+UPDATE transactions t
+SET family_group_id = COALESCE(
+    (SELECT g.id FROM family_groups g WHERE g.admin_user_id = t.user_id LIMIT 1),
+    (SELECT m.family_group_id FROM family_members m WHERE m.user_id = t.user_id LIMIT 1)
+);
+
+-- 4. 가족 가계부 조회용 복합 인덱스
+CREATE INDEX IF NOT EXISTS ix_assets_family_group_id_created_at
+    ON assets(family_group_id, created_at DESC);
+CREATE INDEX IF NOT EXISTS ix_transactions_family_group_id_date
+    ON transactions(family_group_id, date DESC, created_at DESC);
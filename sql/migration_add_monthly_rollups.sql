@@ -0,0 +1,25 @@
+-- 월별 거래 집계 테이블 (소유자, 월, 유형, 카테고리별 합계와 건수)
+-- 월 단위 수입/지출 및 카테고리 집계를 거래 전체 스캔 대신 월 수만큼의 행으로 계산하기 위함
+-- Supabase 대시보드의 SQL Editor에서 실행하세요 (migration_add_categories.sql 실행 후)
+
+-- 1. monthly_rollups 테이블 생성
+CREATE TABLE IF NOT EXISTS monthly_rollups (
+    user_id VARCHAR NOT NULL REFERENCES users(user_id),
+    month DATE NOT NULL,  -- 해당 월 1일
+    type transactiontype NOT NULL,
+    category_id UUID NOT NULL REFERENCES categories(id),
+    total NUMERIC(15, 2) NOT NULL DEFAULT 0,
+    count INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+    PRIMARY KEY (user_id, month, type, category_id)
+);
+
+-- 2. 기존 거래로 채우기 (category_id가 없는 과거 데이터 제외)
+-- 이후 불일치가 생기면 python -m scripts.rebuild_monthly_rollups 로 다시 계산
+DELETE FROM monthly_rollups;
+INSERT INTO monthly_rollups (user_id, month, type, category_id, total, count)
+SELECT user_id, date_trunc('month', date::timestamp)::date, type, category_id,
+       SUM(amount), COUNT(*)
+FROM transactions
+WHERE category_id IS NOT NULL
+GROUP BY 1, 2, 3, 4;
@@ -0,0 +1,13 @@
+-- 거래 목록 keyset 페이지네이션 인덱스
+-- 정렬 (date DESC, created_at DESC, id DESC) 과 일치하는 가족/개인 가계부 인덱스를 만들고,
+-- 이를 대체하는 ix_transactions_family_group_id_date 인덱스를 삭제합니다
+-- CONCURRENTLY는 트랜잭션 안에서 실행할 수 없으므로 한 문장씩 실행하세요
+-- Supabase 대시보드의 SQL Editor에서 실행하세요
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_transactions_family_group_id_date_id
+    ON transactions(family_group_id, date DESC, created_at DESC, id DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_transactions_user_id_date_id
+    ON transactions(user_id, date DESC, created_at DESC, id DESC);
+
+DROP INDEX CONCURRENTLY IF EXISTS ix_transactions_family_group_id_date;
@@ -0,0 +1,11 @@
+-- 거래 메모 검색 컬럼 및 인덱스
+-- GET /api/transactions/search 용 생성 컬럼 memo_search (memo의 tsvector, DB가 계산해 저장)와 GIN 인덱스
+-- 컬럼 추가는 테이블을 다시 쓰므로 그동안 transactions 읽기/쓰기가 대기합니다 (사용량이 적은 시간에 실행)
+-- CREATE INDEX CONCURRENTLY는 트랜잭션 안에서 실행할 수 없으므로 한 문장씩 실행하세요
+-- Supabase 대시보드의 SQL Editor에서 실행하세요
+
+ALTER TABLE transactions ADD COLUMN IF NOT EXISTS memo_search tsvector
+    GENERATED ALWAYS AS (to_tsvector('simple'::regconfig, coalesce(memo, ''))) STORED;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_transactions_memo_search
+    ON transactions USING gin (memo_search);
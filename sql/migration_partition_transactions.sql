@@ -0,0 +1,79 @@
+-- 거래 테이블 연 단위 파티션 전환
+-- transactions를 date 기준 범위 파티션 테이블로 바꿉니다 (transactions_yYYYY + transactions_default).
+-- 데이터가 있는 연도(최근 30년)와 올해/내년 파티션을 만들고, 기존 행을 옮긴 뒤
+-- 기본 키를 (id, date)로 바꾸고 인덱스/외래 키/트리거는 기존 정의 그대로 다시 만듭니다.
+-- 행을 옮기는 동안 transactions 읽기/쓰기가 대기하므로 사용량이 적은 시간에 실행하세요.
+-- 이후 연도 파티션은 서버 시작 시 또는 python -m scripts.maintain_transaction_partitions 로 미리 만듭니다.
+-- Supabase 대시보드의 SQL Editor에서 실행하세요
+
+DO $$
+DECLARE
+    this_year int := extract(year FROM current_date)::int;
+    definitions text[];
+    definition text;
+    column_list text;
+    partition_year int;
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = 'transactions'::regclass) THEN
+        RAISE NOTICE 'transactions는 이미 파티션 테이블입니다';
+        RETURN;
+    END IF;
+
+    LOCK TABLE transactions IN ACCESS EXCLUSIVE MODE;
+
+    -- 다시 만들 인덱스/외래 키/트리거 정의 (기본 키 제외)
+    SELECT array_agg(def) INTO definitions FROM (
+        SELECT pg_get_indexdef(indexrelid) AS def FROM pg_index
+        WHERE indrelid = 'transactions'::regclass AND NOT indisprimary
+        UNION ALL
+        SELECT format('ALTER TABLE transactions ADD CONSTRAINT %I %s', conname, pg_get_constraintdef(oid))
+        FROM pg_constraint WHERE conrelid = 'transactions'::regclass AND contype = 'f'
+        UNION ALL
+        SELECT pg_get_triggerdef(oid) FROM pg_trigger
+        WHERE tgrelid = 'transactions'::regclass AND NOT tgisinternal
+    ) d;
+    -- 생성 컬럼(memo_search)은 새 테이블이 다시 계산하므로 제외
+    SELECT string_agg(quote_ident(column_name), ', ' ORDER BY ordinal_position) INTO column_list
+    FROM information_schema.columns
+    WHERE table_schema = current_schema() AND table_name = 'transactions' AND is_generated = 'NEVER';
+
+    ALTER TABLE transactions RENAME TO transactions_previous;
+    CREATE TABLE transactions (LIKE transactions_previous
+        INCLUDING DEFAULTS INCLUDING GENERATED INCLUDING CONSTRAINTS
+        INCLUDING STORAGE INCLUDING COMMENTS)
+        PARTITION BY RANGE (date);
+
+    FOR partition_year IN
+        SELECT DISTINCT extract(year FROM date)::int FROM transactions_previous
+        WHERE date >= make_date(this_year - 30, 1, 1) AND date < make_date(this_year, 1, 1)
+        UNION SELECT this_year UNION SELECT this_year + 1
+    LOOP
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF transactions FOR VALUES FROM (%L) TO (%L)',
+            'transactions_y' || partition_year,
+            make_date(partition_year, 1, 1),
+            make_date(partition_year + 1, 1, 1)
+        );
+    END LOOP;
+    CREATE TABLE transactions_default PARTITION OF transactions DEFAULT;
+
+    EXECUTE format(
+        'INSERT INTO transactions (%s) SELECT %s FROM transactions_previous', column_list, column_list
+    );
+    DROP TABLE transactions_previous;
+
+    ALTER TABLE transactions ADD CONSTRAINT transactions_pkey PRIMARY KEY (id, date);
+    FOREACH definition IN ARRAY coalesce(definitions, '{}') LOOP
+        EXECUTE definition;
+    END LOOP;
+END $$;
+
+ANALYZE transactions;
+
+-- 확인: 파티션별 행 수
+-- SELECT tableoid::regclass AS partition, count(*) FROM transactions GROUP BY 1 ORDER BY 1;
+
+-- 오래된 연도 보관 (예: 2019년)
+-- 분리 후 월별 집계 정리와 캐시 무효화까지 하려면 스크립트를 사용하세요:
+--   python -m scripts.maintain_transaction_partitions --detach 2019
+-- 분리한 테이블은 pg_dump -t transactions_y2019 로 백업한 뒤 DROP TABLE transactions_y2019; 로 삭제합니다.
@@ -0,0 +1,13 @@
+"""
+테스트 공통 설정
+app.config.Settings는 import 시 환경 변수를 읽으므로 앱 모듈을 import하기 전에 채웁니다.
+DB가 필요한 테스트는 TEST_DATABASE_URL(alembic upgrade head를 적용한 DB)이 있을 때만 실행합니다.
+"""
+import os
+
+if os.environ.get("TEST_DATABASE_URL"):
+    os.environ["DATABASE_URL"] = os.environ["TEST_DATABASE_URL"]
+os.environ.setdefault("DATABASE_URL", "postgresql+asyncpg://postgres@localhost:5432/household_test")
+os.environ.setdefault("SUPABASE_URL", "http://localhost")
+os.environ.setdefault("SUPABASE_KEY", "test")
+os.environ.setdefault("ENVIRONMENT", "test")
@@ -0,0 +1,191 @@
+"""일괄 처리(apply_batch) 동시성 테스트 (TEST_DATABASE_URL 필요)"""
+import asyncio
+import os
+from datetime import date
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select, delete, func, insert
+
+from app.database import AsyncSessionLocal, engine
+from app.models.asset import Asset, AssetType
+from app.models.category import Category
+from app.models.data_version import DataVersion
+from app.models.rollup import MonthlyRollup
+from app.models.snapshot import AssetSnapshot
+from app.models.transaction import Transaction, TransactionType
+from app.models.user import User
+from app.schemas.asset import AssetBatchUpdate, AssetBatchDelete, AssetCreate, AssetUpdate
+from app.schemas.transaction import (
+    TransactionBatchUpdate,
+    TransactionBatchDelete,
+    TransactionCreate,
+    TransactionUpdate,
+)
+from app.services.asset_service import AssetService
+from app.services.rollup_service import RollupService
+from app.services.transaction_service import TransactionService
+
+pytestmark = pytest.mark.skipif(
+    not os.environ.get("TEST_DATABASE_URL"),
+    reason="TEST_DATABASE_URL이 필요합니다 (alembic upgrade head를 적용한 테스트 DB)",
+)
+
+# 다른 세션의 삭제가 잠금을 잡은 채 기다리는 시간 (배치가 대상 행에서 대기하도록)
+HOLD_SECONDS = 0.5
+
+
+async def _create_user() -> str:
+    user_id = f"test-batch-{uuid4()}"
+    async with AsyncSessionLocal() as db:
+        await db.execute(insert(User).values(user_id=user_id))
+        await db.commit()
+    return user_id
+
+
+async def _cleanup(user_id: str) -> None:
+    async with AsyncSessionLocal() as db:
+        for model in (Transaction, MonthlyRollup, Asset, AssetSnapshot):
+            await db.execute(delete(model).where(model.user_id == user_id))
+        await db.execute(delete(DataVersion).where(DataVersion.scope_key == f"u:{user_id}"))
+        await db.execute(delete(User).where(User.user_id == user_id))
+        await db.commit()
+    await engine.dispose()
+
+
+async def _rollups_match(user_id: str) -> bool:
+    """월별 집계가 거래에서 다시 계산한 값과 같은지 (건수 0인 집계 행 제외)"""
+    month = func.date_trunc("month", Transaction.date).cast(Transaction.date.type)
+    async with AsyncSessionLocal() as db:
+        actual = await db.execute(
+            select(month, Transaction.type, Transaction.category_id,
+                   func.sum(Transaction.amount), func.count())
+            .where(Transaction.user_id == user_id)
+            .group_by(month, Transaction.type, Transaction.category_id)
+        )
+        recorded = await db.execute(
+            select(MonthlyRollup.month, MonthlyRollup.type, MonthlyRollup.category_id,
+                   MonthlyRollup.total, MonthlyRollup.count)
+            .where(MonthlyRollup.user_id == user_id, MonthlyRollup.count != 0)
+        )
+        return set(map(tuple, actual)) == set(map(tuple, recorded))
+
+
+async def _transaction_target_deleted_mid_batch() -> None:
+    user_id = await _create_user()
+    try:
+        async with AsyncSessionLocal() as db:
+            category_id = await db.scalar(
+                select(Category.id).where(Category.type == TransactionType.EXPENSE).limit(1)
+            )
+            doomed, kept = [
+                await TransactionService.create_transaction(
+                    db,
+                    TransactionCreate(
+                        type=TransactionType.EXPENSE,
+                        amount=amount,
+                        category_id=category_id,
+                        date=date(2026, 3, 1),
+                    ),
+                    user_id,
+                )
+                for amount in (10, 20)
+            ]
+
+        # 다른 요청이 대상 하나를 삭제하고 아직 커밋하지 않은 상태에서 배치 시작
+        async with AsyncSessionLocal() as other, AsyncSessionLocal() as db:
+            await RollupService.record_change(
+                other, (RollupService.key_of(doomed), doomed.amount), None
+            )
+            await other.execute(delete(Transaction).where(Transaction.id == doomed.id))
+            batch = asyncio.create_task(
+                TransactionService.apply_batch(
+                    db,
+                    [
+                        TransactionBatchUpdate(
+                            action="update", id=doomed.id, data=TransactionUpdate(amount=11)
+                        ),
+                        TransactionBatchUpdate(
+                            action="update", id=kept.id, data=TransactionUpdate(amount=21)
+                        ),
+                    ],
+                    user_id,
+                )
+            )
+            await asyncio.sleep(HOLD_SECONDS)
+            await other.commit()
+            response = await batch
+
+        assert all(item is not None for item in response.results)
+        assert [item.status for item in response.results] == [404, 200]
+        assert response.results[1].transaction.amount == 21
+
+        async with AsyncSessionLocal() as other, AsyncSessionLocal() as db:
+            await other.execute(delete(Transaction).where(Transaction.id == kept.id))
+            await RollupService.record_change(
+                other, (RollupService.key_of(kept), Decimal("21")), None
+            )
+            batch = asyncio.create_task(
+                TransactionService.apply_batch(
+                    db,
+                    [
+                        TransactionBatchDelete(action="delete", id=kept.id),
+                        TransactionBatchUpdate(
+                            action="update", id=uuid4(), data=TransactionUpdate(amount=1)
+                        ),
+                    ],
+                    user_id,
+                )
+            )
+            await asyncio.sleep(HOLD_SECONDS)
+            await other.commit()
+            response = await batch
+
+        # 이미 삭제된 대상은 204가 아니라 404, 집계는 한 번만 감소
+        assert [item.status for item in response.results] == [404, 404]
+        assert response.failed == 2
+        assert await _rollups_match(user_id)
+    finally:
+        await _cleanup(user_id)
+
+
+async def _asset_target_deleted_mid_batch() -> None:
+    user_id = await _create_user()
+    try:
+        async with AsyncSessionLocal() as db:
+            doomed, kept = [
+                await AssetService.create_asset(
+                    db, AssetCreate(type=AssetType.CASH, name=name, amount=100), user_id
+                )
+                for name in ("doomed", "kept")
+            ]
+
+        async with AsyncSessionLocal() as other, AsyncSessionLocal() as db:
+            await other.execute(delete(Asset).where(Asset.id == doomed.id))
+            batch = asyncio.create_task(
+                AssetService.apply_batch(
+                    db,
+                    [
+                        AssetBatchDelete(action="delete", id=doomed.id),
+                        AssetBatchUpdate(action="update", id=kept.id, data=AssetUpdate(amount=50)),
+                    ],
+                    user_id,
+                )
+            )
+            await asyncio.sleep(HOLD_SECONDS)
+            await other.commit()
+            response = await batch
+
+        assert [item.status for item in response.results] == [404, 200]
+        assert response.succeeded == 1
+    finally:
+        await _cleanup(user_id)
+
+
+def test_transaction_batch_target_deleted_mid_batch():
+    asyncio.run(_transaction_target_deleted_mid_batch())
+
+
+def test_asset_batch_target_deleted_mid_batch():
+    asyncio.run(_asset_target_deleted_mid_batch())
@@ -0,0 +1,50 @@
+"""카테고리 레지스트리 재로드 테스트 (DB 대신 조회 횟수를 세는 세션 사용)"""
+import asyncio
+from uuid import uuid4
+
+from app.models.transaction import TransactionType
+from app.services.category_service import CategoryRegistry, CATEGORY_MIN_REFRESH_INTERVAL
+
+SALARY_ID = uuid4()
+
+
+class CountingSession:
+    """registry.refresh가 실행하는 카테고리 조회만 흉내 내는 세션"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = 0
+
+    async def execute(self, statement):
+        self.queries += 1
+        return list(self.rows)
+
+
+def test_unknown_ids_refresh_at_most_once_per_interval():
+    async def run():
+        registry = CategoryRegistry()
+        session = CountingSession([(SALARY_ID, TransactionType.INCOME, "월급", 1)])
+
+        categories = await registry.ensure(session, [SALARY_ID])
+        assert SALARY_ID in categories
+        assert session.queries == 1
+
+        # 임의 id는 간격 안에서 다시 읽지 않고 없는 것으로 처리
+        for _ in range(5):
+            missing = uuid4()
+            assert missing not in await registry.ensure(session, [missing])
+        assert session.queries == 1
+
+        # 간격이 지나면 모르는 id로 한 번 다시 읽음 (다른 프로세스에서 추가된 카테고리)
+        new_id = uuid4()
+        session.rows.append((new_id, TransactionType.EXPENSE, "외식", 1))
+        registry._loaded_at -= CATEGORY_MIN_REFRESH_INTERVAL
+        assert new_id in await registry.ensure(session, [new_id])
+        assert session.queries == 2
+
+        # 동시에 들어온 모르는 id 요청도 재로드는 한 번
+        registry._loaded_at -= CATEGORY_MIN_REFRESH_INTERVAL
+        await asyncio.gather(*(registry.ensure(session, [uuid4()]) for _ in range(10)))
+        assert session.queries == 3
+
+    asyncio.run(run())
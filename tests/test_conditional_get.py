@@ -0,0 +1,74 @@
+"""조회 실패 시 대체 응답 캐시 방지 테스트 (DB 대신 서비스를 바꿔 끼움)"""
+import asyncio
+
+import httpx
+import pytest
+
+from app.database import get_db
+from app.dependencies import get_current_user_id
+from app.main import app
+from app.services.asset_service import AssetService
+from app.services.calculation_service import CalculationService
+from app.services.data_version_service import DataVersionService
+from app.services.transaction_service import TransactionService
+
+ETAG = 'W/"0123456789abcdef0123"'
+
+
+async def _failing(*args, **kwargs):
+    raise ConnectionError("connection refused")
+
+
+async def _etag(db, user_id):
+    return ETAG
+
+
+async def _no_db():
+    yield None
+
+
+@pytest.fixture
+def client_get(monkeypatch):
+    monkeypatch.setattr(DataVersionService, "get_etag", _etag)
+    monkeypatch.setitem(app.dependency_overrides, get_current_user_id, lambda: "user")
+    monkeypatch.setitem(app.dependency_overrides, get_db, _no_db)
+
+    def get(path: str, **headers) -> httpx.Response:
+        async def run():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                return await client.get(path, headers=headers)
+
+        return asyncio.run(run())
+
+    return get
+
+
+@pytest.mark.parametrize(
+    "path, service, method, fallback",
+    [
+        ("/api/transactions", TransactionService, "get_transaction_page", []),
+        ("/api/assets", AssetService, "get_assets", []),
+        ("/api/calculations/summary", CalculationService, "get_summary", None),
+        ("/api/calculations/monthly", CalculationService, "get_monthly_summary", None),
+    ],
+)
+def test_failed_query_fallback_has_no_etag(client_get, monkeypatch, path, service, method, fallback):
+    monkeypatch.setattr(service, method, _failing)
+    response = client_get(path)
+    assert response.status_code == 200
+    if fallback is not None:
+        assert response.json() == fallback
+    assert "etag" not in response.headers
+    assert response.headers["cache-control"] == "no-store"
+
+
+def test_successful_query_has_etag_and_revalidates(client_get, monkeypatch):
+    async def page(*args, **kwargs):
+        return [], None
+
+    monkeypatch.setattr(TransactionService, "get_transaction_page", page)
+    response = client_get("/api/transactions")
+    assert response.status_code == 200
+    assert response.headers["etag"] == ETAG
+    assert client_get("/api/transactions", **{"If-None-Match": ETAG}).status_code == 304
@@ -0,0 +1,139 @@
+"""쓰기 시 데이터 버전 증가 범위 테스트 (TEST_DATABASE_URL 필요)"""
+import asyncio
+import io
+import os
+from datetime import date
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select, delete, insert
+
+from app.database import AsyncSessionLocal, engine
+from app.models.asset import Asset, AssetType
+from app.models.category import Category
+from app.models.data_version import DataVersion
+from app.models.family import FamilyGroup
+from app.models.rollup import MonthlyRollup
+from app.models.snapshot import AssetSnapshot
+from app.models.transaction import Transaction, TransactionType
+from app.models.user import User
+from app.schemas.asset import AssetBatchCreate, AssetBatchDelete, AssetCreate, AssetUpdate
+from app.schemas.transaction import (
+    TransactionBatchCreate,
+    TransactionBatchDelete,
+    TransactionCreate,
+    TransactionUpdate,
+)
+from app.services.asset_service import AssetService
+from app.services.data_version_service import DataVersionService
+from app.services.family_service import FamilyService
+from app.services.import_service import ImportService
+from app.services.transaction_service import TransactionService
+
+pytestmark = pytest.mark.skipif(
+    not os.environ.get("TEST_DATABASE_URL"),
+    reason="TEST_DATABASE_URL이 필요합니다 (alembic upgrade head를 적용한 테스트 DB)",
+)
+
+
+async def _versions(keys: list[str]) -> dict[str, int]:
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(DataVersion.scope_key, DataVersion.version).where(DataVersion.scope_key.in_(keys))
+        )
+        return {key: 0 for key in keys} | dict(result.all())
+
+
+async def _writes_after_join_on_other_worker() -> None:
+    user_id = f"test-bump-{uuid4()}"
+    personal_key = DataVersionService.scope_key(None, user_id)
+    group_key = None
+    try:
+        async with AsyncSessionLocal() as db:
+            await db.execute(insert(User).values(user_id=user_id))
+            await db.commit()
+            # 이 프로세스의 구성 캐시에는 "가족 없음"이 남은 채로 다른 프로세스에서 그룹 생성
+            assert await FamilyService.get_family_group_id(db, user_id) is None
+            family_group_id = await db.scalar(
+                insert(FamilyGroup).values(name="test", admin_user_id=user_id).returning(FamilyGroup.id)
+            )
+            await db.commit()
+            assert await FamilyService.get_family_group_id(db, user_id) is None
+            group_key = DataVersionService.scope_key(family_group_id, user_id)
+            category_id = await db.scalar(
+                select(Category.id).where(Category.type == TransactionType.EXPENSE).limit(1)
+            )
+
+        new_transaction = TransactionCreate(
+            type=TransactionType.EXPENSE, amount=10, category_id=category_id, date=date(2026, 3, 1)
+        )
+        new_asset = AssetCreate(type=AssetType.CASH, name="cash", amount=100)
+        state = {}
+
+        async def create_transaction(db):
+            state["transaction"] = await TransactionService.create_transaction(db, new_transaction, user_id)
+
+        async def create_asset(db):
+            state["asset"] = await AssetService.create_asset(db, new_asset, user_id)
+
+        writes = [
+            create_transaction,
+            lambda db: TransactionService.update_transaction(
+                db, state["transaction"].id, TransactionUpdate(amount=11), user_id
+            ),
+            lambda db: TransactionService.apply_batch(
+                db,
+                [
+                    TransactionBatchCreate(action="create", data=new_transaction),
+                    TransactionBatchDelete(action="delete", id=state["transaction"].id),
+                ],
+                user_id,
+            ),
+            create_asset,
+            lambda db: AssetService.update_asset(db, state["asset"].id, AssetUpdate(amount=50), user_id),
+            lambda db: AssetService.apply_batch(
+                db,
+                [
+                    AssetBatchCreate(action="create", data=new_asset),
+                    AssetBatchDelete(action="delete", id=state["asset"].id),
+                ],
+                user_id,
+            ),
+            lambda db: ImportService.import_transactions(
+                db, user_id, io.BytesIO(f"date,category,amount\n2026-03-02,{category_id},-3\n".encode())
+            ),
+        ]
+        for write in writes:
+            before = await _versions([group_key, personal_key])
+            async with AsyncSessionLocal() as db:
+                await write(db)
+            after = await _versions([group_key, personal_key])
+            # 쓴 행이 속한 가족 가계부의 버전이 올라가야 다른 구성원이 304를 받지 않음
+            assert after[group_key] == before[group_key] + 1
+            assert after[personal_key] == before[personal_key]
+
+        async with AsyncSessionLocal() as db:
+            transaction_id = await db.scalar(
+                select(Transaction.id).where(Transaction.user_id == user_id).limit(1)
+            )
+            before = await _versions([group_key])
+            await TransactionService.delete_transaction(db, transaction_id, user_id)
+            asset_id = await db.scalar(select(Asset.id).where(Asset.user_id == user_id).limit(1))
+            await AssetService.delete_asset(db, asset_id, user_id)
+        assert (await _versions([group_key]))[group_key] == before[group_key] + 2
+    finally:
+        async with AsyncSessionLocal() as db:
+            for model in (Transaction, MonthlyRollup, Asset, AssetSnapshot):
+                await db.execute(delete(model).where(model.user_id == user_id))
+            await db.execute(
+                delete(DataVersion).where(DataVersion.scope_key.in_([personal_key, group_key]))
+            )
+            await db.execute(delete(FamilyGroup).where(FamilyGroup.admin_user_id == user_id))
+            await db.execute(delete(User).where(User.user_id == user_id))
+            await db.commit()
+            FamilyService.invalidate_membership(db, [user_id])
+        await engine.dispose()
+
+
+def test_writes_bump_the_ledger_of_written_rows():
+    asyncio.run(_writes_after_join_on_other_worker())
@@ -0,0 +1,36 @@
+"""ETag 비교 테스트 (DB 불필요)"""
+from uuid import uuid4
+
+import pytest
+
+from app.services.data_version_service import DataVersionService
+
+ETAG = 'W/"0123456789abcdef0123"'
+
+
+@pytest.mark.parametrize(
+    "if_none_match",
+    [
+        ETAG,
+        '"0123456789abcdef0123"',
+        " * ",
+        '"other", W/"0123456789abcdef0123"',
+        'W/"other",' + ETAG,
+    ],
+)
+def test_etag_matches(if_none_match):
+    assert DataVersionService.etag_matches(if_none_match, ETAG)
+
+
+@pytest.mark.parametrize(
+    "if_none_match",
+    [None, "", 'W/"other"', '"other", "again"', '0123456789abcdef0123', 'W/"0123456789abcdef012"'],
+)
+def test_etag_does_not_match(if_none_match):
+    assert not DataVersionService.etag_matches(if_none_match, ETAG)
+
+
+def test_scope_key():
+    group_id = uuid4()
+    assert DataVersionService.scope_key(group_id, "user") == f"g:{group_id}"
+    assert DataVersionService.scope_key(None, "user") == "u:user"
@@ -0,0 +1,143 @@
+"""CSV 가져오기 파싱 테스트 (DB 불필요)"""
+import io
+from datetime import date
+from decimal import Decimal
+from types import MappingProxyType
+from uuid import UUID, uuid4
+
+import pytest
+
+from app.models.transaction import TransactionType
+from app.services.category_service import CategoryInfo
+from app.services.import_service import (
+    ImportParser,
+    ImportService,
+    IMPORT_BATCH_SIZE,
+    MAX_IMPORT_ERRORS,
+)
+
+SALARY = CategoryInfo(uuid4(), TransactionType.INCOME, "월급", 1)
+DINING = CategoryInfo(uuid4(), TransactionType.EXPENSE, "외식", 1)
+CATEGORIES_BY_ID = MappingProxyType({SALARY.id: SALARY, DINING.id: DINING})
+CATEGORIES_BY_NAME = {(c.type, c.name): c for c in CATEGORIES_BY_ID.values()}
+
+
+def parse(**row):
+    return ImportService.parse_row(row, CATEGORIES_BY_ID, CATEGORIES_BY_NAME)
+
+
+def parser_for(text: str, encoding: str = "utf-8") -> ImportParser:
+    parser = ImportParser(io.BytesIO(text.encode(encoding)), encoding, CATEGORIES_BY_ID)
+    parser.read_header()
+    return parser
+
+
+def test_parse_row_with_explicit_type():
+    record = parse(date="2026-10-05", type="EXPENSE", category="외식", amount="12,000", memo=" 점심 ")
+    transaction_id, type_name, amount, category_id, transaction_date, memo = record
+    assert isinstance(transaction_id, UUID)
+    assert (type_name, amount, category_id, transaction_date, memo) == (
+        "EXPENSE", Decimal("12000"), DINING.id, date(2026, 10, 5), "점심"
+    )
+
+
+def test_parse_row_korean_type_and_category_id():
+    record = parse(date="2026.10.05", type="수입", category=str(SALARY.id), amount="100")
+    assert record[1] == "INCOME"
+    assert record[3] == SALARY.id
+    assert record[4] == date(2026, 10, 5)
+    assert record[5] is None
+
+
+@pytest.mark.parametrize(
+    "amount, type_name, category, expected",
+    [
+        ("3,000,000", "INCOME", "월급", Decimal("3000000")),
+        ("-12000", "EXPENSE", "외식", Decimal("12000")),
+    ],
+)
+def test_parse_row_infers_type_from_sign(amount, type_name, category, expected):
+    record = parse(date="2026/10/06", category=category, amount=amount)
+    assert record[1] == type_name
+    assert record[2] == expected
+
+
+def test_parse_row_keeps_given_id():
+    transaction_id = uuid4()
+    assert parse(date="2026-01-01", category="월급", amount="1", id=str(transaction_id))[0] == transaction_id
+
+
+@pytest.mark.parametrize(
+    "row, message",
+    [
+        ({"amount": "abc"}, "금액 형식"),
+        ({"amount": "NaN"}, "금액 형식"),
+        ({"amount": "0"}, "0보다 커야"),
+        ({"type": "INCOME", "amount": "-5"}, "0보다 커야"),
+        ({"amount": "1.234"}, "금액 범위"),
+        ({"amount": "10000000000000"}, "금액 범위"),
+        ({"type": "FOO"}, "거래 유형"),
+        ({"date": "2026-13-01"}, "날짜 형식"),
+        ({"category": "없는카테고리"}, "카테고리를 찾을 수 없습니다"),
+        ({"type": "INCOME", "category": "외식"}, "카테고리를 찾을 수 없습니다"),
+        ({"type": "INCOME", "category": str(DINING.id)}, "카테고리 유형"),
+        ({"memo": "x" * 501}, "메모는 500자"),
+        ({"id": "not-a-uuid"}, "id 형식"),
+    ],
+)
+def test_parse_row_rejects_invalid_values(row, message):
+    base = {"date": "2026-01-01", "type": "INCOME", "category": "월급", "amount": "100"}
+    with pytest.raises(ValueError, match=message):
+        parse(**{**base, **row})
+
+
+def test_amount_at_limit_is_accepted():
+    assert parse(date="2026-01-01", type="INCOME", category="월급", amount="9999999999999.99")[2] == Decimal("9999999999999.99")
+
+
+def test_header_aliases():
+    parser = parser_for("\ufeff거래일,구분,카테고리,금액,내용\n2026-10-05,지출,외식,5000,커피\n")
+    assert parser.reader.fieldnames == ["date", "type", "category", "amount", "memo"]
+    [record] = parser.read_batch()
+    assert record[1:] == ("EXPENSE", Decimal("5000"), DINING.id, date(2026, 10, 5), "커피")
+
+
+def test_missing_required_header():
+    with pytest.raises(ValueError, match="필수 열이 없습니다: amount, category"):
+        parser_for("date,memo\n2026-01-01,x\n")
+
+
+def test_undecodable_header():
+    parser = ImportParser(io.BytesIO("날짜,카테고리,금액\n".encode("cp949")), "utf-8", CATEGORIES_BY_ID)
+    with pytest.raises(ValueError, match="encoding을 확인하세요"):
+        parser.read_header()
+
+
+def test_per_line_error_report():
+    parser = parser_for(
+        "date,category,amount\n"
+        "2026-01-01,월급,100\n"
+        "2026-13-01,월급,100\n"
+        "2026-01-02,없는카테고리,100\n"
+        "2026-01-03,외식,-10\n"
+    )
+    batch = parser.read_batch()
+    assert len(batch) == 2
+    assert parser.read_batch() == []
+    assert (parser.total_rows, parser.failed) == (4, 2)
+    assert [(error.line, error.error.split(":")[0]) for error in parser.errors] == [
+        (3, "날짜 형식이 잘못되었습니다 (YYYY-MM-DD)"),
+        (4, "카테고리를 찾을 수 없습니다"),
+    ]
+
+
+def test_batches_and_error_limit():
+    rows = ["date,category,amount"]
+    rows += ["2026-01-01,월급,1"] * (IMPORT_BATCH_SIZE + 1)
+    rows += ["2026-01-01,월급,0"] * (MAX_IMPORT_ERRORS + 5)
+    parser = parser_for("\n".join(rows) + "\n")
+    assert len(parser.read_batch()) == IMPORT_BATCH_SIZE
+    assert len(parser.read_batch()) == 1
+    assert parser.read_batch() == []
+    assert parser.failed == MAX_IMPORT_ERRORS + 5
+    assert len(parser.errors) == MAX_IMPORT_ERRORS
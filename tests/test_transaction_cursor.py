@@ -0,0 +1,118 @@
+"""거래 목록 커서 페이지네이션 테스트 (DB 대신 get_transactions를 바꿔 끼움)"""
+import asyncio
+import base64
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from app.models.transaction import TransactionType
+from app.services.transaction_service import (
+    TransactionCursor,
+    TransactionPosition,
+    TransactionService,
+)
+
+CURSOR = TransactionCursor(
+    after=TransactionPosition(date(2026, 10, 5), datetime(2026, 10, 5, 12, 30, 1, 123456), uuid4()),
+    transaction_type=TransactionType.EXPENSE,
+    start_date=date(2026, 10, 1),
+    end_date=None,
+)
+
+
+def test_cursor_round_trip():
+    encoded = TransactionService.encode_cursor(CURSOR)
+    assert "=" not in encoded
+    assert TransactionService.decode_cursor(encoded) == CURSOR
+
+
+def test_cursor_round_trip_without_filters():
+    cursor = CURSOR._replace(transaction_type=None, start_date=None)
+    assert TransactionService.decode_cursor(TransactionService.encode_cursor(cursor)) == cursor
+
+
+def _b64(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "",
+        "not base64!",
+        _b64(b"\xff\xfe"),
+        _b64(b"[]"),
+        _b64(b'{"d":"2026-10-05"}'),
+        _b64(b'{"d":"2026-13-05","c":"2026-10-05T00:00:00","i":"x","t":null,"s":null,"e":null}'),
+        TransactionService.encode_cursor(CURSOR)[:-3],
+    ],
+)
+def test_malformed_cursor_is_rejected(value):
+    with pytest.raises(ValueError, match="잘못된 커서입니다."):
+        TransactionService.decode_cursor(value)
+
+
+def _page(monkeypatch, rows, limit, **filters):
+    """get_transactions가 rows를 돌려주도록 바꾸고 요청된 limit/조건을 기록"""
+    calls = []
+
+    async def fake_get_transactions(db, user_id, transaction_type, start_date, end_date, limit, after):
+        calls.append((transaction_type, start_date, end_date, limit, after))
+        return rows[:limit]
+
+    monkeypatch.setattr(TransactionService, "get_transactions", fake_get_transactions)
+    page = asyncio.run(TransactionService.get_transaction_page(None, "user", limit, **filters))
+    return page, calls
+
+
+def _rows(count: int) -> list[SimpleNamespace]:
+    created_at = datetime(2026, 10, 5, 12, 0)
+    return [
+        SimpleNamespace(date=date(2026, 10, 5), created_at=created_at - timedelta(minutes=i), id=uuid4())
+        for i in range(count)
+    ]
+
+
+def test_last_page_detected_with_limit_plus_one(monkeypatch):
+    rows = _rows(3)
+    (transactions, next_cursor), calls = _page(monkeypatch, rows, 3)
+    assert transactions == rows
+    assert next_cursor is None
+    assert calls[0][3] == 4
+
+
+def test_next_cursor_points_at_last_row_and_keeps_filters(monkeypatch):
+    rows = _rows(4)
+    (transactions, next_cursor), _ = _page(
+        monkeypatch, rows, 3, transaction_type=TransactionType.INCOME, end_date=date(2026, 10, 31)
+    )
+    assert transactions == rows[:3]
+    assert TransactionService.decode_cursor(next_cursor) == TransactionCursor(
+        after=TransactionPosition(rows[2].date, rows[2].created_at, rows[2].id),
+        transaction_type=TransactionType.INCOME,
+        start_date=None,
+        end_date=date(2026, 10, 31),
+    )
+
+
+def test_cursor_filters_are_applied(monkeypatch):
+    cursor = TransactionService.encode_cursor(CURSOR)
+    # 커서와 같은 조건은 함께 보내도 됨
+    _, calls = _page(monkeypatch, [], 3, cursor=cursor, transaction_type=TransactionType.EXPENSE)
+    assert calls == [(TransactionType.EXPENSE, date(2026, 10, 1), None, 4, CURSOR.after)]
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        {"transaction_type": TransactionType.INCOME},
+        {"start_date": date(2026, 9, 1)},
+        {"end_date": date(2026, 10, 31)},
+    ],
+)
+def test_filters_contradicting_cursor_are_rejected(monkeypatch, filters):
+    cursor = TransactionService.encode_cursor(CURSOR)
+    with pytest.raises(ValueError, match="커서와 조회 조건이 일치하지 않습니다."):
+        _page(monkeypatch, [], 3, cursor=cursor, **filters)
@@ -0,0 +1,32 @@
+"""메모 검색어 → tsquery 변환 테스트 (DB 불필요)"""
+import pytest
+
+from app.services.transaction_service import MAX_SEARCH_TERMS, TransactionService
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("점심", "'점심':*"),
+        ("점심 스타벅", "'점심':* & '스타벅':*"),
+        ("  Coffee,점심!! ", "'coffee':* & '점심':*"),
+        # tsquery 연산자와 따옴표는 단어를 나누는 구분자로만 쓰임
+        ("a&b | !c 'd' (e):*", "'a':* & 'b':* & 'c':* & 'd':* & 'e':*"),
+        ("snake_case", "'snake':* & 'case':*"),
+        ("2026년 10월", "'2026년':* & '10월':*"),
+    ],
+)
+def test_build_search_query(text, expected):
+    assert TransactionService.build_search_query(text) == expected
+
+
+def test_build_search_query_caps_terms():
+    words = [f"w{i}" for i in range(MAX_SEARCH_TERMS + 3)]
+    query = TransactionService.build_search_query(" ".join(words))
+    assert query == " & ".join(f"'{word}':*" for word in words[:MAX_SEARCH_TERMS])
+
+
+@pytest.mark.parametrize("text", ["", "   ", "!@#&|", "___"])
+def test_build_search_query_without_terms(text):
+    with pytest.raises(ValueError, match="검색어를 입력하세요."):
+        TransactionService.build_search_query(text)